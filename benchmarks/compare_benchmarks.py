@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Compares two result files of ``benchmarks/run_benchmarks.py``, e.g., for two different commits.
+
+Usage: python3 benchmarks/compare_benchmarks.py BASELINE CURRENT [--threshold RATIO]
+
+For every benchmark that appears in both files, the ratio of the current and the baseline minimum times is printed.
+The script exits with status 1 if any of the ratios exceeds the threshold, which allows for using it in CI.
+"""
+
+
+import argparse
+import json
+import sys
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2018 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2018.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+def load_results(path: str) -> dict:
+    """Loads a result file, and maps the name and params of every benchmark to its minimum time."""
+    with open(path) as f:
+        report = json.load(f)
+    return {(r["name"], json.dumps(r["params"], sort_keys=True)): r["min"] for r in report["results"]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("baseline", help="the result file of the baseline")
+    parser.add_argument("current", help="the result file to compare with the baseline")
+    parser.add_argument(
+            "--threshold",
+            type=float,
+            default=1.1,
+            help="the ratio of current and baseline time above which a benchmark is considered a regression"
+    )
+    args = parser.parse_args()
+    
+    baseline = load_results(args.baseline)
+    current = load_results(args.current)
+    
+    regressions = 0
+    for key in sorted(baseline.keys() & current.keys()):
+        ratio = current[key] / baseline[key]
+        flag = ""
+        if ratio > args.threshold:
+            flag = "  <-- regression"
+            regressions += 1
+        print("{:>16} {:<40} {:>10.3f} ms -> {:>10.3f} ms  ({:.2f}x){}".format(
+                key[0],
+                key[1],
+                1000 * baseline[key],
+                1000 * current[key],
+                ratio,
+                flag
+        ))
+    for key in sorted(baseline.keys() ^ current.keys()):
+        print("{:>16} {:<40} only in {}".format(key[0], key[1], "baseline" if key in baseline else "current"))
+    
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""A stand-in for DLV that prints synthetic answer sets, which allows for reproducible benchmarks without DLV.
+
+Like DLV, the script reads all of its input (which is ignored otherwise) before it prints anything. Apart from
+``-n=<K>``, all options are ignored. The output is configured by means of the following environment variables:
+
+* ``FAKE_DLV_MODELS``: the number of answer sets to print (default: 1),
+* ``FAKE_DLV_ATOMS``: the number of atoms per answer set (default: 10), and
+* ``FAKE_DLV_LATENCY``: the number of seconds to wait before printing anything (default: 0).
+
+About half of the atoms appear in every answer set, as is typical for answer sets of the same program.
+"""
+
+
+import os
+import sys
+import time
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2018 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2018.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+def main():
+    num_models = int(os.environ.get("FAKE_DLV_MODELS", 1))
+    num_atoms = int(os.environ.get("FAKE_DLV_ATOMS", 10))
+    latency = float(os.environ.get("FAKE_DLV_LATENCY", 0))
+    for arg in sys.argv[1:]:
+        if arg.startswith("-n="):
+            num_models = min(num_models, int(arg[3:]))
+    
+    # DLV reads all of its input first
+    sys.stdin.buffer.read()
+    if latency > 0:
+        time.sleep(latency)
+    
+    out = sys.stdout
+    for m in range(num_models):
+        atoms = []
+        for a in range(num_atoms):
+            if a % 2 == 0:
+                atoms.append("person(p{})".format(a))
+            else:
+                atoms.append("{}knows(p{},p{})".format("-" if (a + m) % 3 == 0 else "", a, m))
+        out.write("{" + ", ".join(atoms) + "}\n")
+    out.flush()
+
+
+if __name__ == "__main__":
+    main()
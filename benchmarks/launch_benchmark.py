@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Measures the per-call overhead of launching DLV through a shell compared with executing it directly.
+
+Usage: python3 benchmarks/launch_benchmark.py [--dlv PATH] [--calls N] [--repeat N]
+
+By default, ``true`` is used in place of DLV, such that the measurement covers the launch overhead only.
+"""
+
+
+import argparse
+import shutil
+import subprocess
+import timeit
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2018 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2018.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+INPUT = b"person(patrick).\n"
+"""bytes: The input that is passed to the executable via stdin."""
+
+
+def launch_shell(dlv_path: str) -> bytes:
+    """Launches DLV the way that it has been done previously, i.e., via ``/bin/sh``."""
+    return subprocess.check_output("{} --silent --".format(dlv_path), shell=True, input=INPUT)
+
+
+def launch_direct(dlv_path: str) -> bytes:
+    """Launches DLV the way that :class:`aspwrapper.DlvSolver` does, i.e., by executing it with an argv list."""
+    return subprocess.check_output([dlv_path, "--silent", "--"], input=INPUT)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--dlv", default=shutil.which("true"), help="the executable to launch")
+    parser.add_argument("--calls", type=int, default=200, help="the number of launches per repetition")
+    parser.add_argument("--repeat", type=int, default=5, help="the number of repetitions")
+    args = parser.parse_args()
+    
+    print("launching '{}' {} times".format(args.dlv, args.calls))
+    results = {}
+    for name, fn in [("shell", launch_shell), ("direct", launch_direct)]:
+        seconds = min(timeit.repeat(lambda: fn(args.dlv), number=args.calls, repeat=args.repeat))
+        results[name] = 1000 * seconds / args.calls
+        print("{:>12}: {:>8.3f} ms/call".format(name, results[name]))
+    print("{:>12}: {:>8.3f} ms/call".format("saved", results["shell"] - results["direct"]))
+
+
+if __name__ == "__main__":
+    main()
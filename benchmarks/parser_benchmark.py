@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Compares the throughput of :mod:`aspwrapper.dlv_parser` with the regex-based parsing that was used previously.
+
+Usage: python3 benchmarks/parser_benchmark.py [--models N] [--atoms N] [--repeat N]
+"""
+
+
+import argparse
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src", "main", "python"))
+
+from aspwrapper import dlv_parser
+from aspwrapper import literal
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2018 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2018.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+LEGACY_LITERAL_PATTERN = r"^(?P<sign>[-~]?)(?P<predicate>.+)\((?P<terms>.+)\)$"
+"""str: The pattern that has been used for parsing atoms previously."""
+
+
+def create_output(num_models: int, num_atoms: int) -> str:
+    """Creates synthetic DLV output with the specified number of answer sets and atoms per answer set.
+    
+    About half of the atoms appear in every answer set, as is typical for answer sets of the same program.
+    """
+    lines = []
+    for m in range(num_models):
+        atoms = []
+        for a in range(num_atoms):
+            if a % 2 == 0:
+                atoms.append("person(p{})".format(a))
+            else:
+                atoms.append("{}knows(p{},p{})".format("-" if (a + m) % 3 == 0 else "", a, m))
+        lines.append("{" + ", ".join(atoms) + "}")
+    return "\n".join(lines) + "\n"
+
+
+def parse_legacy(output: str) -> list:
+    """Parses DLV output the way that it has been done previously, i.e., with an uncompiled regex for every atom."""
+    result = [r.strip()[1:-1] for r in output.strip().split("\n")]
+    models = []
+    for r in result:
+        lits = set()
+        if r != "":
+            for x in r.split(", "):
+                m = re.match(LEGACY_LITERAL_PATTERN, x)
+                lits.add(literal.Literal(
+                        m.group("predicate"),
+                        m.group("terms").split(","),
+                        positive=m.group("sign") == ""
+                ))
+        models.append(lits)
+    return models
+
+
+def parse_current(output: str) -> list:
+    """Parses DLV output by means of :mod:`aspwrapper.dlv_parser`."""
+    return [set(m) for m in dlv_parser.parse_models(output.splitlines())]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--models", type=int, default=200, help="the number of answer sets")
+    parser.add_argument("--atoms", type=int, default=500, help="the number of atoms per answer set")
+    parser.add_argument("--repeat", type=int, default=5, help="the number of repetitions")
+    args = parser.parse_args()
+    
+    output = create_output(args.models, args.atoms)
+    assert parse_legacy(output) == parse_current(output)
+    total_atoms = args.models * args.atoms
+    
+    print("parsing {} answer sets with {} atoms each".format(args.models, args.atoms))
+    results = {}
+    for name, fn in [("legacy", parse_legacy), ("dlv_parser", parse_current)]:
+        seconds = min(timeit.repeat(lambda: fn(output), number=1, repeat=args.repeat))
+        results[name] = total_atoms / seconds
+        print("{:>12}: {:>12,.0f} atoms/sec".format(name, results[name]))
+    print("{:>12}: {:.2f}x".format("speedup", results["dlv_parser"] / results["legacy"]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Runs the benchmark suite of aspwrapper, and writes the results as JSON.
+
+Usage: python3 benchmarks/run_benchmarks.py [--output FILE] [--repeat N] [--quick] [--only NAME]
+
+The suite measures running :class:`aspwrapper.DlvSolver` end to end (against ``benchmarks/fake_dlv.py`` rather than
+DLV, such that results are reproducible), parsing DLV's output, creating and hashing literals, creating answer sets,
+and encoding and decoding answer sets, each at several scales. The results of two runs, e.g., for different commits,
+can be compared by means of ``benchmarks/compare_benchmarks.py``.
+"""
+
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import timeit
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCHMARKS_DIR, "..", "src", "main", "python"))
+
+from aspwrapper import answer_set
+from aspwrapper import dlv_parser
+from aspwrapper import dlv_solver
+from aspwrapper import literal
+from aspwrapper import serialization
+
+import parser_benchmark
+import serialization_benchmark
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2018 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2018.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+FAKE_DLV_PATH = os.path.join(BENCHMARKS_DIR, "fake_dlv.py")
+"""str: The path of the DLV stand-in."""
+
+
+def create_literals(num: int) -> list:
+    """Creates the specified number of distinct literals."""
+    return [literal.Literal("knows", ["p{}".format(i), "p{}".format(i % 97)], positive=i % 3 != 0) for i in range(num)]
+
+
+def bench_literal_hash(num: int):
+    """Creates literals and puts them into a set, which covers both the creation and hashing of literals."""
+    terms = [("p{}".format(i), "p{}".format(i % 97)) for i in range(num)]
+    return lambda: {literal.Literal("knows", t) for t in terms}
+
+
+def bench_answer_set_init(num: int):
+    """Creates an answer set from lists of facts and inferences, which includes checking all of them."""
+    facts = create_literals(num)
+    inferences = create_literals(num)[:num // 10]
+    return lambda: answer_set.AnswerSet(facts, inferences)
+
+
+def bench_dumps(num_models: int, num_atoms: int):
+    """Encodes synthetic answer sets by means of the compact binary encoding."""
+    answer_sets = serialization_benchmark.create_answer_sets(num_models, num_atoms)
+    return lambda: serialization.dumps(answer_sets)
+
+
+def bench_loads(num_models: int, num_atoms: int):
+    """Decodes synthetic answer sets from the compact binary encoding."""
+    data = serialization.dumps(serialization_benchmark.create_answer_sets(num_models, num_atoms))
+    return lambda: serialization.loads(data)
+
+
+def bench_parse(num_models: int, num_atoms: int):
+    """Parses synthetic output of DLV."""
+    lines = parser_benchmark.create_output(num_models, num_atoms).splitlines()
+    return lambda: list(dlv_parser.parse_models(lines))
+
+
+def bench_run(num_models: int, num_atoms: int, num_facts: int, program_path: str):
+    """Runs the solver end to end, i.e., creating the input, launching (fake) DLV, and parsing its output."""
+    solver = dlv_solver.DlvSolver(FAKE_DLV_PATH)
+    facts = create_literals(num_facts)
+    env = {"FAKE_DLV_MODELS": str(num_models), "FAKE_DLV_ATOMS": str(num_atoms)}
+    
+    def run():
+        os.environ.update(env)
+        return solver.run(program_path, facts)
+    
+    return run
+
+
+def git_commit() -> str:
+    """Determines the commit that the benchmarks are run for, if any."""
+    try:
+        return subprocess.check_output(
+                ["git", "rev-parse", "HEAD"],
+                cwd=BENCHMARKS_DIR,
+                stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--output", default=None, help="the file to write the results to (default: stdout)")
+    parser.add_argument("--repeat", type=int, default=5, help="the number of repetitions of every measurement")
+    parser.add_argument("--quick", action="store_true", help="run the smaller scales only")
+    parser.add_argument("--only", default=None, help="run only benchmarks whose names contain this string")
+    args = parser.parse_args()
+    
+    # the scales of the benchmarks, i.e., numbers of literals, (models, atoms), and (models, atoms, facts)
+    scales = [1000, 10000]
+    parse_scales = [(10, 100), (100, 1000)]
+    run_scales = [(1, 10, 10), (10, 1000, 1000)]
+    if not args.quick:
+        scales.append(100000)
+        parse_scales.append((1000, 1000))
+        run_scales.append((100, 1000, 10000))
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        program_path = os.path.join(tmp_dir, "program.asp")
+        with open(program_path, "w") as f:
+            f.write("person(X) :- knows(X, Y) .\n")
+        
+        # assemble all benchmarks as (name, params, function to measure)
+        benchmarks = []
+        for num in scales:
+            benchmarks.append(("literal_hash", {"literals": num}, bench_literal_hash(num)))
+            benchmarks.append(("answer_set_init", {"facts": num}, bench_answer_set_init(num)))
+        for num_models, num_atoms in parse_scales:
+            benchmarks.append(("parse", {"models": num_models, "atoms": num_atoms}, bench_parse(num_models, num_atoms)))
+            benchmarks.append(("dumps", {"models": num_models, "atoms": num_atoms}, bench_dumps(num_models, num_atoms)))
+            benchmarks.append(("loads", {"models": num_models, "atoms": num_atoms}, bench_loads(num_models, num_atoms)))
+        for num_models, num_atoms, num_facts in run_scales:
+            benchmarks.append((
+                    "run",
+                    {"models": num_models, "atoms": num_atoms, "facts": num_facts},
+                    bench_run(num_models, num_atoms, num_facts, program_path)
+            ))
+        
+        # run all benchmarks
+        results = []
+        for name, params, fn in benchmarks:
+            if args.only is not None and args.only not in name:
+                continue
+            fn()  # warm up
+            times = timeit.repeat(fn, number=1, repeat=args.repeat)
+            results.append({
+                    "name": name,
+                    "params": params,
+                    "min": min(times),
+                    "median": statistics.median(times),
+                    "repeat": args.repeat
+            })
+            print(
+                    "{:>16} {:<40} {:>10.3f} ms".format(name, json.dumps(params, sort_keys=True), 1000 * min(times)),
+                    file=sys.stderr
+            )
+    
+    report = {
+            "meta": {
+                    "commit": git_commit(),
+                    "date": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+                    "machine": platform.machine(),
+                    "platform": platform.platform(),
+                    "python": platform.python_version()
+            },
+            "results": results
+    }
+    
+    if args.output is None:
+        json.dump(report, sys.stdout, indent=2, sort_keys=True)
+        print()
+    else:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+
+
+if __name__ == "__main__":
+    main()
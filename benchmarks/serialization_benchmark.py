@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Compares the size and speed of :mod:`aspwrapper.serialization` with pickling answer sets.
+
+Usage: python3 benchmarks/serialization_benchmark.py [--models N] [--atoms N] [--repeat N]
+"""
+
+
+import argparse
+import os
+import pickle
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src", "main", "python"))
+
+from aspwrapper import answer_set
+from aspwrapper import dlv_parser
+from aspwrapper import literal
+from aspwrapper import serialization
+
+import parser_benchmark
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2018 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2018.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+def create_answer_sets(num_models: int, num_atoms: int) -> list:
+    """Creates synthetic answer sets, which share a set of facts, by parsing synthetic output of DLV.
+    
+    Args:
+        num_models (int): The number of answer sets to create.
+        num_atoms (int): The number of atoms per answer set.
+    
+    Returns:
+        list[:class:`aspwrapper.answer_set.AnswerSet`]: The created answer sets.
+    """
+    facts = frozenset(literal.Literal("person", ["p{}".format(a)]) for a in range(0, num_atoms, 2))
+    models = dlv_parser.parse_models(parser_benchmark.create_output(num_models, num_atoms).splitlines())
+    return [answer_set.AnswerSet._create(facts, frozenset(lit for lit in m if lit not in facts)) for m in models]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--models", type=int, default=200, help="the number of answer sets")
+    parser.add_argument("--atoms", type=int, default=1000, help="the number of atoms per answer set")
+    parser.add_argument("--repeat", type=int, default=5, help="the number of repetitions")
+    args = parser.parse_args()
+    
+    answer_sets = create_answer_sets(args.models, args.atoms)
+    codecs = [
+            ("pickle", lambda: pickle.dumps(answer_sets, pickle.HIGHEST_PROTOCOL), pickle.loads),
+            ("compact", lambda: serialization.dumps(answer_sets), serialization.loads)
+    ]
+    
+    print("encoding {} answer sets with {} atoms each".format(args.models, args.atoms))
+    print("{:>12} {:>12} {:>12} {:>12}".format("", "bytes", "dumps (ms)", "loads (ms)"))
+    for name, dumps, loads in codecs:
+        data = dumps()
+        assert loads(data) == answer_sets
+        dumps_seconds = min(timeit.repeat(dumps, number=1, repeat=args.repeat))
+        loads_seconds = min(timeit.repeat(lambda: loads(data), number=1, repeat=args.repeat))
+        print("{:>12} {:>12,} {:>12.1f} {:>12.1f}".format(name, len(data), 1000 * dumps_seconds, 1000 * loads_seconds))
+
+
+if __name__ == "__main__":
+    main()
@@ -50,6 +50,10 @@ setup(
         ],
         description="A wrapper for accessing ASP solvers from Python.",
         download_url="https://github.com/phohenecker/asp-wrapper/archive/v2018.1.tar.gz",
+        extras_require={
+                "clingo": ["clingo"],
+                "numpy": ["numpy"]
+        },
         install_requires=[
                 "insanity>=2017.1"
         ],
@@ -58,7 +62,7 @@ setup(
         name="aspwrapper",
         package_dir={"": "src/main/python"},
         packages=["aspwrapper"],
-        python_requires=">=3",
+        python_requires=">=3.7",
         url="https://github.com/phohenecker/asp-wrapper",
         version="2018.1"
 )
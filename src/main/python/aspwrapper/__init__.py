@@ -4,8 +4,21 @@
 
 
 from aspwrapper.answer_set import AnswerSet
+from aspwrapper.answer_set_collection import AnswerSetCollection
+from aspwrapper.answer_set_product import AnswerSetProduct
+from aspwrapper.clingo_session import ClingoSession
+from aspwrapper.clingo_solver import ClingoSolver
 from aspwrapper.dlv_solver import DlvSolver
+from aspwrapper.dlv_solver_pool import DlvSolverPool
+from aspwrapper.histogram_collector import HistogramCollector
+from aspwrapper.lazy_solver_result import LazySolverResult
 from aspwrapper.literal import Literal
+from aspwrapper.program import Program
+from aspwrapper.result_cache import ResultCache
+from aspwrapper.solver_result import ResourceUsage
+from aspwrapper.solver_result import SolverResult
+from aspwrapper.solver_session import SolverSession
+from aspwrapper.sqlite_result_cache import SqliteResultCache
 
 
 __author__ = "Patrick Hohenecker"
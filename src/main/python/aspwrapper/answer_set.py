@@ -1,13 +1,14 @@
 # -*- coding: utf-8 -*-
 
 
-import collections
+import collections.abc
 import itertools
 import typing
 
 import insanity
 
 from aspwrapper import literal
+from aspwrapper import serialization
 
 
 __author__ = "Patrick Hohenecker"
@@ -41,7 +42,18 @@ __status__ = "Development"
 
 
 class AnswerSet(object):
-    """Instances of this class represent single answer sets."""
+    """Instances of this class represent single answer sets.
+    
+    Answer sets are immutable, and store both their facts and their inferences as ``frozenset``s. If the same
+    ``frozenset`` of facts is provided for multiple answer sets, which is the case for all of the answer sets computed
+    for the same facts, then it is shared rather than copied. Therefore, the memory used by a collection of answer sets
+    depends on the number of inferences rather than on the number of facts times the number of answer sets.
+    
+    To look up literals by their predicates efficiently, an index over all literals, keyed by predicate, arity, and
+    sign, is built on the first query of this kind, and an index by first term is added when it is needed first.
+    """
+    
+    __slots__ = ("_facts", "_index", "_inferences", "_term_index")
     
     def __init__(self, facts: typing.Iterable[literal.Literal], inferences: typing.Iterable[literal.Literal]):
         """Creates a new instance of ``AnswerSet``.
@@ -55,16 +67,43 @@ class AnswerSet(object):
                 :class:`literal.Literal`.
         """
         # sanitize args
-        insanity.sanitize_type("facts", facts, collections.Iterable)
-        facts = set(facts)
-        insanity.sanitize_iterable("facts", facts, elements_type=literal.Literal)
-        insanity.sanitize_type("inferences", inferences, collections.Iterable)
-        inferences = set(inferences)
-        insanity.sanitize_iterable("inferences", inferences, elements_type=literal.Literal)
+        insanity.sanitize_type("facts", facts, collections.abc.Iterable)
+        facts = frozenset(facts)
+        literal.sanitize_literals("facts", facts)
+        insanity.sanitize_type("inferences", inferences, collections.abc.Iterable)
+        inferences = frozenset(inferences)
+        literal.sanitize_literals("inferences", inferences)
         
         # define attributes
         self._facts = facts
+        self._index = None
         self._inferences = inferences
+        self._term_index = None
+    
+    @classmethod
+    def _create(
+            cls,
+            facts: typing.FrozenSet[literal.Literal],
+            inferences: typing.FrozenSet[literal.Literal]
+    ) -> "AnswerSet":
+        """Creates a new instance of ``AnswerSet`` from arguments that are known to be legal.
+        
+        In contrast to the constructor, this method neither checks nor copies the provided sets, which is used for
+        creating answer sets from trusted sources, e.g., the output of a solver.
+        
+        Args:
+            facts (frozenset[:class:`literal.Literal`]): The facts contained in the answer set.
+            inferences (frozenset[:class:`literal.Literal`]): The inferences contained in the answer set.
+        
+        Returns:
+            :class:`AnswerSet`: The created answer set.
+        """
+        ans = cls.__new__(cls)
+        ans._facts = facts
+        ans._index = None
+        ans._inferences = inferences
+        ans._term_index = None
+        return ans
     
     #  MAGIC FUNCTIONS  ################################################################################################
     
@@ -75,9 +114,15 @@ class AnswerSet(object):
                 other.inferences == self._inferences
         )
     
+    def __hash__(self) -> int:
+        return hash((self._facts, self._inferences))
+    
     def __iter__(self) -> typing.Iterator[literal.Literal]:
         return itertools.chain(self._facts, self._inferences)
     
+    def __reduce__(self):
+        return AnswerSet._create, (self._facts, self._inferences)
+    
     def __str__(self) -> str:
         return "AnswerSet(\n\tfacts      = {{ {} }},\n\tinferences = {{ {} }}\n)".format(
                 ", ".join((str(f) for f in self._facts)),
@@ -87,11 +132,147 @@ class AnswerSet(object):
     #  PROPERTIES  #####################################################################################################
     
     @property
-    def facts(self) -> typing.Set[literal.Literal]:
-        """set[:class:`literal.Literal`]: The facts contained in the answer set."""
+    def facts(self) -> typing.FrozenSet[literal.Literal]:
+        """frozenset[:class:`literal.Literal`]: The facts contained in the answer set."""
         return self._facts
     
     @property
-    def inferences(self) -> typing.Set[literal.Literal]:
-        """set[:class:`literal.Literal`]: The inferences contained in the answer set."""
+    def inferences(self) -> typing.FrozenSet[literal.Literal]:
+        """frozenset[:class:`literal.Literal`]: The inferences contained in the answer set."""
         return self._inferences
+    
+    #  METHODS  ########################################################################################################
+    
+    @classmethod
+    def from_bytes(cls, data: typing.Union[bytes, bytearray, memoryview]) -> "AnswerSet":
+        """Decodes an answer set that has been encoded by means of :meth:`to_bytes`.
+        
+        Args:
+            data (bytes-like): The encoded answer set, e.g., ``bytes``, a ``memoryview``, or an ``mmap``.
+        
+        Returns:
+            :class:`AnswerSet`: The decoded answer set.
+        
+        Raises:
+            ValueError: If ``data`` is not a valid encoding of exactly one answer set.
+        """
+        answer_sets = serialization.loads(data)
+        if len(answer_sets) != 1:
+            raise ValueError("The provided data encodes {} answer sets rather than one!".format(len(answer_sets)))
+        
+        return answer_sets[0]
+    
+    def _get_index(self, by_first_term: bool) -> dict:
+        """Provides the index of all literals, and builds it, if necessary.
+        
+        The index maps either a predicate or a pair of predicate and first term to a ``dict`` that maps pairs of arity
+        and sign to a tuple of all according literals.
+        
+        Args:
+            by_first_term (bool): Indicates whether to provide the index that is keyed by the first terms as well.
+        
+        Returns:
+            dict: The requested index.
+        """
+        index = self._term_index if by_first_term else self._index
+        if index is None:
+            
+            # group all literals by key and signature (a literal might be both a fact and an inference)
+            groups = {}
+            for lit in itertools.chain(self._facts, (i for i in self._inferences if i not in self._facts)):
+                if by_first_term:
+                    if not lit.terms:
+                        continue
+                    key = (lit.predicate, lit.terms[0])
+                else:
+                    key = lit.predicate
+                groups.setdefault(key, {}).setdefault((len(lit.terms), lit.positive), []).append(lit)
+            
+            index = {key: {sig: tuple(lits) for sig, lits in sigs.items()} for key, sigs in groups.items()}
+            if by_first_term:
+                self._term_index = index
+            else:
+                self._index = index
+        
+        return index
+    
+    def by_predicate(
+            self,
+            predicate: str,
+            arity: int = None,
+            positive: bool = None,
+            first_term: str = None
+    ) -> typing.Tuple[literal.Literal, ...]:
+        """Retrieves all literals, both facts and inferences, with the provided predicate.
+        
+        The lookup makes use of an index, and thus takes time proportional to the number of retrieved literals rather
+        than the size of the answer set.
+        
+        Args:
+            predicate (str): The predicate symbol to look up.
+            arity (int, optional): If provided, then only literals with this number of terms are retrieved.
+            positive (bool, optional): If provided, then only literals with this sign are retrieved.
+            first_term (str, optional): If provided, then only literals with this first term are retrieved.
+        
+        Returns:
+            tuple[:class:`literal.Literal`]: The retrieved literals.
+        """
+        if first_term is None:
+            sigs = self._get_index(False).get(predicate)
+        else:
+            sigs = self._get_index(True).get((predicate, first_term))
+        if sigs is None:
+            return ()
+        
+        # in the most common case, the signature is specified completely
+        if arity is not None and positive is not None:
+            return sigs.get((arity, positive), ())
+        
+        return tuple(
+                itertools.chain.from_iterable(
+                        lits
+                        for (a, p), lits in sigs.items()
+                        if (arity is None or a == arity) and (positive is None or p == positive)
+                )
+        )
+    
+    def holds(self, lit: literal.Literal) -> bool:
+        """Checks whether the provided literal is contained in the answer set, either as fact or as inference.
+        
+        Args:
+            lit (:class:`literal.Literal`): The literal to check.
+        
+        Returns:
+            bool: ``True``, if ``lit`` is contained in the answer set, and ``False`` otherwise.
+        """
+        return lit in self._inferences or lit in self._facts
+    
+    def project(self, predicates: typing.Iterable[str]) -> "AnswerSet":
+        """Creates an answer set that consists of only those literals that have one of the provided predicates.
+        
+        Args:
+            predicates (iterable[str]): The predicate symbols to retain.
+        
+        Returns:
+            :class:`AnswerSet`: The projected answer set, which distinguishes facts and inferences just like the
+                original one does.
+        """
+        facts = []
+        inferences = []
+        for predicate in set(predicates):
+            for lit in self.by_predicate(predicate):
+                # a literal may be both a fact and an inference, and is thus retained as either one of them
+                if lit in self._facts:
+                    facts.append(lit)
+                if lit in self._inferences:
+                    inferences.append(lit)
+        
+        return AnswerSet._create(frozenset(facts), frozenset(inferences))
+    
+    def to_bytes(self) -> bytes:
+        """Encodes the answer set by means of the compact binary encoding implemented by :mod:`serialization`.
+        
+        Returns:
+            bytes: The encoded answer set.
+        """
+        return serialization.dumps([self])
@@ -0,0 +1,294 @@
+# -*- coding: utf-8 -*-
+
+
+import collections
+import collections.abc
+import typing
+
+import insanity
+
+from aspwrapper import answer_set
+from aspwrapper import literal
+
+try:
+    import numpy as np
+except ImportError:  # numpy is an optional dependency, which is needed by this module only
+    np = None
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2018 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2018.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class AnswerSetCollection(collections.abc.Sequence):
+    """A sequence of answer sets that is stored in a columnar format, and supports vectorized analyses.
+    
+    Every distinct inference is assigned an integer ID, and the inferences of all answer sets are stored as a boolean
+    matrix with one row per answer set and one column per ID. Facts are stored separately, as every distinct set of
+    facts is stored only once together with the index of the set of facts of each answer set. This allows for
+    computing, e.g., brave and cautious consequences or the frequencies of atoms by means of vectorized operations.
+    
+    Answer sets are created only if they are accessed. Indexing with a slice, a list of indices, or a boolean mask
+    provides a new collection, which shares the symbol table with the original one. This class requires NumPy.
+    """
+    
+    #  CONSTRUCTOR  ####################################################################################################
+    
+    def __init__(self, answer_sets: typing.Iterable[answer_set.AnswerSet]):
+        """Creates a new instance of ``AnswerSetCollection``.
+        
+        Args:
+            answer_sets (iterable[:class:`answer_set.AnswerSet`]): The answer sets to store.
+        
+        Raises:
+            ImportError: If NumPy is not installed.
+            TypeError: If ``answer_sets`` is not an ``Iterable`` of instances of :class:`answer_set.AnswerSet`.
+        """
+        if np is None:
+            raise ImportError("AnswerSetCollection requires NumPy, which is not installed!")
+        
+        # sanitize args
+        insanity.sanitize_type("answer_sets", answer_sets, collections.abc.Iterable)
+        answer_sets = list(answer_sets)
+        insanity.sanitize_iterable("answer_sets", answer_sets, elements_type=answer_set.AnswerSet)
+        
+        # assign IDs to all inferences and sets of facts, and collect the positions of all true entries in the matrix
+        atom_ids = {}
+        fact_set_ids = {}
+        fact_set_idx = np.empty(len(answer_sets), dtype=np.intp)
+        rows = []
+        cols = []
+        for row, a in enumerate(answer_sets):
+            fact_set_idx[row] = fact_set_ids.setdefault(a.facts, len(fact_set_ids))
+            for lit in a.inferences:
+                cols.append(atom_ids.setdefault(lit, len(atom_ids)))
+            rows.append(len(a.inferences))
+        
+        matrix = np.zeros((len(answer_sets), len(atom_ids)), dtype=np.bool_)
+        matrix[np.repeat(np.arange(len(answer_sets)), rows), np.asarray(cols, dtype=np.intp)] = True
+        
+        self._init(tuple(atom_ids), tuple(fact_set_ids), fact_set_idx, matrix)
+    
+    def _init(
+            self,
+            atoms: typing.Tuple[literal.Literal, ...],
+            fact_sets: typing.Tuple[typing.FrozenSet[literal.Literal], ...],
+            fact_set_idx: "np.ndarray",
+            matrix: "np.ndarray"
+    ) -> None:
+        """Defines the attributes of the collection.
+        
+        Args:
+            atoms (tuple[:class:`literal.Literal`]): The inferences that correspond with the columns of ``matrix``.
+            fact_sets (tuple[frozenset[:class:`literal.Literal`]]): The distinct sets of facts.
+            fact_set_idx (np.ndarray): The index of the set of facts of each answer set.
+            matrix (np.ndarray): The boolean matrix of inferences.
+        """
+        self._atom_ids = None
+        self._atoms = atoms
+        self._fact_set_idx = fact_set_idx
+        self._fact_sets = fact_sets
+        self._matrix = matrix
+        self._matrix.flags.writeable = False
+    
+    #  MAGIC FUNCTIONS  ################################################################################################
+    
+    def __getitem__(self, index):
+        # slices, lists of indices, and boolean masks select a sub-collection
+        if isinstance(index, (slice, list, np.ndarray)):
+            return self._select(np.arange(len(self))[index])
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("The provided index is out of range: {}".format(index))
+        
+        inferences = frozenset([self._atoms[i] for i in np.flatnonzero(self._matrix[index])])
+        return answer_set.AnswerSet._create(self._fact_sets[self._fact_set_idx[index]], inferences)
+    
+    def __len__(self) -> int:
+        return self._matrix.shape[0]
+    
+    def __str__(self) -> str:
+        return "AnswerSetCollection(answer sets = {}, distinct inferences = {})".format(len(self), len(self._atoms))
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def atoms(self) -> typing.Tuple[literal.Literal, ...]:
+        """tuple[:class:`literal.Literal`]: The distinct inferences, in the order of the columns of :attr:`matrix`."""
+        return self._atoms
+    
+    @property
+    def matrix(self) -> "np.ndarray":
+        """np.ndarray: A read-only boolean matrix that indicates which of the :attr:`atoms` are contained in which of
+        the answer sets, with one row per answer set.
+        """
+        return self._matrix
+    
+    #  METHODS  ########################################################################################################
+    
+    def _column(self, lit: literal.Literal) -> typing.Optional[int]:
+        """Provides the column of :attr:`matrix` that corresponds with the provided inference, or ``None``."""
+        if self._atom_ids is None:
+            self._atom_ids = {a: idx for idx, a in enumerate(self._atoms)}
+        return self._atom_ids.get(lit)
+    
+    def _contains(self, lit: literal.Literal) -> "np.ndarray":
+        """Computes a boolean vector that indicates which of the answer sets contain the provided literal."""
+        in_facts = np.array([lit in f for f in self._fact_sets], dtype=np.bool_)
+        mask = in_facts[self._fact_set_idx]
+        col = self._column(lit)
+        if col is not None:
+            mask |= self._matrix[:, col]
+        return mask
+    
+    def _select(self, rows: "np.ndarray") -> "AnswerSetCollection":
+        """Creates a new collection that consists of the answer sets at the provided row indices."""
+        coll = AnswerSetCollection.__new__(AnswerSetCollection)
+        coll._init(self._atoms, self._fact_sets, self._fact_set_idx[rows], self._matrix[rows])
+        return coll
+    
+    def brave_consequences(self) -> typing.FrozenSet[literal.Literal]:
+        """Computes the brave consequences, i.e., all literals that are contained in at least one of the answer sets.
+        
+        Returns:
+            frozenset[:class:`literal.Literal`]: The brave consequences.
+        """
+        if len(self) == 0:
+            return frozenset()
+        
+        used_fact_sets = np.unique(self._fact_set_idx)
+        consequences = set().union(*(self._fact_sets[i] for i in used_fact_sets))
+        consequences.update(self._atoms[i] for i in np.flatnonzero(self._matrix.any(axis=0)))
+        
+        return frozenset(consequences)
+    
+    def cautious_consequences(self) -> typing.FrozenSet[literal.Literal]:
+        """Computes the cautious consequences, i.e., all literals that are contained in every one of the answer sets.
+        
+        Returns:
+            frozenset[:class:`literal.Literal`]: The cautious consequences, which is empty if the collection is.
+        """
+        if len(self) == 0:
+            return frozenset()
+        
+        # compute the facts shared by all answer sets, and the inferences of all answer sets
+        used_fact_sets = [self._fact_sets[i] for i in np.unique(self._fact_set_idx)]
+        common_facts = frozenset.intersection(*used_fact_sets)
+        always = self._matrix.all(axis=0)
+        
+        # a literal that is a fact in some answer sets might be an inference in the others
+        consequences = set(common_facts)
+        consequences.update(self._atoms[i] for i in np.flatnonzero(always))
+        for lit in set().union(*used_fact_sets) - common_facts:
+            if self._contains(lit).all():
+                consequences.add(lit)
+        
+        return frozenset(consequences)
+    
+    def contains(self, lit: literal.Literal) -> "np.ndarray":
+        """Determines which of the answer sets contain the provided literal, either as fact or as inference.
+        
+        Args:
+            lit (:class:`literal.Literal`): The literal to check.
+        
+        Returns:
+            np.ndarray: A boolean vector with one element per answer set.
+        """
+        insanity.sanitize_type("lit", lit, literal.Literal)
+        return self._contains(lit)
+    
+    def filter(
+            self,
+            required: typing.Iterable[literal.Literal] = (),
+            forbidden: typing.Iterable[literal.Literal] = ()
+    ) -> "AnswerSetCollection":
+        """Selects the answer sets that contain all of the required and none of the forbidden literals.
+        
+        Args:
+            required (iterable[:class:`literal.Literal`], optional): The literals that have to be contained.
+            forbidden (iterable[:class:`literal.Literal`], optional): The literals that must not be contained.
+        
+        Returns:
+            :class:`AnswerSetCollection`: A new collection that consists of the selected answer sets.
+        """
+        mask = np.ones(len(self), dtype=np.bool_)
+        for lit in required:
+            mask &= self.contains(lit)
+        for lit in forbidden:
+            mask &= ~self.contains(lit)
+        
+        return self._select(np.flatnonzero(mask))
+    
+    def frequencies(self) -> typing.Dict[literal.Literal, int]:
+        """Counts the number of answer sets that each literal is contained in.
+        
+        Returns:
+            dict[:class:`literal.Literal`, int]: The number of answer sets that contain each of the literals that are
+                contained in any of them.
+        """
+        counts = collections.Counter()
+        
+        # count facts once per set of facts, weighted by the number of answer sets that use it
+        for idx, num in zip(*np.unique(self._fact_set_idx, return_counts=True)):
+            for lit in self._fact_sets[idx]:
+                counts[lit] += int(num)
+        
+        # count inferences column-wise
+        for idx, num in enumerate(self._matrix.sum(axis=0).tolist()):
+            if num > 0:
+                counts[self._atoms[idx]] += num
+        
+        return dict(counts)
+    
+    def predicate_counts(self) -> typing.Dict[str, "np.ndarray"]:
+        """Counts the literals of each predicate in each of the answer sets.
+        
+        Returns:
+            dict[str, np.ndarray]: Maps every predicate symbol to a vector that specifies the number of literals with
+                this predicate in each of the answer sets.
+        """
+        counts = {}
+        
+        # count inferences by summing up the according columns
+        columns = collections.defaultdict(list)
+        for idx, a in enumerate(self._atoms):
+            columns[a.predicate].append(idx)
+        for predicate, cols in columns.items():
+            counts[predicate] = self._matrix[:, cols].sum(axis=1)
+        
+        # add facts per set of facts
+        for idx, facts in enumerate(self._fact_sets):
+            rows = self._fact_set_idx == idx
+            for predicate, num in collections.Counter(f.predicate for f in facts).items():
+                if predicate not in counts:
+                    counts[predicate] = np.zeros(len(self), dtype=np.intp)
+                counts[predicate][rows] += num
+        
+        return counts
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+
+
+import collections.abc
+import itertools
+import typing
+
+from aspwrapper import answer_set
+from aspwrapper import solver_result
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2018 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2018.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class AnswerSetProduct(collections.abc.Sequence):
+    """A sequence of answer sets that is the cross product of the answer sets of independent parts of a problem.
+    
+    If a set of facts consists of several components that do not affect each other, then every answer set for all of
+    the facts is the union of one answer set for each of the components. An ``AnswerSetProduct`` stores the answer
+    sets of the components only, and combines them on access. Therefore, neither time nor memory grow with the number
+    of combinations unless all of them are accessed.
+    
+    The combinations are ordered such that the answer sets of the last component vary fastest.
+    """
+    
+    #  CONSTRUCTOR  ####################################################################################################
+    
+    def __init__(
+            self,
+            factors: typing.Iterable[typing.Sequence[answer_set.AnswerSet]],
+            max_len: int = None
+    ):
+        """Creates a new instance of ``AnswerSetProduct``.
+        
+        Args:
+            factors (iterable[sequence[:class:`answer_set.AnswerSet`]]): The answer sets of each of the components.
+            max_len (int, optional): If provided, then only the first ``max_len`` combinations are part of the
+                sequence.
+        """
+        factors = tuple(factors)
+        length = 1
+        for f in factors:
+            length *= len(f)
+        if max_len is not None:
+            length = min(length, max_len)
+        
+        self._factors = factors
+        self._fact_sets = {}  # maps the IDs of the combined sets of facts to their union
+        self._len = length
+    
+    #  MAGIC FUNCTIONS  ################################################################################################
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._len))]
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("The provided index is out of range: {}".format(index))
+        
+        # decode the index into one index per factor, where the last factor varies fastest
+        parts = []
+        for f in reversed(self._factors):
+            index, i = divmod(index, len(f))
+            parts.append(f[i])
+        parts.reverse()
+        
+        return self._combine(parts)
+    
+    def __iter__(self) -> typing.Iterator[answer_set.AnswerSet]:
+        for parts in itertools.islice(itertools.product(*self._factors), self._len):
+            yield self._combine(parts)
+    
+    def __len__(self) -> int:
+        return self._len
+    
+    def __str__(self) -> str:
+        return "AnswerSetProduct(answer sets = {}, components = {})".format(self._len, len(self._factors))
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def factors(self) -> typing.Tuple[typing.Sequence[answer_set.AnswerSet], ...]:
+        """tuple[sequence[:class:`answer_set.AnswerSet`]]: The answer sets of each of the components."""
+        return self._factors
+    
+    @property
+    def usage(self) -> typing.Optional[solver_result.ResourceUsage]:
+        """:class:`solver_result.ResourceUsage`: The resources used for solving all of the components, i.e., the
+        longest wall time, the total CPU time, and the largest peak memory usage of any of the single runs, or ``None``
+        if none of the components reports its resource usage.
+        """
+        usages = [f.usage for f in self._factors if getattr(f, "usage", None) is not None]
+        if not usages:
+            return None
+        return solver_result.ResourceUsage(
+                max(u.wall_time for u in usages),
+                sum(u.cpu_time for u in usages),
+                max(u.max_rss for u in usages)
+        )
+    
+    #  METHODS  ########################################################################################################
+    
+    def _combine(self, parts: typing.Sequence[answer_set.AnswerSet]) -> answer_set.AnswerSet:
+        """Creates the answer set that is the union of the provided answer sets of the single components."""
+        
+        # the answer sets of a component share their facts, which is why their union is computed only once
+        key = tuple(id(p.facts) for p in parts)
+        facts = self._fact_sets.get(key)
+        if facts is None:
+            facts = frozenset().union(*(p.facts for p in parts))
+            self._fact_sets[key] = facts
+        
+        return answer_set.AnswerSet._create(facts, frozenset().union(*(p.inferences for p in parts)))
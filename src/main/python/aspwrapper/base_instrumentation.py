@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+
+import abc
+import typing
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2018 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2018.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class BaseInstrumentation(metaclass=abc.ABCMeta):
+    """An abstract base class for receivers of measurements of the single stages of solver runs.
+    
+    If an instrumentation is provided to a solver, then the solver reports the time spent in every stage of every
+    run, together with stage-specific counts, e.g., the number of bytes passed to the solver or the number of answer
+    sets parsed. :class:`dlv_solver.DlvSolver` reports the following stages:
+    
+    * ``"create_input"`` with the counts ``"facts"`` and ``"bytes"``: serializing the facts and program,
+    * ``"solve"`` with the count ``"bytes"``: running DLV, including the transfer of input and output, and
+    * ``"parse"`` with the counts ``"models"`` and ``"atoms"``: parsing the output of DLV.
+    
+    :class:`clingo_solver.ClingoSolver` reports the stages ``"create_input"`` (count ``"facts"``), ``"ground"`` (count
+    ``"atoms"``), ``"solve"`` (count ``"models"``), and ``"parse"`` (counts ``"models"`` and ``"atoms"``), where the
+    latter refers to creating literals from clingo's symbols.
+    
+    Solvers without an instrumentation do not take any measurements at all.
+    """
+    
+    @abc.abstractmethod
+    def observe(self, stage: str, seconds: float, counts: typing.Dict[str, int]) -> None:
+        """Receives the measurements of a single stage of a solver run.
+        
+        This method may be invoked from multiple threads concurrently.
+        
+        Args:
+            stage (str): The name of the stage.
+            seconds (float): The time spent in the stage.
+            counts (dict[str, int]): Stage-specific counts, e.g., of bytes or answer sets.
+        """
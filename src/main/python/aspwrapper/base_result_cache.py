@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+
+
+import abc
+import hashlib
+import typing
+
+from aspwrapper import answer_set
+from aspwrapper import literal
+from aspwrapper import program
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2018 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2018.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class BaseResultCache(metaclass=abc.ABCMeta):
+    """An abstract base class for caches of the answer sets that are computed by solvers.
+    
+    Cached results are identified by the fingerprint of the ASP program that has been run together with the set of
+    facts that has been provided to the solver and the options that the solver has been invoked with.
+    """
+    
+    #  CONSTRUCTOR  ####################################################################################################
+    
+    def __init__(self):
+        """Creates a new instance of ``BaseResultCache``."""
+        self._hits = 0
+        self._misses = 0
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def hits(self) -> int:
+        """int: The number of lookups that have been served from the cache."""
+        return self._hits
+    
+    @property
+    def misses(self) -> int:
+        """int: The number of lookups that could not be served from the cache."""
+        return self._misses
+    
+    #  METHODS  ########################################################################################################
+    
+    @staticmethod
+    def facts_digest(facts: typing.Iterable[literal.Literal], options: typing.Tuple[str, ...] = ()) -> str:
+        """Computes a canonical digest of the provided set of facts and solver options.
+        
+        In contrast to the hash of a ``frozenset``, the digest does not depend on the order of the facts or the running
+        process, and thus allows for identifying sets of facts across processes.
+        
+        Args:
+            facts (iterable[:class:`literal.Literal`]): The facts to compute the digest for.
+            options (tuple[str], optional): The options that the solver has been invoked with.
+        
+        Returns:
+            str: The computed digest as hex string.
+        """
+        digest = hashlib.sha256("\n".join(sorted(str(f) for f in facts)).encode())
+        digest.update(b"\0" + "\0".join(options).encode())
+        return digest.hexdigest()
+    
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """Removes all results from the cache, and resets the hit and miss counters."""
+    
+    @abc.abstractmethod
+    def get(
+            self,
+            prog: program.Program,
+            facts: typing.FrozenSet[literal.Literal],
+            options: typing.Tuple[str, ...] = ()
+    ) -> typing.Optional[typing.List[answer_set.AnswerSet]]:
+        """Looks up the answer sets for the provided program, facts, and solver options.
+        
+        Args:
+            prog (:class:`program.Program`): The program that has been run.
+            facts (frozenset[:class:`literal.Literal`]): The facts that have been provided to the solver.
+            options (tuple[str], optional): The options that the solver has been invoked with.
+        
+        Returns:
+            list[:class:`answer_set.AnswerSet`]: The cached answer sets, or ``None``, if there are none.
+        """
+    
+    @abc.abstractmethod
+    def invalidate(self, prog: program.Program = None) -> None:
+        """Removes all cached results for the provided program.
+        
+        Args:
+            prog (:class:`program.Program`, optional): The program to remove the results for. If this is not
+                provided, then all results are removed from the cache.
+        """
+    
+    @abc.abstractmethod
+    def put(
+            self,
+            prog: program.Program,
+            facts: typing.FrozenSet[literal.Literal],
+            answer_sets: typing.Iterable[answer_set.AnswerSet],
+            options: typing.Tuple[str, ...] = ()
+    ) -> None:
+        """Adds the answer sets for the provided program, facts, and solver options to the cache.
+        
+        Args:
+            prog (:class:`program.Program`): The program that has been run.
+            facts (frozenset[:class:`literal.Literal`]): The facts that have been provided to the solver.
+            answer_sets (iterable[:class:`answer_set.AnswerSet`]): The answer sets that have been computed.
+            options (tuple[str], optional): The options that the solver has been invoked with.
+        """
@@ -2,10 +2,24 @@
 
 
 import abc
+import asyncio
+import functools
+import numbers
+import subprocess
+import threading
 import typing
 
+from concurrent import futures
+
+import insanity
+
 from aspwrapper import answer_set
+from aspwrapper import answer_set_collection
 from aspwrapper import literal
+from aspwrapper import program
+from aspwrapper import base_instrumentation
+from aspwrapper import base_result_cache
+from aspwrapper import solver_session
 
 
 __author__ = "Patrick Hohenecker"
@@ -41,21 +55,353 @@ __status__ = "Development"
 class BaseSolver(metaclass=abc.ABCMeta):
     """An abstract base class for wrappers that provide access to ASP solvers."""
     
+    #  CONSTRUCTOR  ####################################################################################################
+    
+    def __init__(
+            self,
+            result_cache: base_result_cache.BaseResultCache = None,
+            instrumentation: base_instrumentation.BaseInstrumentation = None
+    ):
+        """Creates a new instance of ``BaseSolver``.
+        
+        Args:
+            result_cache (:class:`base_result_cache.BaseResultCache`, optional): A cache for the answer sets computed
+                by the solver. By default, results are not cached.
+            instrumentation (:class:`base_instrumentation.BaseInstrumentation`, optional): Receives measurements of
+                the single stages of solver runs. By default, no measurements are taken.
+        
+        Raises:
+            TypeError: If ``result_cache`` is not a :class:`base_result_cache.BaseResultCache` or ``instrumentation``
+                is not a :class:`base_instrumentation.BaseInstrumentation`.
+        """
+        insanity.sanitize_type("result_cache", result_cache, base_result_cache.BaseResultCache, none_allowed=True)
+        insanity.sanitize_type(
+                "instrumentation",
+                instrumentation,
+                base_instrumentation.BaseInstrumentation,
+                none_allowed=True
+        )
+        
+        self._instrumentation = instrumentation
+        self._programs = {}
+        self._programs_lock = threading.Lock()
+        self._result_cache = result_cache
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def instrumentation(self) -> typing.Optional[base_instrumentation.BaseInstrumentation]:
+        """:class:`base_instrumentation.BaseInstrumentation`: Receives measurements of the stages of solver runs."""
+        return self._instrumentation
+    
+    @property
+    def result_cache(self) -> typing.Optional[base_result_cache.BaseResultCache]:
+        """:class:`base_result_cache.BaseResultCache`: The cache for the answer sets computed by the solver."""
+        return self._result_cache
+    
+    #  METHODS  ########################################################################################################
+    
+    def _get_program(self, path) -> program.Program:
+        """Provides the program that is specified by an arg ``path`` of any of the methods that run ASP programs.
+        
+        Args:
+            path (str or :class:`program.Program`): Either the path of an ASP program or a program that has been loaded
+                already.
+        
+        Returns:
+            :class:`program.Program`: ``path``, if this is a ``Program`` already, or the program loaded from ``path``
+                otherwise.
+        
+        Raises:
+            ValueError: If ``path`` does not refer to an existing path.
+        """
+        if isinstance(path, program.Program):
+            return path
+        return self.load_program(path)
+    
+    def iter_answer_sets(
+            self,
+            path,
+            facts: typing.Iterable[literal.Literal],
+            max_models: int = None
+    ) -> typing.Iterator[answer_set.AnswerSet]:
+        """Runs the ASP program at the provided path, and provides the created answer sets one by one.
+        
+        In contrast to :meth:`run`, answer sets are provided as soon as the solver has computed them, and are not
+        collected in memory. If the returned iterator is closed before it is exhausted, then the solver is stopped.
+        Notice that results are neither looked up in nor added to the solver's result cache.
+        
+        By default, this method falls back to :meth:`run`, and subclasses should override it if the according solver
+        supports computing answer sets incrementally.
+        
+        Args:
+            path (str or :class:`program.Program`): The path of the ASP program to run, or a program that has been
+                loaded by means of :meth:`load_program`.
+            facts (iterable[:class:`literal.Literal`]): The facts to provide to the solver in addition to the ASP
+                program.
+            max_models (int, optional): The maximum number of answer sets to compute. By default, all answer sets are
+                computed.
+        
+        Returns:
+            iterator[:class:`answer_set.AnswerSet`]: The created answer sets.
+        
+        Raises:
+            CalledProcessError: If the invoked ASP solver raises any error.
+            TypeError: If ``facts`` is not an ``Iterable`` of instances of type :class:`literal.Literal`.
+            ValueError: If ``path`` does not refer to an existing path or ``max_models`` is not positive.
+        """
+        return iter(self.run(path, facts, max_models=max_models))
+    
+    def load_program(self, path: str) -> program.Program:
+        """Loads the ASP program at the provided path.
+        
+        Loaded programs are cached by the solver, and the cached program is provided as long as the according file
+        has not been changed, as indicated by its modification time and size. If the file has been changed, then all
+        results for the previous version of the program are removed from the solver's result cache. Notice that all
+        methods that run ASP programs accept programs that have been loaded by means of this method in place of a path,
+        which avoids the check for changes as well.
+        
+        Args:
+            path (str): The path of the ASP program to load.
+        
+        Returns:
+            :class:`program.Program`: The loaded program.
+        
+        Raises:
+            ValueError: If ``path`` does not refer to an existing file.
+        """
+        path = str(path)
+        with self._programs_lock:
+            prog = self._programs.get(path)
+        if prog is None or prog.is_stale():
+            
+            # results computed for an outdated version of the program are not needed anymore
+            if prog is not None and self._result_cache is not None:
+                self._result_cache.invalidate(prog)
+            
+            prog = program.Program(path)
+            with self._programs_lock:
+                self._programs[path] = prog
+        
+        return prog
+    
+    async def arun(
+            self,
+            path,
+            facts: typing.Iterable[literal.Literal],
+            timeout: numbers.Real = None,
+            max_models: int = None
+    ) -> typing.List[answer_set.AnswerSet]:
+        """An asynchronous version of :meth:`run`.
+        
+        By default, this method invokes :meth:`run` in the default executor of the running event loop. Subclasses
+        should override it with a native implementation, if possible, that also stops the solver on timeout and
+        cancellation.
+        
+        Args:
+            path (str or :class:`program.Program`): The path of the ASP program to run, or a program that has been
+                loaded by means of :meth:`load_program`.
+            facts (iterable[:class:`literal.Literal`]): The facts to provide to the solver in addition to the ASP
+                program.
+            timeout (numbers.Real, optional): The maximum number of seconds to wait for the solver to finish.
+            max_models (int, optional): The maximum number of answer sets to compute. By default, all answer sets are
+                computed.
+        
+        Returns:
+            list[:class:`answer_set.AnswerSet`]: The created answer sets.
+        
+        Raises:
+            CalledProcessError: If the invoked ASP solver raises any error.
+            TimeoutExpired: If the solver does not finish within ``timeout`` seconds.
+            TypeError: If ``facts`` is not an ``Iterable`` of instances of type :class:`literal.Literal`.
+            ValueError: If ``path`` does not refer to an existing path or ``max_models`` is not positive.
+        """
+        loop = asyncio.get_event_loop()
+        run = functools.partial(self.run, path, facts, max_models=max_models)
+        try:
+            return await asyncio.wait_for(loop.run_in_executor(None, run), timeout)
+        except asyncio.TimeoutError:
+            raise subprocess.TimeoutExpired(str(path), timeout) from None
+    
+    def is_satisfiable(self, path, facts: typing.Iterable[literal.Literal]) -> bool:
+        """Checks whether the ASP program at the provided path has any answer set for the given facts.
+        
+        The solver stops as soon as the first answer set has been found.
+        
+        Args:
+            path (str or :class:`program.Program`): The path of the ASP program to run, or a program that has been
+                loaded by means of :meth:`load_program`.
+            facts (iterable[:class:`literal.Literal`]): The facts to provide to the solver in addition to the ASP
+                program.
+        
+        Returns:
+            bool: ``True``, if there exists at least one answer set, and ``False`` otherwise.
+        
+        Raises:
+            CalledProcessError: If the invoked ASP solver raises any error.
+            TypeError: If ``facts`` is not an ``Iterable`` of instances of type :class:`literal.Literal`.
+            ValueError: If ``path`` does not refer to an existing path.
+        """
+        return len(self.run(path, facts, max_models=1)) > 0
+    
+    def _run_many_unordered(
+            self,
+            prog: program.Program,
+            fact_sets: typing.Iterator[typing.Iterable[literal.Literal]],
+            max_workers: int,
+            run: typing.Callable[..., typing.List[answer_set.AnswerSet]]
+    ) -> typing.Iterator[typing.Tuple[int, typing.List[answer_set.AnswerSet]]]:
+        """Implements :meth:`run_many_unordered` on top of sanitized args, where ``run`` solves a single set of facts.
+        
+        Since the actual work is done by the solver without holding the GIL, e.g., in separate processes, the single
+        runs are managed by a pool of threads. To avoid materializing all of the fact sets at once, only a bounded number
+        of runs is submitted to the pool at any given time.
+        """
+        max_pending = 2 * max_workers
+        with futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = {}  # maps futures to the indices of the according fact sets
+            next_idx = 0
+            exhausted = False
+            try:
+                while True:
+                    
+                    # submit further runs until the bound is reached
+                    while not exhausted and len(pending) < max_pending:
+                        try:
+                            facts = next(fact_sets)
+                        except StopIteration:
+                            exhausted = True
+                        else:
+                            pending[executor.submit(run, prog, facts)] = next_idx
+                            next_idx += 1
+                    
+                    # check whether all runs have been completed
+                    if not pending:
+                        break
+                    
+                    # provide the results of all runs that finished in the meantime
+                    done, _ = futures.wait(pending, return_when=futures.FIRST_COMPLETED)
+                    for f in done:
+                        yield pending.pop(f), f.result()
+            finally:
+                
+                # if anything went wrong, then we do not start any further runs
+                for f in pending:
+                    f.cancel()
+    
     @abc.abstractmethod
-    def run(self, path, facts: typing.Iterable[literal.Literal]) -> typing.List[answer_set.AnswerSet]:
+    def run(
+            self,
+            path,
+            facts: typing.Iterable[literal.Literal],
+            max_models: int = None,
+            as_collection: bool = False
+    ) -> typing.Union[typing.List[answer_set.AnswerSet], answer_set_collection.AnswerSetCollection]:
         """Runs the ASP program at the provided path, and provides the created answer set.
 
         Args:
-            path (str): The path of the ASP program to run.
+            path (str or :class:`program.Program`): The path of the ASP program to run, or a program that has been
+                loaded by means of :meth:`load_program`.
             facts (iterable[:class:`literal.Literal`]): The facts to provide to the solver in addition to the ASP
                 program.
+            max_models (int, optional): The maximum number of answer sets to compute. By default, all answer sets are
+                computed.
+            as_collection (bool, optional): Indicates whether to provide the answer sets as an
+                :class:`answer_set_collection.AnswerSetCollection`, which requires NumPy, rather than a list.
 
         Returns:
-            :class:`answer_set.AnswerSet`: The created answer set.
+            list[:class:`answer_set.AnswerSet`] or :class:`answer_set_collection.AnswerSetCollection`: The created
+                answer sets.
 
         Raises:
             CalledProcessError: If the invoked ASP solver raises any error.
+            TypeError: If ``facts`` is not an ``Iterable`` of instances of type :class:`literal.Literal`.
+            ValueError: If ``path`` does not refer to an existing path or ``max_models`` is not positive.
+        """
+    
+    @abc.abstractmethod
+    def run_many(
+            self,
+            path,
+            fact_sets: typing.Iterable[typing.Iterable[literal.Literal]],
+            max_workers: int = None,
+            max_models: int = None
+    ) -> typing.List[typing.List[answer_set.AnswerSet]]:
+        """Runs the ASP program at the provided path once for each of the provided sets of facts.
+        
+        The individual runs are executed concurrently on a bounded pool of workers.
+        
+        Args:
+            path (str or :class:`program.Program`): The path of the ASP program to run, or a program that has been
+                loaded by means of :meth:`load_program`.
+            fact_sets (iterable[iterable[:class:`literal.Literal`]]): The sets of facts to run the ASP program for.
+            max_workers (int, optional): The maximum number of runs that are executed concurrently. By default, this
+                is the number of available CPUs.
+            max_models (int, optional): The maximum number of answer sets to compute for each of the sets of facts.
+                By default, all answer sets are computed.
+        
+        Returns:
+            list[list[:class:`answer_set.AnswerSet`]]: The answer sets created for each of the sets of facts, in the
+                same order as ``fact_sets``.
+        
+        Raises:
+            CalledProcessError: If the invoked ASP solver raises any error.
+            TypeError: If ``fact_sets`` is not an ``Iterable`` of ``Iterable``s of instances of type
+                :class:`literal.Literal`.
+            ValueError: If ``path`` does not refer to an existing path or ``max_workers`` or ``max_models`` is not
+                positive.
+        """
+    
+    @abc.abstractmethod
+    def run_many_unordered(
+            self,
+            path,
+            fact_sets: typing.Iterable[typing.Iterable[literal.Literal]],
+            max_workers: int = None,
+            max_models: int = None
+    ) -> typing.Iterator[typing.Tuple[int, typing.List[answer_set.AnswerSet]]]:
+        """Same as :meth:`run_many`, but provides the results as soon as the single runs finish.
+        
+        Args:
+            path (str or :class:`program.Program`): The path of the ASP program to run, or a program that has been
+                loaded by means of :meth:`load_program`.
+            fact_sets (iterable[iterable[:class:`literal.Literal`]]): The sets of facts to run the ASP program for.
+            max_workers (int, optional): The maximum number of runs that are executed concurrently. By default, this
+                is the number of available CPUs.
+            max_models (int, optional): The maximum number of answer sets to compute for each of the sets of facts.
+                By default, all answer sets are computed.
+        
+        Returns:
+            iterator[tuple[int, list[:class:`answer_set.AnswerSet`]]]: Pairs of the index of a set of facts in
+                ``fact_sets`` and the answer sets created for it, in the order that the single runs finish.
+        
+        Raises:
+            CalledProcessError: If the invoked ASP solver raises any error.
+            TypeError: If ``fact_sets`` is not an ``Iterable`` of ``Iterable``s of instances of type
+                :class:`literal.Literal`.
+            ValueError: If ``path`` does not refer to an existing path or ``max_workers`` or ``max_models`` is not
+                positive.
+        """
+    
+    def session(self, path, facts: typing.Iterable[literal.Literal] = ()) -> solver_session.SolverSession:
+        """Creates a session for running the ASP program at the provided path for a sequence of sets of facts that
+        differ by small deltas.
+        
+        The facts of a session are updated by means of :meth:`solver_session.SolverSession.add_facts` and
+        :meth:`solver_session.SolverSession.retract_facts`, and :meth:`solver_session.SolverSession.solve` computes the
+        answer sets for the current facts. By default, every call of ``solve`` runs the solver from scratch, and
+        subclasses should override this method if the according solver supports incremental solving natively.
+        
+        Args:
+            path (str or :class:`program.Program`): The path of the ASP program to run, or a program that has been
+                loaded by means of :meth:`load_program`.
+            facts (iterable[:class:`literal.Literal`], optional): The initial facts of the session.
+        
+        Returns:
+            :class:`solver_session.SolverSession`: The created session.
+        
+        Raises:
             TypeError: If ``facts`` is not an ``Iterable`` of instances of type :class:`literal.Literal`.
             ValueError: If ``path`` does not refer to an existing path.
         """
-
+        return solver_session.SolverSession(self, self._get_program(path), facts)
@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+
+
+import numbers
+import time
+import typing
+
+from aspwrapper import answer_set_collection
+from aspwrapper import literal
+from aspwrapper import program
+from aspwrapper import solver_result
+from aspwrapper import solver_session
+
+try:
+    import clingo
+except ImportError:  # clingo is an optional dependency, and sessions of this kind are created by ClingoSolver only
+    clingo = None
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2018 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2018.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class ClingoSession(solver_session.SolverSession):
+    """A session of a :class:`clingo_solver.ClingoSolver`, which solves the program incrementally by means of clingo's
+    multi-shot solving.
+    
+    The session keeps a single ``clingo.Control``, which grounds the program together with the current facts. Facts
+    that have been retracted at some point are derived from external atoms of their own, which are true as long as the
+    according facts are present. Therefore, retracting or adding such a fact changes the truth value of an external
+    atom only, which neither grounds the program anew nor discards what clingo learned while solving before. All other
+    facts are grounded as plain facts, since external atoms prevent the grounder from simplifying the program. Hence,
+    if a fact is retracted for the first time, or a fact that is new to the control object is added, then the program
+    is grounded anew, which happens when :meth:`solve` is invoked next. This pays off if the same facts are toggled
+    repeatedly, while it is no faster than running the solver anew if every update involves different facts.
+    
+    In contrast to :class:`solver_session.SolverSession`, :meth:`add_facts` raises a ``ValueError`` if any of the facts
+    contains an illegal predicate or term symbol. Sessions are created by means of
+    :meth:`clingo_solver.ClingoSolver.session`.
+    """
+    
+    #  CONSTRUCTOR  ####################################################################################################
+    
+    def __init__(self, solver, prog: program.Program, facts: typing.Iterable[literal.Literal] = ()):
+        """Creates a new instance of ``ClingoSession``.
+        
+        Args:
+            solver (:class:`clingo_solver.ClingoSolver`): The solver to use.
+            prog (:class:`program.Program`): The program to solve.
+            facts (iterable[:class:`literal.Literal`], optional): The initial facts.
+        
+        Raises:
+            TypeError: If ``facts`` is not an ``Iterable`` of instances of :class:`literal.Literal`.
+            ValueError: If any of the ``facts`` contains an illegal predicate or term symbol.
+        """
+        self._control = None
+        self._externals = {}  # maps the symbols of facts to the external atoms that they are derived from
+        self._symbols = {}  # maps the current facts to the according clingo symbols
+        self._volatile = set()  # the symbols of all facts that have been retracted
+        super().__init__(solver, prog, facts)
+    
+    #  METHODS  ########################################################################################################
+    
+    def _add(self, facts: typing.List[literal.Literal]) -> None:
+        # the symbols are created first, such that illegal facts do not change the session
+        symbols = self._solver._to_symbols(frozenset(f for f in facts if f not in self._symbols))
+        for sym, lit in symbols.items():
+            self._symbols[lit] = sym
+            if self._control is not None:
+                atom = self._externals.get(sym)
+                if atom is None:
+                    self._control = None  # the program has to be grounded anew
+                else:
+                    self._control.assign_external(atom, True)
+        
+        super()._add(facts)
+    
+    def _ground(self) -> None:
+        """Creates a new control object, which grounds the program for the current facts."""
+        instrumentation = self._solver._instrumentation
+        if instrumentation is not None:
+            stage_start = time.perf_counter()
+        
+        ctl = clingo.Control(list(self._solver._options))
+        ctl.add("base", [], self._program.data.decode())
+        externals = {}
+        current = set(self._symbols.values())
+        with ctl.backend() as backend:
+            for sym in current.union(self._volatile):
+                if sym not in self._volatile:
+                    backend.add_rule([backend.add_atom(sym)])
+                    continue
+                
+                # facts may appear in the heads of rules, which is why they cannot be external atoms themselves
+                atom = backend.add_atom()
+                backend.add_external(atom, clingo.TruthValue.True_ if sym in current else clingo.TruthValue.False_)
+                backend.add_rule([backend.add_atom(sym)], [atom])
+                externals[sym] = atom
+        
+        ctl.ground([("base", [])])
+        
+        if instrumentation is not None:
+            instrumentation.observe(
+                    "ground",
+                    time.perf_counter() - stage_start,
+                    {"atoms": len(ctl.symbolic_atoms)}
+            )
+        
+        self._control = ctl
+        self._externals = externals
+    
+    def _retract(self, facts: typing.List[literal.Literal]) -> None:
+        for f in facts:
+            sym = self._symbols.pop(f, None)
+            if sym is None:
+                continue
+            self._volatile.add(sym)
+            if self._control is not None:
+                atom = self._externals.get(sym)
+                if atom is None:
+                    self._control = None  # the fact has been grounded as plain fact
+                else:
+                    self._control.assign_external(atom, False)
+        
+        super()._retract(facts)
+    
+    def close(self) -> None:
+        """Releases the control object that is kept by the session."""
+        self._control = None
+        self._externals = {}
+    
+    def solve(
+            self,
+            max_models: int = None,
+            as_collection: bool = False,
+            timeout: numbers.Real = None
+    ) -> typing.Union[solver_result.SolverResult, answer_set_collection.AnswerSetCollection]:
+        """Computes the answer sets of the program for the current facts.
+        
+        Results are looked up in and added to the solver's result cache, if it has one.
+        
+        Args:
+            max_models (int, optional): The maximum number of answer sets to compute. By default, all answer sets are
+                computed.
+            as_collection (bool, optional): Same as for :meth:`clingo_solver.ClingoSolver.run`.
+            timeout (numbers.Real, optional): Same as for :meth:`clingo_solver.ClingoSolver.run`.
+        
+        Returns:
+            :class:`solver_result.SolverResult` or :class:`answer_set_collection.AnswerSetCollection`: The computed
+                answer sets.
+        
+        Raises:
+            subprocess.TimeoutExpired: If the timeout expires.
+        """
+        prog, facts, options = self._solver._sanitize_run_args(self._program, self.facts, max_models, timeout=timeout)
+        
+        # check whether the result has been computed before
+        result = None
+        result_cache = self._solver.result_cache
+        if result_cache is not None:
+            result = result_cache.get(prog, facts, options=options)
+        
+        if result is None:
+            start = time.monotonic()
+            if self._control is None:
+                self._ground()
+            self._control.configuration.solve.models = str(max_models or 0)
+            symbols = {sym: lit for lit, sym in self._symbols.items()}
+            result = self._solver._solve_control(self._control, prog, facts, symbols, start, timeout=timeout)
+            if result_cache is not None:
+                result_cache.put(prog, facts, result, options=options)
+        elif not isinstance(result, solver_result.SolverResult):
+            result = solver_result.SolverResult(result)
+        
+        if as_collection:
+            return answer_set_collection.AnswerSetCollection(result)
+        else:
+            return result
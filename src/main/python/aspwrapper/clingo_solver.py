@@ -0,0 +1,553 @@
+# -*- coding: utf-8 -*-
+
+
+import asyncio
+import collections.abc
+import functools
+import numbers
+import os
+import re
+import subprocess
+import sys
+import time
+import typing
+
+import insanity
+
+from aspwrapper import answer_set
+from aspwrapper import answer_set_collection
+from aspwrapper import base_instrumentation
+from aspwrapper import base_result_cache
+from aspwrapper import base_solver
+from aspwrapper import clingo_session
+from aspwrapper import literal
+from aspwrapper import program
+from aspwrapper import solver_result
+
+try:
+    import clingo
+except ImportError:  # clingo is an optional dependency, which is needed by this module only
+    clingo = None
+
+try:
+    import resource
+except ImportError:  # resource is available on POSIX platforms only, and needed for reporting the peak memory usage
+    resource = None
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2018 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2018.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class ClingoSolver(base_solver.BaseSolver):
+    """A wrapper class for the clingo system, which is run in-process by means of its Python API.
+    
+    In contrast to :class:`dlv_solver.DlvSolver`, no processes are spawned, and neither facts nor answer sets are
+    converted to or from text. Instead, facts are added to the solver as symbols by means of clingo's backend, and the
+    symbols of every model are mapped to literals directly. Notice that programs have to be written in the input
+    language of clingo, e.g., strong negation is denoted by ``-`` rather than ``~``, and if a program contains
+    ``#show`` statements, then these determine which literals are reported as inferences.
+    
+    Terms are mapped to clingo's constants, or to numbers if they are integers. Clingo releases the GIL while it is
+    grounding and solving, which is why :meth:`run_many` and :meth:`run_many_unordered` use a pool of threads.
+    
+    In addition to the args defined by :class:`base_solver.BaseSolver`, :meth:`run`, :meth:`run_many`, and
+    :meth:`run_many_unordered` accept the keyword arg ``timeout`` (numbers.Real, optional), which is the maximum number
+    of seconds that clingo may spend solving a single set of facts. If this is exceeded, then the search is stopped,
+    and a ``subprocess.TimeoutExpired`` is raised. Notice that grounding cannot be interrupted. The answer sets
+    computed by :meth:`run` are provided as a :class:`solver_result.SolverResult`, whose ``max_rss`` is the peak memory
+    usage of the current process, as clingo does not run in a process of its own. On platforms without the module
+    ``resource``, the reported resource usage is ``None``.
+    """
+    
+    PREDICATE_PATTERN = "^[a-z][a-zA-Z0-9_]*$"
+    """str: A regular expression that describes legal predicate symbols."""
+    
+    TERM_PATTERN = PREDICATE_PATTERN
+    """str: A regular expression that describes legal terms, except for integers, which are legal as well."""
+    
+    MAX_CACHED_SYMBOLS = 1 << 20
+    """int: The maximum number of predicate and term symbols, respectively, that are remembered as legal."""
+    
+    #  CONSTRUCTOR  ####################################################################################################
+    
+    def __init__(
+            self,
+            parallel_mode: int = None,
+            result_cache: base_result_cache.BaseResultCache = None,
+            options: typing.Iterable[str] = None,
+            instrumentation: base_instrumentation.BaseInstrumentation = None
+    ):
+        """Creates a new instance of ``ClingoSolver``.
+        
+        Args:
+            parallel_mode (int, optional): The number of threads that clingo uses for solving a single set of facts
+                (clingo option ``--parallel-mode``). By default, clingo uses a single thread.
+            result_cache (:class:`base_result_cache.BaseResultCache`, optional): A cache for the answer sets computed
+                by the solver. By default, results are not cached.
+            options (iterable[str], optional): Additional command-line options that clingo is configured with, e.g.,
+                ``["--opt-mode=optN"]``.
+            instrumentation (:class:`base_instrumentation.BaseInstrumentation`, optional): Receives measurements of
+                the single stages of solver runs, i.e., of :meth:`run`. By default, no measurements are taken.
+        
+        Raises:
+            ImportError: If clingo is not installed.
+            TypeError: If ``parallel_mode`` is not an ``int`` or ``options`` is not an ``Iterable`` of ``str``s.
+            ValueError: If ``parallel_mode`` is not positive or if any of the ``options`` is not an option.
+        """
+        if clingo is None:
+            raise ImportError("ClingoSolver requires clingo, which is not installed!")
+        super().__init__(result_cache=result_cache, instrumentation=instrumentation)
+        
+        # sanitize args
+        if parallel_mode is not None:
+            insanity.sanitize_type("parallel_mode", parallel_mode, int)
+            insanity.sanitize_range("parallel_mode", parallel_mode, minimum=1)
+        if options is None:
+            options = ()
+        else:
+            insanity.sanitize_type("options", options, collections.abc.Iterable)
+            if isinstance(options, str):
+                raise TypeError("The parameter <options> has to be a list of options rather than a single str!")
+            options = tuple(options)
+            insanity.sanitize_iterable("options", options, elements_type=str)
+            for o in options:
+                if not o.startswith("-") or o == "--":
+                    raise ValueError("Encountered an illegal option: '{}'".format(o))
+        if parallel_mode is not None:
+            options = ("--parallel-mode={}".format(parallel_mode), *options)
+        
+        self._options = options
+        self._parallel_mode = parallel_mode
+        self._predicate_match = re.compile(self.PREDICATE_PATTERN).match
+        self._term_match = re.compile(self.TERM_PATTERN).match
+        self._term_symbols = {}  # maps legal terms to the according clingo symbols
+        self._term_strings = {}  # maps clingo symbols that appear as terms in models to the according terms
+        self._valid_predicates = set()
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def parallel_mode(self) -> typing.Optional[int]:
+        """int: The number of threads that clingo uses for solving a single set of facts."""
+        return self._parallel_mode
+    
+    #  METHODS  ########################################################################################################
+    
+    def _to_symbols(self, facts: typing.FrozenSet[literal.Literal]) -> typing.Dict["clingo.Symbol", literal.Literal]:
+        """Creates the clingo symbols that represent the provided facts, and checks their predicate and term symbols.
+        
+        Since the same facts are often used many times, the symbols created for terms are remembered.
+        
+        Args:
+            facts (frozenset[:class:`literal.Literal`]): The facts to convert.
+        
+        Returns:
+            dict: Maps the created symbols to the facts that they represent.
+        
+        Raises:
+            TypeError: If any of ``facts`` is not a :class:`literal.Literal`.
+            ValueError: If any illegal predicate or term symbols is encountered.
+        """
+        literal.sanitize_literals("facts", facts)
+        
+        predicate_match = self._predicate_match
+        term_match = self._term_match
+        term_symbols = self._term_symbols
+        valid_predicates = self._valid_predicates
+        
+        # keep the caches of legal symbols bounded
+        if len(valid_predicates) > self.MAX_CACHED_SYMBOLS:
+            valid_predicates.clear()
+        if len(term_symbols) > self.MAX_CACHED_SYMBOLS:
+            term_symbols.clear()
+        
+        symbols = {}
+        for f in facts:
+            
+            # sanitize the predicate symbol
+            if f.predicate not in valid_predicates:
+                if not predicate_match(f.predicate):
+                    raise ValueError("Encountered an illegal predicate symbol: '{}'".format(f.predicate))
+                valid_predicates.add(f.predicate)
+            
+            # map the fact's terms to symbols
+            args = []
+            for t in f.terms:
+                sym = term_symbols.get(t)
+                if sym is None:
+                    if term_match(t):
+                        sym = clingo.Function(t)
+                    else:
+                        try:
+                            sym = clingo.Number(int(t))
+                        except ValueError:
+                            raise ValueError("Encountered an illegal term: '{}'".format(t)) from None
+                    term_symbols[t] = sym
+                args.append(sym)
+            
+            symbols[clingo.Function(f.predicate, args, f.positive)] = f
+        
+        return symbols
+    
+    def _to_literal(self, sym: "clingo.Symbol") -> literal.Literal:
+        """Creates the literal that is represented by the provided clingo symbol."""
+        term_strings = self._term_strings
+        if len(term_strings) > self.MAX_CACHED_SYMBOLS:
+            term_strings.clear()
+        
+        terms = []
+        for a in sym.arguments:
+            t = term_strings.get(a)
+            if t is None:
+                t = str(a)
+                term_strings[a] = t
+            terms.append(t)
+        
+        return literal.Literal(sym.name, terms, positive=sym.positive)
+    
+    def _create_answer_sets(
+            self,
+            models: typing.Iterable[typing.List["clingo.Symbol"]],
+            facts: typing.FrozenSet[literal.Literal],
+            symbols: typing.Dict["clingo.Symbol", literal.Literal]
+    ) -> typing.Iterator[answer_set.AnswerSet]:
+        """Creates the answer sets described by the provided models.
+        
+        Every literal is created only once, no matter how many models it appears in.
+        
+        Args:
+            models (iterable[list[clingo.Symbol]]): The symbols shown in each model.
+            facts (frozenset[:class:`literal.Literal`]): The facts that have been provided to the solver.
+            symbols (dict): Maps the symbols of all facts to the according literals.
+        
+        Returns:
+            iterator[:class:`answer_set.AnswerSet`]: The answer sets described by ``models``.
+        """
+        inferred = {}  # maps the symbols of inferred atoms to the according literals
+        function_type = clingo.SymbolType.Function
+        for model in models:
+            inferences = []
+            for sym in model:
+                if sym in symbols:
+                    continue
+                lit = inferred.get(sym)
+                if lit is None:
+                    if sym.type != function_type:  # e.g., a number shown by "#show 1."
+                        continue
+                    lit = self._to_literal(sym)
+                    inferred[sym] = lit
+                inferences.append(lit)
+            yield answer_set.AnswerSet._create(facts, frozenset(inferences))
+    
+    def _create_control(
+            self,
+            prog: program.Program,
+            symbols: typing.Dict["clingo.Symbol", literal.Literal],
+            options: typing.Tuple[str, ...]
+    ) -> "clingo.Control":
+        """Creates a clingo control object for the provided program, and adds the given facts by means of the backend.
+        """
+        ctl = clingo.Control(list(options))
+        ctl.add("base", [], prog.data.decode())
+        with ctl.backend() as backend:
+            for sym in symbols:
+                backend.add_rule([backend.add_atom(sym)])
+        
+        return ctl
+    
+    def _sanitize_run_args(
+            self,
+            path,
+            facts: typing.Iterable[literal.Literal],
+            max_models: typing.Optional[int],
+            timeout: typing.Optional[numbers.Real] = None
+    ) -> typing.Tuple[program.Program, typing.FrozenSet[literal.Literal], typing.Tuple[str, ...]]:
+        """Sanitizes the args of the methods that run clingo.
+        
+        Notice that the predicate and term symbols of the facts are checked when they are converted to clingo symbols.
+        
+        Returns:
+            tuple: The program specified by ``path``, the ``facts`` as ``frozenset``, and the options to configure
+                clingo with.
+        """
+        prog = self._get_program(path)
+        insanity.sanitize_type("facts", facts, collections.abc.Iterable)
+        if type(facts) is not frozenset:
+            facts = frozenset(facts)
+        if max_models is None:
+            max_models = 0  # clingo's way of saying "all models"
+        else:
+            insanity.sanitize_type("max_models", max_models, int)
+            insanity.sanitize_range("max_models", max_models, minimum=1)
+        if timeout is not None:
+            insanity.sanitize_type("timeout", timeout, numbers.Real)
+            insanity.sanitize_range("timeout", timeout, minimum=0, min_inclusive=False)
+        
+        return prog, facts, ("--models={}".format(max_models), *self._options)
+    
+    def _solve(
+            self,
+            prog: program.Program,
+            facts: typing.FrozenSet[literal.Literal],
+            options: typing.Tuple[str, ...],
+            timeout: numbers.Real = None
+    ) -> solver_result.SolverResult:
+        """Grounds and solves the program for the provided facts, and creates the computed answer sets."""
+        
+        # the single stages are measured only if there is an instrumentation
+        instrumentation = self._instrumentation
+        if instrumentation is not None:
+            stage_start = time.perf_counter()
+        
+        start = time.monotonic()
+        symbols = self._to_symbols(facts)
+        ctl = self._create_control(prog, symbols, options)
+        
+        if instrumentation is not None:
+            stage_end = time.perf_counter()
+            instrumentation.observe("create_input", stage_end - stage_start, {"facts": len(facts)})
+            stage_start = stage_end
+        
+        ctl.ground([("base", [])])
+        
+        if instrumentation is not None:
+            instrumentation.observe(
+                    "ground",
+                    time.perf_counter() - stage_start,
+                    {"atoms": len(ctl.symbolic_atoms)}
+            )
+        
+        return self._solve_control(ctl, prog, facts, symbols, start, timeout=timeout)
+    
+    def _solve_control(
+            self,
+            ctl: "clingo.Control",
+            prog: program.Program,
+            facts: typing.FrozenSet[literal.Literal],
+            symbols: typing.Dict["clingo.Symbol", literal.Literal],
+            start: float,
+            timeout: numbers.Real = None
+    ) -> solver_result.SolverResult:
+        """Solves the program that has been grounded by the provided control object, and creates the computed answer
+        sets.
+        
+        Args:
+            ctl (clingo.Control): The control object to solve with.
+            prog (:class:`program.Program`): The program that has been grounded.
+            facts (frozenset[:class:`literal.Literal`]): The facts that have been provided to the solver.
+            symbols (dict): Maps the symbols of all facts to the according literals.
+            start (float): The value of ``time.monotonic()`` when the run started.
+            timeout (numbers.Real, optional): The maximum number of seconds to spend solving.
+        
+        Returns:
+            :class:`solver_result.SolverResult`: The computed answer sets.
+        
+        Raises:
+            subprocess.TimeoutExpired: If the timeout expires.
+        """
+        instrumentation = self._instrumentation
+        if instrumentation is not None:
+            stage_start = time.perf_counter()
+        
+        # collect the symbols of all models, and stop the search if the timeout expires
+        models = []
+        with ctl.solve(on_model=lambda m: models.append(m.symbols(shown=True)), async_=True) as handle:
+            if not handle.wait(timeout):
+                handle.cancel()
+                raise subprocess.TimeoutExpired(prog.path, timeout)
+        
+        if instrumentation is not None:
+            stage_end = time.perf_counter()
+            instrumentation.observe("solve", stage_end - stage_start, {"models": len(models)})
+            stage_start = stage_end
+        
+        answer_sets = list(self._create_answer_sets(models, facts, symbols))
+        
+        if instrumentation is not None:
+            instrumentation.observe(
+                    "parse",
+                    time.perf_counter() - stage_start,
+                    {"models": len(answer_sets), "atoms": sum(len(m) for m in models)}
+            )
+        
+        usage = None
+        if resource is not None:
+            usage = solver_result.ResourceUsage(
+                    time.monotonic() - start,
+                    ctl.statistics["summary"]["times"]["cpu"],
+                    resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+            )
+        
+        return solver_result.SolverResult(answer_sets, usage)
+    
+    def _run(
+            self,
+            prog: program.Program,
+            facts: typing.FrozenSet[literal.Literal],
+            options: typing.Tuple[str, ...],
+            timeout: numbers.Real = None
+    ) -> solver_result.SolverResult:
+        """Runs clingo, and stores the result in the cache, if any."""
+        result = self._solve(prog, facts, options, timeout=timeout)
+        if self._result_cache is not None:
+            self._result_cache.put(prog, facts, result, options=options)
+        
+        return result
+    
+    async def arun(
+            self,
+            path,
+            facts: typing.Iterable[literal.Literal],
+            timeout: numbers.Real = None,
+            max_models: int = None
+    ) -> typing.List[answer_set.AnswerSet]:
+        # clingo stops solving by itself if the timeout expires, which is not the case for the default implementation
+        loop = asyncio.get_event_loop()
+        run = functools.partial(self.run, path, facts, max_models=max_models, timeout=timeout)
+        return await loop.run_in_executor(None, run)
+    
+    def iter_answer_sets(
+            self,
+            path,
+            facts: typing.Iterable[literal.Literal],
+            max_models: int = None
+    ) -> typing.Iterator[answer_set.AnswerSet]:
+        prog, facts, options = self._sanitize_run_args(path, facts, max_models)
+        symbols = self._to_symbols(facts)
+        
+        return self._iter_answer_sets(prog, facts, symbols, options)
+    
+    def _iter_answer_sets(
+            self,
+            prog: program.Program,
+            facts: typing.FrozenSet[literal.Literal],
+            symbols: typing.Dict["clingo.Symbol", literal.Literal],
+            options: typing.Tuple[str, ...]
+    ) -> typing.Iterator[answer_set.AnswerSet]:
+        """Implements :meth:`iter_answer_sets` on top of sanitized args."""
+        ctl = self._create_control(prog, symbols, options)
+        ctl.ground([("base", [])])
+        
+        # if the iterator is closed before it is exhausted, then leaving the with block stops the search
+        with ctl.solve(yield_=True) as handle:
+            yield from self._create_answer_sets(
+                    (m.symbols(shown=True) for m in handle),
+                    facts,
+                    symbols
+            )
+    
+    def run(
+            self,
+            path,
+            facts: typing.Iterable[literal.Literal],
+            max_models: int = None,
+            as_collection: bool = False,
+            timeout: numbers.Real = None
+    ) -> typing.Union[solver_result.SolverResult, answer_set_collection.AnswerSetCollection]:
+        prog, facts, options = self._sanitize_run_args(path, facts, max_models, timeout=timeout)
+        
+        # check whether the result has been computed before
+        result = None
+        if self._result_cache is not None:
+            result = self._result_cache.get(prog, facts, options=options)
+        
+        if result is None:
+            result = self._run(prog, facts, options, timeout=timeout)
+        elif not isinstance(result, solver_result.SolverResult):
+            result = solver_result.SolverResult(result)
+        
+        if as_collection:
+            return answer_set_collection.AnswerSetCollection(result)
+        else:
+            return result
+    
+    def run_many(
+            self,
+            path,
+            fact_sets: typing.Iterable[typing.Iterable[literal.Literal]],
+            max_workers: int = None,
+            max_models: int = None,
+            timeout: numbers.Real = None
+    ) -> typing.List[solver_result.SolverResult]:
+        results = {}
+        for idx, answer_sets in self.run_many_unordered(
+                path,
+                fact_sets,
+                max_workers=max_workers,
+                max_models=max_models,
+                timeout=timeout
+        ):
+            results[idx] = answer_sets
+        
+        return [results[idx] for idx in range(len(results))]
+    
+    def run_many_unordered(
+            self,
+            path,
+            fact_sets: typing.Iterable[typing.Iterable[literal.Literal]],
+            max_workers: int = None,
+            max_models: int = None,
+            timeout: numbers.Real = None
+    ) -> typing.Iterator[typing.Tuple[int, solver_result.SolverResult]]:
+        # sanitize args
+        prog, _, _ = self._sanitize_run_args(path, [], max_models, timeout=timeout)
+        insanity.sanitize_type("fact_sets", fact_sets, collections.abc.Iterable)
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        else:
+            insanity.sanitize_type("max_workers", max_workers, int)
+            insanity.sanitize_range("max_workers", max_workers, minimum=1)
+        
+        run = functools.partial(self.run, max_models=max_models, timeout=timeout)
+        
+        return self._run_many_unordered(prog, iter(fact_sets), max_workers, run)
+    
+    def session(self, path, facts: typing.Iterable[literal.Literal] = ()) -> clingo_session.ClingoSession:
+        """Creates a session for running the ASP program at the provided path for a sequence of sets of facts that
+        differ by small deltas.
+        
+        In contrast to the default implementation, the session solves the program incrementally, i.e., it keeps a
+        single ``clingo.Control``, and grounds the program anew only if facts are added that have not been present when
+        it was grounded before. See :class:`clingo_session.ClingoSession` for details.
+        
+        Args:
+            path (str or :class:`program.Program`): The path of the ASP program to run, or a program that has been
+                loaded by means of :meth:`load_program`.
+            facts (iterable[:class:`literal.Literal`], optional): The initial facts of the session.
+        
+        Returns:
+            :class:`clingo_session.ClingoSession`: The created session.
+        
+        Raises:
+            TypeError: If ``facts`` is not an ``Iterable`` of instances of type :class:`literal.Literal`.
+            ValueError: If ``path`` does not refer to an existing path or any of the ``facts`` contains an illegal
+                predicate or term symbol.
+        """
+        return clingo_session.ClingoSession(self, self._get_program(path), facts)
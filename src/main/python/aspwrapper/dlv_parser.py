@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+
+"""This module implements a parser for the answer sets that are printed by DLV.
+
+When invoked with option ``--silent``, DLV prints every answer set on a line of its own, e.g.,
+``{person(patrick), -hero(patrick)}``. Besides constants, terms may be integers, quoted strings, which may contain any
+characters including commas and parentheses, and nested function terms, like ``f(a,g(b))``. Terms are kept as they are
+printed by DLV.
+"""
+
+
+import re
+import typing
+
+from aspwrapper import literal
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2018 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2018.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+_ATOM_PATTERN = re.compile(r"([-~]?)(\w+)(?:\((.*)\))?", re.DOTALL)
+"""The pattern of a single atom, which captures the sign, the predicate symbol, and the (unsplit) terms."""
+
+_MODEL_PREFIXES = ("{", "Best model: {")
+"""tuple[str]: The prefixes of lines that describe answer sets, for both regular and optimal answer sets."""
+
+_SPECIAL_TOKEN_PATTERN = re.compile(r'"(?:[^"\\]|\\.)*"|[(),\[\]]')
+"""The tokens that are relevant for splitting atoms and terms, i.e., quoted strings, commas, and brackets."""
+
+
+def _split_top_level(text: str) -> typing.List[str]:
+    """Splits the provided text at all commas that are neither enclosed in brackets nor in a quoted string.
+    
+    Only quoted strings, commas, and brackets are visited while scanning the text, which means that all other
+    characters are skipped by the regex engine.
+    """
+    parts = []
+    depth = 0
+    start = 0
+    for m in _SPECIAL_TOKEN_PATTERN.finditer(text):
+        token = m.group()
+        if token == ",":
+            if depth == 0:
+                parts.append(text[start:m.start()])
+                start = m.end()
+        elif token == "(" or token == "[":
+            depth += 1
+        elif token == ")" or token == "]":
+            depth -= 1
+    parts.append(text[start:])
+    
+    return parts
+
+
+def parse_atom(text: str) -> literal.Literal:
+    """Parses a single atom, or a strongly negated atom, as printed by DLV.
+    
+    Args:
+        text (str): The atom to parse, e.g., ``-locatedIn(vienna,"Austria, Europe")``.
+    
+    Returns:
+        :class:`literal.Literal`: The parsed literal.
+    
+    Raises:
+        ValueError: If ``text`` is not a legal atom.
+    """
+    m = _ATOM_PATTERN.fullmatch(text.strip())
+    if m is None:
+        raise ValueError("Unable to parse atom: '{}'".format(text))
+    sign, predicate, terms = m.groups()
+    
+    if terms is None:
+        terms = ()
+    elif '"' in terms or "(" in terms or "[" in terms:
+        terms = _split_top_level(terms)
+    else:
+        terms = terms.split(",")
+    
+    try:
+        return literal.Literal(predicate, terms, positive=sign == "")
+    except ValueError:
+        raise ValueError("Unable to parse atom: '{}'".format(text)) from None
+
+
+def parse_model(
+        line: str,
+        memo: typing.Dict[str, literal.Literal] = None
+) -> typing.Optional[typing.List[literal.Literal]]:
+    """Parses a single line of output that describes an answer set.
+    
+    Args:
+        line (str): The line to parse.
+        memo (dict[str, :class:`literal.Literal`], optional): A dictionary of atoms that have been parsed before. If
+            this is provided, then every atom is looked up in and added to ``memo``, which means that the same atom is
+            parsed only once, and all occurrences of it share the same ``Literal``.
+    
+    Returns:
+        list[:class:`literal.Literal`]: The literals contained in the answer set, or ``None``, if ``line`` does not
+            describe an answer set.
+    
+    Raises:
+        ValueError: If ``line`` contains an illegal atom.
+    """
+    line = line.strip()
+    if not line.endswith("}"):
+        return None
+    for prefix in _MODEL_PREFIXES:
+        if line.startswith(prefix):
+            body = line[len(prefix):-1]
+            break
+    else:
+        return None
+    
+    # split the line into atoms
+    # DLV separates atoms by ", ", and never prints spaces inside atoms except in quoted strings, which allows for
+    # splitting lines without any quoted strings in a single step
+    if body == "":
+        return []
+    elif '"' in body:
+        atoms = [a.strip() for a in _split_top_level(body)]
+    else:
+        atoms = body.split(", ")
+    
+    # parse the atoms
+    if memo is None:
+        return [parse_atom(a) for a in atoms]
+    literals = []
+    for a in atoms:
+        lit = memo.get(a)
+        if lit is None:
+            lit = parse_atom(a)
+            memo[a] = lit
+        literals.append(lit)
+    
+    return literals
+
+
+def parse_models(lines: typing.Iterable[str]) -> typing.Iterator[typing.List[literal.Literal]]:
+    """Parses the answer sets that are printed by DLV.
+    
+    The provided lines are consumed one by one, and every answer set is provided as soon as the according line has
+    been parsed. Therefore, it is possible to parse the output of DLV while it is being produced, e.g., by providing
+    a pipe that DLV is writing to. Lines that do not describe answer sets are skipped.
+    
+    Args:
+        lines (iterable[str]): The output of DLV, split into lines.
+    
+    Returns:
+        iterator[list[:class:`literal.Literal`]]: The literals contained in each of the answer sets. Occurrences of
+            the same atom in different answer sets share the same ``Literal``.
+    
+    Raises:
+        ValueError: If the output contains an illegal atom.
+    """
+    memo = {}
+    for line in lines:
+        model = parse_model(line, memo=memo)
+        if model is not None:
+            yield model
@@ -1,17 +1,41 @@
 # -*- coding: utf-8 -*-
 
 
-import collections
+import asyncio
+import collections.abc
+import functools
+import itertools
+import math
+import numbers
 import os
 import re
+import select
+import selectors
+import signal
 import subprocess
+import sys
+import time
 import typing
+import weakref
 
 import insanity
 
 from aspwrapper import answer_set
+from aspwrapper import answer_set_collection
+from aspwrapper import answer_set_product
+from aspwrapper import base_instrumentation
+from aspwrapper import base_result_cache
 from aspwrapper import base_solver
+from aspwrapper import dlv_parser
+from aspwrapper import lazy_solver_result
 from aspwrapper import literal
+from aspwrapper import program
+from aspwrapper import solver_result
+
+try:
+    import resource
+except ImportError:  # resource is available on POSIX platforms only, and needed for resource limits and accounting
+    resource = None
 
 
 __author__ = "Patrick Hohenecker"
@@ -44,29 +68,150 @@ __email__ = "mail@paho.at"
 __status__ = "Development"
 
 
-class DlvSolver(base_solver.BaseSolver):
-    """A wrapper class for the DLV system."""
+_PIPE_BUF = getattr(select, "PIPE_BUF", 512)
+"""int: The number of bytes that can be written to a writable pipe without blocking."""
+
+_RESOURCE_ACCOUNTING = resource is not None and hasattr(os, "wait4")
+"""bool: Indicates whether resource limits and accounting for DLV processes are supported on the current platform."""
+
+_validation_keys = {}
+"""dict: Maps pairs of predicate and term patterns to a canonical instance, which literals are marked with."""
+
+
+def _kill_session(proc: typing.Union[subprocess.Popen, asyncio.subprocess.Process]) -> None:
+    """Kills the provided process, which has been started in a new session, together with all of its children.
     
-    LITERAL_PATTERN = r"^(?P<sign>[-~]?)(?P<predicate>.+)\((?P<terms>.+)\)$"
-    """str: A regular expression for parsing literals provided by DLV."""
+    On platforms without process groups, only the process itself is killed.
+    """
+    if hasattr(os, "killpg"):
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+    else:
+        try:
+            proc.kill()
+        except ProcessLookupError:
+            pass
+
+
+def _set_limits(limits: typing.List[typing.Tuple[int, typing.Tuple[int, int]]]) -> None:
+    """Applies the provided resource limits to the current process, which is used on platforms without ``prlimit``."""
+    for res, lim in limits:
+        resource.setrlimit(res, lim)
+
 
+class DlvSolver(base_solver.BaseSolver):
+    """A wrapper class for the DLV system.
+    
+    In addition to the args defined by :class:`base_solver.BaseSolver`, all methods that run DLV accept the following
+    keyword args. The first two make DLV filter its output rather than printing all atoms of every answer set, which
+    reduces the amount of data that has to be transferred and parsed, in particular for large sets of facts:
+    
+    * ``output_predicates`` (iterable[str], optional): If provided, then answer sets contain only literals with one of
+      these predicates (DLV option ``-filter``), and this applies to their facts as well. If the ``options`` of the
+      solver contain ``-filter`` as well, then the predicates of both are combined into a single ``-filter``.
+    * ``include_facts`` (bool, optional): If ``False``, then DLV does not print any facts, neither those provided nor
+      those contained in the program (DLV option ``-nofacts``), and the answer sets do not contain any facts. The
+      default is ``True``.
+    * ``trusted`` (bool, optional): If ``True``, then the provided facts are not checked at all, which is meant for
+      facts from trusted sources. The default is ``False``. Literals that have been checked once are not checked
+      again anyway.
+    
+    Furthermore, :meth:`run`, :meth:`run_many`, and :meth:`run_many_unordered` accept the following keyword args, which
+    limit the resources that DLV may use for a single set of facts. The answer sets computed by :meth:`run` are
+    provided as a :class:`solver_result.SolverResult`, which reports the resources that DLV used.
+    
+    Resource limits and accounting are supported on POSIX platforms only. On other platforms, the reported resource
+    usage is ``None``, and providing ``max_memory`` or ``max_cpu_seconds`` causes a ``ValueError``.
+    
+    * ``timeout`` (numbers.Real, optional): The maximum number of seconds that DLV may run for. If this is exceeded,
+      then DLV (together with its process group) is killed, and a ``subprocess.TimeoutExpired`` is raised.
+    * ``max_memory`` (int, optional): The maximum size of DLV's virtual memory in bytes.
+    * ``max_cpu_seconds`` (numbers.Real, optional): The maximum CPU time that DLV may use.
+    
+    If DLV exceeds any of the latter two limits, then it is terminated by the OS, and a
+    ``subprocess.CalledProcessError`` is raised.
+    
+    The same methods accept the keyword arg ``lazy`` (bool, optional). If this is ``True``, then the answer sets are
+    provided as a :class:`lazy_solver_result.LazySolverResult`, which keeps the output of DLV, and parses answer sets
+    only if they are accessed. This allows for counting the answer sets or inspecting a few of them without creating
+    all of them, and such results are not added to the result cache. The default is ``False``.
+    
+    Finally, :meth:`run` accepts the keyword args ``decompose`` and ``link_positions``, which allow for solving sets of
+    facts that consist of independent sub-scenarios by means of one (concurrent) run of DLV for each of them:
+    
+    * ``decompose`` (bool, optional): If ``True``, then the facts are partitioned into components that do not share
+      any terms, the components are solved concurrently by means of :meth:`run_many`, and the answer sets are provided
+      as an :class:`answer_set_product.AnswerSetProduct`, which combines the answer sets of the components on access.
+      This is correct only if facts that do not share any terms cannot affect each other, i.e., if every rule of the
+      program connects its atoms by means of shared variables, and if the part of the program that does not depend on
+      the provided facts has a single answer set. The default is ``False``.
+    * ``link_positions`` (mapping[str, iterable[int]], optional): Describes the dependencies of the program, namely,
+      which terms of the facts of a predicate link them with other facts. This maps predicates to the (zero-based)
+      positions of their linking terms, and all terms are linking for predicates that are not mentioned. For example,
+      ``{"type": [0]}`` makes sure that facts like ``type(alice, person)`` and ``type(bob, person)`` are not linked by
+      the shared term ``person``. Facts without any linking terms are provided to all of the components.
+    """
+    
     PREDICATE_PATTERN = "^[a-z][a-zA-Z0-9_]*$"
     """str: A regular expression that describes legal predicate symbols."""
 
     TERM_PATTERN = PREDICATE_PATTERN
     """str: A regular expression that describes legal terms."""
     
+    MAX_CACHED_SYMBOLS = 1 << 20
+    """int: The maximum number of predicate and term symbols, respectively, that are remembered as legal."""
+    
     #  CONSTRUCTOR  ####################################################################################################
     
-    def __init__(self, dlv_path: str):
+    def __init__(
+            self,
+            dlv_path: str,
+            max_concurrency: int = None,
+            result_cache: base_result_cache.BaseResultCache = None,
+            options: typing.Iterable[str] = None,
+            instrumentation: base_instrumentation.BaseInstrumentation = None
+    ):
         """Creates a new instance of ``DlvSolver``.
 
         Args:
             dlv_path (str): The path to the DLV executable.
+            max_concurrency (int, optional): The maximum number of DLV processes that are run concurrently by
+                :meth:`arun` in the same event loop. By default, this number is not limited.
+            result_cache (:class:`base_result_cache.BaseResultCache`, optional): A cache for the answer sets computed
+                by the solver. By default, results are not cached.
+            options (iterable[str], optional): Additional command-line options that DLV is invoked with, e.g.,
+                ``["-filter=hero"]``. Every element is passed to DLV as a separate argument, i.e., without being
+                interpreted by a shell.
+            instrumentation (:class:`base_instrumentation.BaseInstrumentation`, optional): Receives measurements of
+                the single stages of solver runs, i.e., of :meth:`run`. By default, no measurements are taken.
+        
+        Raises:
+            TypeError: If ``options`` is not an ``Iterable`` of ``str``s.
+            ValueError: If ``dlv_path`` does not refer to an existing file, if ``max_concurrency`` is not positive, or
+                if any of the ``options`` is not an option.
         """
+        super().__init__(result_cache=result_cache, instrumentation=instrumentation)
+        
+        # sanitize args
         dlv_path = str(dlv_path)
         if not os.path.isfile(dlv_path):
             raise ValueError("The provided <dlv_path> does not refer to an existing file: '{}'".format(dlv_path))
+        if max_concurrency is not None:
+            insanity.sanitize_type("max_concurrency", max_concurrency, int)
+            insanity.sanitize_range("max_concurrency", max_concurrency, minimum=1)
+        if options is None:
+            options = ()
+        else:
+            insanity.sanitize_type("options", options, collections.abc.Iterable)
+            if isinstance(options, str):
+                raise TypeError("The parameter <options> has to be a list of options rather than a single str!")
+            options = tuple(options)
+            insanity.sanitize_iterable("options", options, elements_type=str)
+            for o in options:
+                if not o.startswith("-") or o == "--":
+                    raise ValueError("Encountered an illegal option: '{}'".format(o))
         
         # if the provided path is relative, then prefix it with "./"
         # otherwise, relative paths in the same directory (i.e., just filenames) cause errors on invoking DLV
@@ -74,93 +219,788 @@ class DlvSolver(base_solver.BaseSolver):
             dlv_path = os.path.join(".", dlv_path)
 
         self._dlv_path = dlv_path
+        self._max_concurrency = max_concurrency
+        self._options = options
+        self._semaphores = weakref.WeakKeyDictionary()
+        
+        # literals that have been checked are marked with the patterns they comply with, which are shared between all
+        # solvers that use the same patterns
+        patterns = (self.PREDICATE_PATTERN, self.TERM_PATTERN)
+        self._predicate_match = re.compile(self.PREDICATE_PATTERN).match
+        self._term_match = re.compile(self.TERM_PATTERN).match
+        self._valid_predicates = set()
+        self._valid_terms = set()
+        self._validation_key = _validation_keys.setdefault(patterns, patterns)
     
     #  METHODS  ########################################################################################################
     
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Provides the semaphore that limits the number of concurrent invocations of :meth:`arun`.
+        
+        Since a semaphore cannot be shared across event loops, a separate one is created for each loop that the solver
+        is used with.
+        """
+        loop = asyncio.get_event_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self._max_concurrency)
+            self._semaphores[loop] = semaphore
+        
+        return semaphore
+    
+    @staticmethod
+    def _decompose(
+            facts: typing.FrozenSet[literal.Literal],
+            link_positions: typing.Dict[str, typing.FrozenSet[int]]
+    ) -> typing.List[typing.FrozenSet[literal.Literal]]:
+        """Partitions the provided facts into components that are not linked by any shared terms.
+        
+        Facts that do not have any linking terms are added to every component.
+        
+        Args:
+            facts (frozenset[:class:`literal.Literal`]): The (sanitized) facts to partition.
+            link_positions (dict[str, frozenset[int]]): Maps predicates to the positions of their linking terms.
+        
+        Returns:
+            list[frozenset[:class:`literal.Literal`]]: The components.
+        """
+        parents = {}  # a union-find forest over all linking terms
+        
+        def find(term: str) -> str:
+            root = term
+            while parents[root] != root:
+                root = parents[root]
+            while parents[term] != root:  # compress the path
+                parents[term], term = root, parents[term]
+            return root
+        
+        # link the terms of every fact with each other
+        shared = []
+        linked = []
+        for f in facts:
+            positions = link_positions.get(f.predicate)
+            if positions is None:
+                terms = f.terms
+            else:
+                terms = [t for i, t in enumerate(f.terms) if i in positions]
+            if not terms:
+                shared.append(f)
+                continue
+            
+            linked.append((f, terms[0]))
+            root = parents.setdefault(terms[0], terms[0])
+            root = find(root)
+            for t in terms[1:]:
+                other = find(parents.setdefault(t, t))
+                if other != root:
+                    parents[other] = root
+        
+        # assemble the components
+        components = {}
+        for f, term in linked:
+            components.setdefault(find(term), []).append(f)
+        if not components:
+            return [facts]
+        
+        return [frozenset(itertools.chain(shared, c)) for c in components.values()]
+    
+    @staticmethod
+    def _sanitize_link_positions(
+            link_positions: typing.Optional[typing.Mapping[str, typing.Iterable[int]]]
+    ) -> typing.Dict[str, typing.FrozenSet[int]]:
+        """Sanitizes the arg ``link_positions`` of :meth:`run`, and converts it into a ``dict`` of ``frozenset``s."""
+        if link_positions is None:
+            return {}
+        insanity.sanitize_type("link_positions", link_positions, collections.abc.Mapping)
+        sanitized = {}
+        for predicate, positions in link_positions.items():
+            insanity.sanitize_type("link_positions", predicate, str)
+            insanity.sanitize_type("link_positions", positions, collections.abc.Iterable)
+            positions = frozenset(positions)
+            insanity.sanitize_iterable("link_positions", positions, elements_type=int)
+            for i in positions:
+                insanity.sanitize_range("link_positions", i, minimum=0)
+            sanitized[predicate] = positions
+        
+        return sanitized
+    
     def _sanitize_literals(self, literals: typing.Iterable[literal.Literal]) -> None:
-        """Examines the predicate and term symbols that appear in any of the provided literals.
+        """Examines the types as well as the predicate and term symbols of all of the provided literals.
         
-        This function ensures that all of the used literals comply with syntax that is used by the DLV system.
+        This function ensures that all of the used literals comply with syntax that is used by the DLV system. Since
+        the same facts are often used many times, symbols that have been found to be legal are remembered, and so are
+        literals that have been checked completely.
         
         Args:
             literals (iterable[:class:`literal.Literal`): The literals to check.
         
         Raises:
+            TypeError: If any of ``literals`` is not a :class:`literal.Literal`.
             ValueError: If any illegal predicate or term symbols is encountered.
         """
+        key = self._validation_key
+        predicate_match = self._predicate_match
+        term_match = self._term_match
+        valid_predicates = self._valid_predicates
+        valid_terms = self._valid_terms
+        
+        # keep the caches of legal symbols bounded
+        if len(valid_predicates) > self.MAX_CACHED_SYMBOLS:
+            valid_predicates.clear()
+        if len(valid_terms) > self.MAX_CACHED_SYMBOLS:
+            valid_terms.clear()
+        
         for l in literals:  # iterate over all of the provided literals
             
+            if type(l) is not literal.Literal and not isinstance(l, literal.Literal):
+                raise TypeError(
+                        "The type of the elements of <facts> has to be Literal, but {} was encountered!".format(
+                                type(l).__name__
+                        )
+                )
+            
+            # skip literals that have been checked before
+            if l._validated is key:
+                continue
+            
             # sanitize the predicate symbol
-            if not re.match(self.PREDICATE_PATTERN, l.predicate):
-                raise ValueError("Encountered an illegal predicate symbol: '{}'".format(l.predicate))
+            if l.predicate not in valid_predicates:
+                if not predicate_match(l.predicate):
+                    raise ValueError("Encountered an illegal predicate symbol: '{}'".format(l.predicate))
+                valid_predicates.add(l.predicate)
             
             # sanitize the literal's terms
             for t in l.terms:
-                if not re.match(self.TERM_PATTERN, t):
-                    raise ValueError("Encountered an illegal term: '{}'".format(t))
+                if t not in valid_terms:
+                    if not term_match(t):
+                        raise ValueError("Encountered an illegal term: '{}'".format(t))
+                    valid_terms.add(t)
+            
+            l._mark_validated(key)
     
-    def run(self, path: str, facts: typing.Iterable[literal.Literal]) -> typing.List[answer_set.AnswerSet]:
+    def _create_input(self, prog: program.Program, facts: typing.FrozenSet[literal.Literal]) -> bytes:
+        """Creates the input for DLV, which combines the provided facts with the given ASP program.
+        
+        The input is passed to DLV via stdin rather than a file on disk. Therefore, there is no state shared between
+        different invocations, which allows for running the solver concurrently.
+        
+        Args:
+            prog (:class:`program.Program`): The ASP program.
+            facts (frozenset[:class:`literal.Literal`]): The (sanitized) facts to add to the program.
+        
+        Returns:
+            bytes: The encoded input for DLV.
+        """
+        # prepare list of facts to pass into DLV
+        str_facts = "".join(str(f) + ".\n" for f in facts if f)
+        
+        # combine facts with the mapping
+        return str_facts.encode() + b"\n" + prog.data
+    
+    def _parse_answer_sets(
+            self,
+            result: str,
+            facts: typing.FrozenSet[literal.Literal]
+    ) -> typing.List[answer_set.AnswerSet]:
+        """Creates the answer sets described by the output produced by DLV.
+        
+        Args:
+            result (str): The output produced by DLV.
+            facts (frozenset[:class:`literal.Literal`]): The facts that have been provided to DLV.
+        
+        Returns:
+            list[:class:`answer_set.AnswerSet`]: The answer sets described by ``result``.
+        """
+        result_sets = []
+        for model in dlv_parser.parse_models(result.splitlines()):
+            inferences = frozenset([lit for lit in model if lit not in facts])
+            result_sets.append(answer_set.AnswerSet._create(facts, inferences))
+        
+        return result_sets
+    
+    @staticmethod
+    def _output_facts(
+            facts: typing.FrozenSet[literal.Literal],
+            options: typing.Tuple[str, ...]
+    ) -> typing.FrozenSet[literal.Literal]:
+        """Determines which of the provided facts are reported by DLV if it is invoked with the given options.
+        
+        Args:
+            facts (frozenset[:class:`literal.Literal`]): The facts that are provided to DLV.
+            options (tuple[str]): The options that DLV is invoked with.
+        
+        Returns:
+            frozenset[:class:`literal.Literal`]: The facts that appear in DLV's output.
+        """
+        if "-nofacts" in options:
+            return frozenset()
+        predicates = None
+        for o in options:
+            if o.startswith("-filter="):
+                if predicates is None:
+                    predicates = set()
+                predicates.update(o[len("-filter="):].split(","))
+        if predicates is not None:
+            return frozenset([f for f in facts if f.predicate in predicates])
+        
+        return facts
+    
+    def _sanitize_run_args(
+            self,
+            path,
+            facts: typing.Iterable[literal.Literal],
+            max_models: typing.Optional[int],
+            output_predicates: typing.Optional[typing.Iterable[str]] = None,
+            include_facts: bool = True,
+            trusted: bool = False
+    ) -> typing.Tuple[program.Program, typing.FrozenSet[literal.Literal], typing.Tuple[str, ...]]:
+        """Sanitizes the args of the methods that run DLV.
+        
+        If ``trusted`` is ``True``, then the facts are not checked at all.
+        
+        Returns:
+            tuple: The program specified by ``path``, the sanitized ``facts`` as ``frozenset``, and the options to
+                invoke DLV with.
+        """
+        prog = self._get_program(path)
+        insanity.sanitize_type("facts", facts, collections.abc.Iterable)
+        if type(facts) is not frozenset:
+            facts = frozenset(facts)
+        if not trusted:
+            self._sanitize_literals(facts)
+        
+        # assemble the options for DLV -> all -filter options are merged into one, as DLV treats multiple ones as union
+        options = ["--silent"]
+        filter_predicates = set()
+        for o in self._options:
+            if o.startswith("-filter="):
+                filter_predicates.update(o[len("-filter="):].split(","))
+            else:
+                options.append(o)
+        if max_models is not None:
+            insanity.sanitize_type("max_models", max_models, int)
+            insanity.sanitize_range("max_models", max_models, minimum=1)
+            options.append("-n={}".format(max_models))
+        if output_predicates is not None:
+            insanity.sanitize_type("output_predicates", output_predicates, collections.abc.Iterable)
+            if isinstance(output_predicates, str):
+                raise TypeError("The parameter <output_predicates> has to be a list of predicates rather than a str!")
+            output_predicates = sorted(set(output_predicates))
+            insanity.sanitize_iterable("output_predicates", output_predicates, elements_type=str)
+            if not output_predicates:
+                raise ValueError("The parameter <output_predicates> must not be empty!")
+            for p in output_predicates:
+                if not self._predicate_match(p):
+                    raise ValueError("Encountered an illegal predicate symbol: '{}'".format(p))
+            filter_predicates.update(output_predicates)
+        if filter_predicates:
+            options.append("-filter={}".format(",".join(sorted(filter_predicates))))
+        if not include_facts:
+            options.append("-nofacts")
+        
+        return prog, facts, tuple(options)
+    
+    async def _arun(
+            self,
+            prog: program.Program,
+            facts: typing.FrozenSet[literal.Literal],
+            options: typing.Tuple[str, ...],
+            timeout: typing.Optional[numbers.Real]
+    ) -> typing.List[answer_set.AnswerSet]:
+        """Implements :meth:`arun` on top of sanitized args."""
+        data = self._create_input(prog, facts)
+        
+        # launch DLV in a new session, such that it can be killed together with all of its children
+        cmd = [self._dlv_path, *options, "--"]
+        proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                start_new_session=True
+        )
+        
+        # wait for DLV to finish -> if this is cancelled or times out, then we have to kill DLV and all of its children,
+        # as any child that is left alive keeps stdout open, which prevents the process from being reaped
+        try:
+            result, _ = await asyncio.wait_for(proc.communicate(data), timeout)
+        except BaseException as e:
+            _kill_session(proc)
+            await proc.wait()
+            if isinstance(e, asyncio.TimeoutError):
+                raise subprocess.TimeoutExpired(cmd, timeout) from None
+            raise
+        
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, cmd, output=result)
+        
+        return self._parse_answer_sets(result.decode(), self._output_facts(facts, options))
+    
+    async def arun(
+            self,
+            path,
+            facts: typing.Iterable[literal.Literal],
+            timeout: numbers.Real = None,
+            max_models: int = None,
+            output_predicates: typing.Iterable[str] = None,
+            include_facts: bool = True,
+            trusted: bool = False
+    ) -> typing.List[answer_set.AnswerSet]:
         # sanitize args
-        path = str(path)
-        if not os.path.isfile(path):
-            raise ValueError("The provided <path> does not refer to an existing file: '{}'!".format(path))
-        insanity.sanitize_type("facts", facts, collections.Iterable)
-        facts = set(facts)
-        insanity.sanitize_iterable("facts", facts, elements_type=literal.Literal)
-        self._sanitize_literals(facts)
-        
-        # prepare list of facts to pass into temporary file
-        if len(facts) == 0:
-            str_facts = ""
+        prog, facts, options = self._sanitize_run_args(
+                path,
+                facts,
+                max_models,
+                output_predicates=output_predicates,
+                include_facts=include_facts,
+                trusted=trusted
+        )
+        if timeout is not None:
+            insanity.sanitize_type("timeout", timeout, numbers.Real)
+            insanity.sanitize_range("timeout", timeout, minimum=0, min_inclusive=False)
+        
+        # check whether the result has been computed before
+        if self._result_cache is not None:
+            result = self._result_cache.get(prog, facts, options=options)
+            if result is not None:
+                return result
+        
+        if self._max_concurrency is None:
+            result = await self._arun(prog, facts, options, timeout)
         else:
-            str_facts = [str(f) + '.' for f in facts if f]
+            async with self._get_semaphore():
+                result = await self._arun(prog, facts, options, timeout)
+        
+        if self._result_cache is not None:
+            self._result_cache.put(prog, facts, result, options=options)
+        
+        return result
+    
+    def _iter_answer_sets(
+            self,
+            prog: program.Program,
+            facts: typing.FrozenSet[literal.Literal],
+            options: typing.Tuple[str, ...]
+    ) -> typing.Iterator[answer_set.AnswerSet]:
+        """Implements :meth:`iter_answer_sets` on top of sanitized args."""
+        cmd = [self._dlv_path, *options, "--"]
+        output_facts = self._output_facts(facts, options)
+        with subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE) as proc:
+            try:
+                
+                # pass the input to DLV
+                # since DLV reads all of its input before it produces any output, this cannot cause a deadlock
+                try:
+                    proc.stdin.write(self._create_input(prog, facts))
+                    proc.stdin.close()
+                except BrokenPipeError:
+                    pass  # DLV terminated prematurely, which is reported based on its return code below
+                
+                # provide answer sets as soon as they are printed by DLV
+                for model in dlv_parser.parse_models(line.decode() for line in proc.stdout):
+                    yield answer_set.AnswerSet._create(
+                            output_facts,
+                            frozenset([lit for lit in model if lit not in output_facts])
+                    )
+                
+                if proc.wait() != 0:
+                    raise subprocess.CalledProcessError(proc.returncode, cmd)
             
-        # create a temporary file combining facts with the mapping
-        temp_file = os.path.join(input_dir, "temp.asp")
-        with open(temp_file, "w") as f:
-            for x in str_facts:
-                f.write(x + "\n")
-            f.write("\n")
-            with open(path, "r") as mapping:
-                f.write(mapping.read())
-        f.close()
-        
-        
-        # run DLV
-        cmd = "{} {} --silent".format(
-                self._dlv_path,
-                temp_file
+            finally:
+                
+                # if the iterator has been closed before all answer sets have been provided, then DLV is stopped
+                if proc.poll() is None:
+                    proc.kill()
+    
+    def iter_answer_sets(
+            self,
+            path,
+            facts: typing.Iterable[literal.Literal],
+            max_models: int = None,
+            output_predicates: typing.Iterable[str] = None,
+            include_facts: bool = True,
+            trusted: bool = False
+    ) -> typing.Iterator[answer_set.AnswerSet]:
+        # sanitize args
+        prog, facts, options = self._sanitize_run_args(
+                path,
+                facts,
+                max_models,
+                output_predicates=output_predicates,
+                include_facts=include_facts,
+                trusted=trusted
         )
-        result = str(subprocess.check_output(cmd, shell=True, universal_newlines=True)).strip()
         
-        # delete the temp file
-        os.remove(temp_file)
+        return self._iter_answer_sets(prog, facts, options)
+    
+    @staticmethod
+    def _communicate(proc: subprocess.Popen, data: bytes, timeout: typing.Optional[numbers.Real]) -> bytes:
+        """Passes the input to DLV and reads its output.
         
-        # check if any answer set has been provided at all
-        if result == "":
-            return []
+        In contrast to ``Popen.communicate``, this does not wait for DLV to terminate, which allows for collecting
+        DLV's resource usage by means of ``os.wait4``.
         
-        # split result into parts representing single answer sets
-        result = [r.strip()[1:-1] for r in result.split("\n")]
+        Args:
+            proc (subprocess.Popen): The DLV process.
+            data (bytes): The input for DLV.
+            timeout (numbers.Real): The maximum number of seconds to wait for DLV's output, or ``None``.
         
-        # create answer sets
-        result_sets = []
-        for r in result:  # iterate over all answer sets (i.e., string representations of them)
+        Returns:
+            bytes: Everything that DLV printed to stdout.
+        
+        Raises:
+            subprocess.TimeoutExpired: If DLV did not finish in time.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        data = memoryview(data)
+        offset = 0
+        chunks = []
+        with selectors.DefaultSelector() as selector:
+            selector.register(proc.stdout, selectors.EVENT_READ)
+            selector.register(proc.stdin, selectors.EVENT_WRITE)
+            while selector.get_map():
+                
+                # check whether there is time left
+                remaining = None
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise subprocess.TimeoutExpired(proc.args, timeout)
+                
+                for key, _ in selector.select(remaining):
+                    if key.fileobj is proc.stdin:
+                        
+                        # writing at most PIPE_BUF bytes to a writable pipe does not block
+                        try:
+                            offset += os.write(key.fd, data[offset:offset + _PIPE_BUF])
+                        except BrokenPipeError:
+                            offset = len(data)  # DLV terminated prematurely, which is reported by its return code
+                        if offset >= len(data):
+                            selector.unregister(proc.stdin)
+                            proc.stdin.close()
+                    
+                    else:
+                        chunk = os.read(key.fd, 65536)
+                        if chunk:
+                            chunks.append(chunk)
+                        else:
+                            selector.unregister(proc.stdout)
+        
+        return b"".join(chunks)
+    
+    def _execute(
+            self,
+            prog: program.Program,
+            facts: typing.FrozenSet[literal.Literal],
+            options: typing.Tuple[str, ...],
+            timeout: numbers.Real = None,
+            max_memory: int = None,
+            max_cpu_seconds: numbers.Real = None
+    ) -> typing.Tuple[bytes, typing.Optional[solver_result.ResourceUsage]]:
+        """Runs DLV synchronously, and provides its raw output together with the resources that it used.
+        
+        DLV is started in a new session, such that it can be killed together with all of its children if the timeout
+        expires. Resource limits are applied before DLV receives its input, i.e., before it starts solving. On
+        platforms without resource accounting, DLV is run by means of ``Popen.communicate``, and the provided resource
+        usage is ``None``.
+        """
+        # assemble the resource limits
+        limits = []
+        if max_memory is not None:
+            limits.append((resource.RLIMIT_AS, (max_memory, max_memory)))
+        if max_cpu_seconds is not None:
+            cpu_seconds = math.ceil(max_cpu_seconds)
+            limits.append((resource.RLIMIT_CPU, (cpu_seconds, cpu_seconds + 1)))
+        
+        # if prlimit is not available, then the limits are set in the child before DLV is executed
+        use_prlimit = hasattr(resource, "prlimit")
+        preexec_fn = None
+        if limits and not use_prlimit:
+            preexec_fn = functools.partial(_set_limits, limits)
+        
+        # the single stages are measured only if there is an instrumentation
+        instrumentation = self._instrumentation
+        if instrumentation is not None:
+            stage_start = time.perf_counter()
+        
+        data = self._create_input(prog, facts)
+        
+        if instrumentation is not None:
+            stage_end = time.perf_counter()
+            instrumentation.observe(
+                    "create_input",
+                    stage_end - stage_start,
+                    {"facts": len(facts), "bytes": len(data)}
+            )
+            stage_start = stage_end
+        
+        # run DLV directly (i.e., without a shell), and pass the input via stdin
+        cmd = [self._dlv_path, *options, "--"]
+        start = time.monotonic()
+        rusage = None
+        with subprocess.Popen(
+                cmd,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                start_new_session=True,
+                preexec_fn=preexec_fn
+        ) as proc:
+            try:
+                if not _RESOURCE_ACCOUNTING:
+                    output, _ = proc.communicate(data, timeout)
+                
+                else:
+                    
+                    if use_prlimit:
+                        for res, lim in limits:
+                            try:
+                                resource.prlimit(proc.pid, res, lim)
+                            except ProcessLookupError:
+                                pass  # DLV terminated already, which is reported by its return code
+                    
+                    output = self._communicate(proc, data, timeout)
+                    
+                    # reap DLV, and collect its resource usage
+                    _, status, rusage = os.wait4(proc.pid, 0)
+                    proc.returncode = -os.WTERMSIG(status) if os.WIFSIGNALED(status) else os.WEXITSTATUS(status)
             
-            # collect inferences
-            inferences = set()
-            if r != "":
-                for x in r.split(", "):
-                    m = re.match(self.LITERAL_PATTERN, x)
-                    lit = literal.Literal(
-                            m.group("predicate"),
-                            m.group("terms").split(","),
-                            positive=m.group("sign") == ""
-                    )
-                    if lit not in facts:
-                        inferences.add(lit)
-
-            # create answer set
-            result_sets.append(answer_set.AnswerSet(facts, inferences))
+            finally:
+                
+                # if anything went wrong (e.g., the timeout expired), then DLV and all of its children are killed
+                if proc.returncode is None:
+                    _kill_session(proc)
+                    proc.wait()
         
-        return result_sets
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, cmd, output=output)
+        
+        usage = None
+        if rusage is not None:
+            usage = solver_result.ResourceUsage(
+                    time.monotonic() - start,
+                    rusage.ru_utime + rusage.ru_stime,
+                    rusage.ru_maxrss * (1 if sys.platform == "darwin" else 1024)  # ru_maxrss is in KiB on Linux
+            )
+        
+        if instrumentation is not None:
+            instrumentation.observe("solve", time.perf_counter() - stage_start, {"bytes": len(output)})
+        
+        return output, usage
+    
+    def _solve(
+            self,
+            prog: program.Program,
+            facts: typing.FrozenSet[literal.Literal],
+            options: typing.Tuple[str, ...],
+            **limits
+    ) -> solver_result.SolverResult:
+        """Runs DLV synchronously, and parses the answer sets that it computed.
+        
+        Any keyword args are passed on to :meth:`_execute` as resource limits.
+        """
+        output, usage = self._execute(prog, facts, options, **limits)
+        
+        instrumentation = self._instrumentation
+        if instrumentation is not None:
+            stage_start = time.perf_counter()
+        
+        answer_sets = self._parse_answer_sets(output.decode(), self._output_facts(facts, options))
+        
+        if instrumentation is not None:
+            instrumentation.observe(
+                    "parse",
+                    time.perf_counter() - stage_start,
+                    {"models": len(answer_sets), "atoms": sum(len(a.facts) + len(a.inferences) for a in answer_sets)}
+            )
+        
+        return solver_result.SolverResult(answer_sets, usage)
+    
+    def _run(
+            self,
+            prog: program.Program,
+            facts: typing.FrozenSet[literal.Literal],
+            options: typing.Tuple[str, ...],
+            lazy: bool = False,
+            **limits
+    ) -> typing.Union[solver_result.SolverResult, lazy_solver_result.LazySolverResult]:
+        """Runs DLV synchronously, and stores the result in the cache, if any.
+        
+        Any keyword args are passed on to :meth:`_solve` as resource limits. Lazy results are not added to the cache,
+        as this would require parsing them.
+        """
+        if lazy:
+            output, usage = self._execute(prog, facts, options, **limits)
+            return lazy_solver_result.LazySolverResult(output, self._output_facts(facts, options), usage)
+        
+        result = self._solve(prog, facts, options, **limits)
+        if self._result_cache is not None:
+            self._result_cache.put(prog, facts, result, options=options)
+        
+        return result
+    
+    @staticmethod
+    def _sanitize_limits(
+            timeout: typing.Optional[numbers.Real],
+            max_memory: typing.Optional[int],
+            max_cpu_seconds: typing.Optional[numbers.Real]
+    ) -> None:
+        """Sanitizes the resource limits that may be provided to :meth:`run`."""
+        for name, value, value_type in [
+                ("timeout", timeout, numbers.Real),
+                ("max_memory", max_memory, numbers.Integral),
+                ("max_cpu_seconds", max_cpu_seconds, numbers.Real)
+        ]:
+            if value is not None:
+                insanity.sanitize_type(name, value, value_type)
+                insanity.sanitize_range(name, value, minimum=0, min_inclusive=False)
+        if not _RESOURCE_ACCOUNTING and (max_memory is not None or max_cpu_seconds is not None):
+            raise ValueError("The parameters <max_memory> and <max_cpu_seconds> are not supported on this platform!")
+    
+    def run(
+            self,
+            path,
+            facts: typing.Iterable[literal.Literal],
+            max_models: int = None,
+            as_collection: bool = False,
+            output_predicates: typing.Iterable[str] = None,
+            include_facts: bool = True,
+            trusted: bool = False,
+            timeout: numbers.Real = None,
+            max_memory: int = None,
+            max_cpu_seconds: numbers.Real = None,
+            lazy: bool = False,
+            decompose: bool = False,
+            link_positions: typing.Mapping[str, typing.Iterable[int]] = None
+    ) -> typing.Union[
+            solver_result.SolverResult,
+            lazy_solver_result.LazySolverResult,
+            answer_set_collection.AnswerSetCollection,
+            answer_set_product.AnswerSetProduct
+    ]:
+        # sanitize args
+        prog, facts, options = self._sanitize_run_args(
+                path,
+                facts,
+                max_models,
+                output_predicates=output_predicates,
+                include_facts=include_facts,
+                trusted=trusted
+        )
+        self._sanitize_limits(timeout, max_memory, max_cpu_seconds)
+        link_positions = self._sanitize_link_positions(link_positions)
+        
+        # if the facts consist of independent components, then these are solved separately
+        if decompose:
+            components = self._decompose(facts, link_positions)
+            if len(components) > 1:
+                result = answer_set_product.AnswerSetProduct(
+                        self.run_many(
+                                prog,
+                                components,
+                                max_models=max_models,
+                                output_predicates=output_predicates,
+                                include_facts=include_facts,
+                                trusted=True,
+                                timeout=timeout,
+                                max_memory=max_memory,
+                                max_cpu_seconds=max_cpu_seconds,
+                                lazy=lazy
+                        ),
+                        max_len=max_models
+                )
+                if as_collection:
+                    return answer_set_collection.AnswerSetCollection(result)
+                else:
+                    return result
+        
+        # check whether the result has been computed before
+        result = None
+        if self._result_cache is not None:
+            result = self._result_cache.get(prog, facts, options=options)
+        
+        if result is None:
+            result = self._run(
+                    prog,
+                    facts,
+                    options,
+                    lazy=lazy,
+                    timeout=timeout,
+                    max_memory=max_memory,
+                    max_cpu_seconds=max_cpu_seconds
+            )
+        elif not isinstance(result, solver_result.SolverResult):
+            result = solver_result.SolverResult(result)
+        
+        if as_collection:
+            return answer_set_collection.AnswerSetCollection(result)
+        else:
+            return result
+    
+    def run_many(
+            self,
+            path,
+            fact_sets: typing.Iterable[typing.Iterable[literal.Literal]],
+            max_workers: int = None,
+            max_models: int = None,
+            output_predicates: typing.Iterable[str] = None,
+            include_facts: bool = True,
+            trusted: bool = False,
+            timeout: numbers.Real = None,
+            max_memory: int = None,
+            max_cpu_seconds: numbers.Real = None,
+            lazy: bool = False
+    ) -> typing.List[solver_result.SolverResult]:
+        results = {}
+        for idx, answer_sets in self.run_many_unordered(
+                path,
+                fact_sets,
+                max_workers=max_workers,
+                max_models=max_models,
+                output_predicates=output_predicates,
+                include_facts=include_facts,
+                trusted=trusted,
+                timeout=timeout,
+                max_memory=max_memory,
+                max_cpu_seconds=max_cpu_seconds,
+                lazy=lazy
+        ):
+            results[idx] = answer_sets
+        
+        return [results[idx] for idx in range(len(results))]
+    
+    def run_many_unordered(
+            self,
+            path,
+            fact_sets: typing.Iterable[typing.Iterable[literal.Literal]],
+            max_workers: int = None,
+            max_models: int = None,
+            output_predicates: typing.Iterable[str] = None,
+            include_facts: bool = True,
+            trusted: bool = False,
+            timeout: numbers.Real = None,
+            max_memory: int = None,
+            max_cpu_seconds: numbers.Real = None,
+            lazy: bool = False
+    ) -> typing.Iterator[typing.Tuple[int, solver_result.SolverResult]]:
+        # sanitize args
+        prog, _, _ = self._sanitize_run_args(path, [], max_models, output_predicates, include_facts)
+        self._sanitize_limits(timeout, max_memory, max_cpu_seconds)
+        insanity.sanitize_type("fact_sets", fact_sets, collections.abc.Iterable)
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        else:
+            insanity.sanitize_type("max_workers", max_workers, int)
+            insanity.sanitize_range("max_workers", max_workers, minimum=1)
+        
+        run = functools.partial(
+                self.run,
+                max_models=max_models,
+                output_predicates=output_predicates,
+                include_facts=include_facts,
+                trusted=trusted,
+                timeout=timeout,
+                max_memory=max_memory,
+                max_cpu_seconds=max_cpu_seconds,
+                lazy=lazy
+        )
+        
+        return self._run_many_unordered(prog, iter(fact_sets), max_workers, run)
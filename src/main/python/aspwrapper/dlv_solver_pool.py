@@ -0,0 +1,402 @@
+# -*- coding: utf-8 -*-
+
+
+import multiprocessing
+import numbers
+import os
+import threading
+import typing
+
+from concurrent import futures
+from concurrent.futures import process
+
+import insanity
+
+from aspwrapper import base_instrumentation
+from aspwrapper import base_result_cache
+from aspwrapper import dlv_solver
+from aspwrapper import literal
+from aspwrapper import program
+from aspwrapper import solver_result
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2018 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2018.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+_MAX_WORKER_PROGRAMS = 64
+"""int: The maximum number of programs that are cached by a worker process of a :class:`DlvSolverPool`."""
+
+_worker_programs = {}
+"""dict[str, program.Program]: Maps fingerprints to the programs that have been used in a worker process."""
+
+_worker_solver = None
+"""dlv_solver.DlvSolver: The solver that is used by a worker process of a :class:`DlvSolverPool`."""
+
+
+class _UnknownProgram(Exception):
+    """Indicates that a worker process has been provided with the fingerprint of a program that it has not cached."""
+
+
+def _init_worker(dlv_path: str) -> None:
+    """Initializes a worker process of a :class:`DlvSolverPool`."""
+    global _worker_solver
+    _worker_solver = dlv_solver.DlvSolver(dlv_path)
+
+
+def _get_worker_program(path: str, fingerprint: str, data: typing.Optional[bytes]) -> program.Program:
+    """Provides the program with the given fingerprint in a worker process, which is cached by its fingerprint.
+    
+    Raises:
+        _UnknownProgram: If the program is not cached, and ``data`` is ``None``.
+    """
+    prog = _worker_programs.get(fingerprint)
+    if prog is None:
+        if data is None:
+            raise _UnknownProgram(fingerprint)
+        if len(_worker_programs) >= _MAX_WORKER_PROGRAMS:
+            _worker_programs.clear()
+        prog = program.Program._create(path, data, fingerprint)
+        _worker_programs[fingerprint] = prog
+    
+    return prog
+
+
+def _ping_worker() -> int:
+    """Checks whether a worker process is responsive, and provides its process ID."""
+    return os.getpid()
+
+
+def _execute_in_worker(
+        prog: typing.Tuple[str, str, typing.Optional[bytes]],
+        facts: typing.FrozenSet[literal.Literal],
+        options: typing.Tuple[str, ...],
+        limits: typing.Dict[str, typing.Any],
+        instrumented: bool
+) -> typing.Tuple[
+        typing.Tuple[bytes, solver_result.ResourceUsage],
+        typing.List[typing.Tuple[str, float, typing.Dict[str, int]]]
+]:
+    """Same as :func:`_solve_in_worker`, but provides the raw output of DLV rather than parsed answer sets."""
+    log = _StageLog() if instrumented else None
+    _worker_solver._instrumentation = log
+    result = _worker_solver._execute(_get_worker_program(*prog), facts, options, **limits)
+    
+    return result, [] if log is None else log.events
+
+
+def _solve_in_worker(
+        prog: typing.Tuple[str, str, typing.Optional[bytes]],
+        facts: typing.FrozenSet[literal.Literal],
+        options: typing.Tuple[str, ...],
+        limits: typing.Dict[str, typing.Any],
+        instrumented: bool
+) -> typing.Tuple[solver_result.SolverResult, typing.List[typing.Tuple[str, float, typing.Dict[str, int]]]]:
+    """Runs DLV in a worker process of a :class:`DlvSolverPool`.
+    
+    The provided args have been sanitized by the pool already. The program is provided as path, fingerprint, and
+    contents of the program that has been passed to the pool, such that the worker solves exactly this program, even
+    if the file has been changed since. However, the contents are sent only if the worker reported that it has not
+    cached the program yet, and are ``None`` otherwise. If ``instrumented`` is ``True``, then the measurements of all
+    stages are recorded, and returned together with the result.
+    
+    Raises:
+        _UnknownProgram: If the worker has not cached the program, and its contents have not been provided.
+    """
+    log = _StageLog() if instrumented else None
+    _worker_solver._instrumentation = log
+    result = _worker_solver._solve(_get_worker_program(*prog), facts, options, **limits)
+    
+    return result, [] if log is None else log.events
+
+
+class _StageLog(base_instrumentation.BaseInstrumentation):
+    """Records the measurements of a job in a worker process, such that they can be replayed by the pool."""
+    
+    def __init__(self):
+        self.events = []
+    
+    def observe(self, stage: str, seconds: float, counts: typing.Dict[str, int]) -> None:
+        self.events.append((stage, seconds, counts))
+
+
+class DlvSolverPool(dlv_solver.DlvSolver):
+    """A :class:`dlv_solver.DlvSolver` that launches DLV from a pool of persistent worker processes.
+    
+    Launching DLV from a large Python process is comparatively expensive, since the whole process has to be forked
+    first, and parsing the output of DLV competes with all other threads of the process for the GIL. The pool keeps a
+    fixed number of small, pre-spawned (and, by default, forkserver-based) worker processes, which launch DLV, parse its
+    output, and send back the answer sets. The process-startup cost of DLV itself cannot be avoided this way, as every
+    job still executes the DLV binary.
+    
+    Workers are recycled after a configurable number of jobs, and a pool whose workers crashed is restarted
+    automatically. Apart from that, the pool behaves exactly like a ``DlvSolver``, i.e., it shares the program loading,
+    result caching, and argument checks. Note that :meth:`arun` and :meth:`iter_answer_sets` run DLV directly, as
+    they need control over the DLV process itself.
+    
+    Pools should be closed by means of :meth:`close`, or used as a context manager.
+    """
+    
+    #  CONSTRUCTOR  ####################################################################################################
+    
+    def __init__(
+            self,
+            dlv_path: str,
+            size: int = None,
+            max_jobs_per_worker: int = None,
+            start_method: str = None,
+            max_concurrency: int = None,
+            result_cache: base_result_cache.BaseResultCache = None,
+            options: typing.Iterable[str] = None,
+            instrumentation: base_instrumentation.BaseInstrumentation = None
+    ):
+        """Creates a new instance of ``DlvSolverPool``, and starts its worker processes.
+        
+        Args:
+            dlv_path (str): The path to the DLV executable.
+            size (int, optional): The number of worker processes. By default, this is the number of CPUs.
+            max_jobs_per_worker (int, optional): The (average) number of jobs after which workers are replaced by new
+                ones. By default, workers are never replaced.
+            start_method (str, optional): The ``multiprocessing`` start method for the workers. By default,
+                ``"forkserver"`` is used, if it is available on the current platform.
+            max_concurrency (int, optional): See :class:`dlv_solver.DlvSolver`.
+            result_cache (:class:`base_result_cache.BaseResultCache`, optional): See :class:`dlv_solver.DlvSolver`.
+            options (iterable[str], optional): See :class:`dlv_solver.DlvSolver`.
+            instrumentation (:class:`base_instrumentation.BaseInstrumentation`, optional): See
+                :class:`dlv_solver.DlvSolver`. The stages of every job are measured by the worker, and reported by
+                the pool.
+        
+        Raises:
+            TypeError: If ``size`` or ``max_jobs_per_worker`` is not an ``int``.
+            ValueError: If ``dlv_path`` does not refer to an existing file, if ``size`` or ``max_jobs_per_worker`` is
+                not positive, or if ``start_method`` is not supported.
+        """
+        super().__init__(
+                dlv_path,
+                max_concurrency=max_concurrency,
+                result_cache=result_cache,
+                options=options,
+                instrumentation=instrumentation
+        )
+        
+        # sanitize args
+        if size is None:
+            size = os.cpu_count() or 1
+        else:
+            insanity.sanitize_type("size", size, numbers.Integral)
+            insanity.sanitize_range("size", size, minimum=1)
+        if max_jobs_per_worker is not None:
+            insanity.sanitize_type("max_jobs_per_worker", max_jobs_per_worker, numbers.Integral)
+            insanity.sanitize_range("max_jobs_per_worker", max_jobs_per_worker, minimum=1)
+        if start_method is None:
+            if "forkserver" in multiprocessing.get_all_start_methods():
+                start_method = "forkserver"
+            else:
+                start_method = multiprocessing.get_start_method()
+        
+        # define attributes
+        self._closed = False
+        self._context = multiprocessing.get_context(start_method)
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        self._jobs = 0
+        self._max_jobs_per_worker = max_jobs_per_worker
+        self._size = size
+        
+        # start the workers
+        with self._executor_lock:
+            self._restart()
+    
+    #  MAGIC FUNCTIONS  ################################################################################################
+    
+    def __enter__(self) -> "DlvSolverPool":
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def max_jobs_per_worker(self) -> typing.Optional[int]:
+        """int: The (average) number of jobs after which workers are replaced, or ``None`` if they are never."""
+        return self._max_jobs_per_worker
+    
+    @property
+    def size(self) -> int:
+        """int: The number of worker processes."""
+        return self._size
+    
+    #  METHODS  ########################################################################################################
+    
+    def _restart(self, broken: futures.Executor = None) -> None:
+        """Replaces the current pool of workers by a new one, and waits until all of the new workers are ready.
+        
+        This method must be invoked with ``_executor_lock`` held.
+        
+        Args:
+            broken (futures.Executor, optional): If provided, then the pool is replaced only if this is still the
+                current one, which prevents multiple threads from restarting a pool that crashed more than once.
+        """
+        if self._closed:
+            raise RuntimeError("The pool has been closed already!")
+        if broken is not None and broken is not self._executor:
+            return
+        
+        # shut down the current workers, but let them finish their pending jobs
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+        
+        self._executor = futures.ProcessPoolExecutor(
+                max_workers=self._size,
+                mp_context=self._context,
+                initializer=_init_worker,
+                initargs=(os.path.abspath(self._dlv_path),)
+        )
+        self._jobs = 0
+        
+        # warm up the new workers
+        for f in [self._executor.submit(_ping_worker) for _ in range(self._size)]:
+            f.result()
+    
+    def _execute(
+            self,
+            prog: program.Program,
+            facts: typing.FrozenSet[literal.Literal],
+            options: typing.Tuple[str, ...],
+            **limits
+    ) -> typing.Tuple[bytes, solver_result.ResourceUsage]:
+        return self._submit(_execute_in_worker, prog, facts, options, limits)
+    
+    def _solve(
+            self,
+            prog: program.Program,
+            facts: typing.FrozenSet[literal.Literal],
+            options: typing.Tuple[str, ...],
+            **limits
+    ) -> solver_result.SolverResult:
+        return self._submit(_solve_in_worker, prog, facts, options, limits)
+    
+    def _submit(
+            self,
+            fn: typing.Callable,
+            prog: program.Program,
+            facts: typing.FrozenSet[literal.Literal],
+            options: typing.Tuple[str, ...],
+            limits: typing.Dict[str, typing.Any]
+    ):
+        """Runs the provided job in one of the workers, and replays the measurements that it recorded.
+        
+        The job refers to the program by its fingerprint only, and the program itself is sent only if the worker that
+        received the job has not cached it yet, in which case the job is submitted once more. If any of the workers
+        crashed, then the pool is restarted, and the job is submitted once more as well.
+        """
+        data = None
+        crashed = False
+        while True:
+            
+            # submit the job, and recycle the workers, if they have processed the maximum number of jobs already
+            with self._executor_lock:
+                if self._closed:
+                    raise RuntimeError("The pool has been closed already!")
+                if data is None:  # a job that is submitted once more together with the program was counted already
+                    if self._max_jobs_per_worker is not None and self._jobs >= self._size * self._max_jobs_per_worker:
+                        self._restart()
+                    self._jobs += 1
+                executor = self._executor
+                future = executor.submit(
+                        fn,
+                        (prog.path, prog.fingerprint, data),
+                        facts,
+                        options,
+                        limits,
+                        self._instrumentation is not None
+                )
+            
+            # wait for the result, and restart the pool, if any of its workers crashed
+            try:
+                result, events = future.result()
+                for e in events:
+                    self._instrumentation.observe(*e)
+                return result
+            except _UnknownProgram:
+                data = prog.data
+            except process.BrokenProcessPool:
+                with self._executor_lock:
+                    self._restart(broken=executor)
+                if crashed:
+                    raise
+                crashed = True
+    
+    def check_health(self, timeout: numbers.Real = 10.0) -> bool:
+        """Checks whether all of the workers are responsive, and restarts the pool, if any of them died.
+        
+        Workers that are busy with long-running jobs do not respond in time either, which is why a pool is restarted
+        only if it is broken or any of its worker processes is not alive anymore. Workers that are alive but did not
+        respond in time are reported as unhealthy, but keep running.
+        
+        Args:
+            timeout (numbers.Real, optional): The number of seconds to wait for the workers' responses.
+        
+        Returns:
+            bool: ``True``, if all workers responded in time, and ``False`` otherwise.
+        """
+        insanity.sanitize_type("timeout", timeout, numbers.Real)
+        insanity.sanitize_range("timeout", timeout, minimum=0)
+        
+        with self._executor_lock:
+            executor = self._executor
+        try:
+            pings = [executor.submit(_ping_worker) for _ in range(self._size)]
+            done, not_done = futures.wait(pings, timeout=timeout)
+            healthy = not not_done and all(f.exception() is None for f in done)
+            broken = any(isinstance(f.exception(), process.BrokenProcessPool) for f in done)
+        except process.BrokenProcessPool:
+            healthy = False
+            broken = True
+            not_done = ()
+        
+        # pings that have not been started yet must not delay any jobs
+        for f in not_done:
+            f.cancel()
+        
+        if not healthy and not broken:
+            broken = any(not p.is_alive() for p in list((executor._processes or {}).values()))
+        if broken:
+            with self._executor_lock:
+                self._restart(broken=executor)
+        
+        return healthy
+    
+    def close(self) -> None:
+        """Shuts down all worker processes after they finished their pending jobs."""
+        with self._executor_lock:
+            if not self._closed:
+                self._closed = True
+                self._executor.shutdown(wait=True)
@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+
+
+import bisect
+import collections.abc
+import json
+import numbers
+import threading
+import typing
+
+import insanity
+
+from aspwrapper import base_instrumentation
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2018 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2018.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class HistogramCollector(base_instrumentation.BaseInstrumentation):
+    """An instrumentation that aggregates the measurements of all stages in memory.
+    
+    For every stage, the collector maintains a histogram of the measured times, i.e., the number of observations that
+    fall into each of a fixed set of buckets, as well as their number and total, and the totals of all counts. The
+    aggregates can be exported as JSON or in the text format of Prometheus, which does not require any connection to a
+    Prometheus server.
+    """
+    
+    DEFAULT_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 60.0)
+    """tuple[float]: The default upper bounds of the buckets of the histograms, in seconds."""
+    
+    #  CONSTRUCTOR  ####################################################################################################
+    
+    def __init__(self, buckets: typing.Iterable[numbers.Real] = None, prefix: str = "aspwrapper"):
+        """Creates a new instance of ``HistogramCollector``.
+        
+        Args:
+            buckets (iterable[numbers.Real], optional): The upper bounds of the buckets of the histograms in seconds.
+                By default, :attr:`DEFAULT_BUCKETS` are used. An additional bucket for all larger times is always
+                added.
+            prefix (str, optional): The prefix of the names of exported metrics.
+        
+        Raises:
+            TypeError: If ``buckets`` is not an ``Iterable`` of numbers.
+            ValueError: If ``buckets`` is empty.
+        """
+        # sanitize args
+        if buckets is None:
+            buckets = self.DEFAULT_BUCKETS
+        else:
+            insanity.sanitize_type("buckets", buckets, collections.abc.Iterable)
+            buckets = list(buckets)
+            insanity.sanitize_iterable("buckets", buckets, elements_type=numbers.Real)
+            if not buckets:
+                raise ValueError("The parameter <buckets> must not be empty!")
+        
+        # define attributes
+        self._buckets = tuple(sorted(float(b) for b in set(buckets)))
+        self._lock = threading.Lock()
+        self._prefix = str(prefix)
+        self._stages = {}
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def buckets(self) -> typing.Tuple[float, ...]:
+        """tuple[float]: The upper bounds of the buckets of the histograms in seconds."""
+        return self._buckets
+    
+    #  METHODS  ########################################################################################################
+    
+    def observe(self, stage: str, seconds: float, counts: typing.Dict[str, int]) -> None:
+        with self._lock:
+            stats = self._stages.get(stage)
+            if stats is None:
+                stats = {"buckets": [0] * (len(self._buckets) + 1), "count": 0, "sum": 0.0, "counts": {}}
+                self._stages[stage] = stats
+            
+            stats["buckets"][bisect.bisect_left(self._buckets, seconds)] += 1
+            stats["count"] += 1
+            stats["sum"] += seconds
+            for key, value in counts.items():
+                stats["counts"][key] = stats["counts"].get(key, 0) + value
+    
+    def reset(self) -> None:
+        """Discards all measurements."""
+        with self._lock:
+            self._stages = {}
+    
+    def snapshot(self) -> typing.Dict[str, typing.Dict[str, typing.Any]]:
+        """Provides the current aggregates of all stages.
+        
+        Returns:
+            dict: Maps the name of every stage to a ``dict`` with the keys ``"count"`` (the number of observations),
+                ``"sum"`` (their total time), ``"buckets"`` (a list of pairs of upper bound and cumulative number of
+                observations, where the last upper bound is ``float("inf")``), and ``"counts"`` (the totals of all
+                counts).
+        """
+        with self._lock:
+            result = {}
+            for stage, stats in self._stages.items():
+                cumulative = 0
+                buckets = []
+                for bound, num in zip(self._buckets + (float("inf"),), stats["buckets"]):
+                    cumulative += num
+                    buckets.append((bound, cumulative))
+                result[stage] = {
+                        "buckets": buckets,
+                        "count": stats["count"],
+                        "counts": dict(stats["counts"]),
+                        "sum": stats["sum"]
+                }
+            
+            return result
+    
+    def to_json(self) -> str:
+        """Exports the current aggregates of all stages as JSON.
+        
+        Returns:
+            str: The JSON representation of :meth:`snapshot`, where the upper bound of the last bucket is ``"+Inf"``.
+        """
+        snapshot = self.snapshot()
+        for stats in snapshot.values():
+            stats["buckets"] = [["+Inf" if b == float("inf") else b, n] for b, n in stats["buckets"]]
+        
+        return json.dumps(snapshot, sort_keys=True)
+    
+    def to_prometheus(self) -> str:
+        """Exports the current aggregates of all stages in the text format of Prometheus.
+        
+        The times are exported as histogram ``<prefix>_stage_seconds``, and the counts as counter
+        ``<prefix>_stage_items_total``, both labelled by stage (and item).
+        
+        Returns:
+            str: The exported metrics.
+        """
+        snapshot = self.snapshot()
+        seconds = self._prefix + "_stage_seconds"
+        items = self._prefix + "_stage_items_total"
+        
+        lines = [
+                "# HELP {} The time spent in the single stages of solver runs.".format(seconds),
+                "# TYPE {} histogram".format(seconds)
+        ]
+        for stage, stats in sorted(snapshot.items()):
+            for bound, num in stats["buckets"]:
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append('{}_bucket{{stage="{}",le="{}"}} {}'.format(seconds, stage, le, num))
+            lines.append('{}_sum{{stage="{}"}} {!r}'.format(seconds, stage, stats["sum"]))
+            lines.append('{}_count{{stage="{}"}} {}'.format(seconds, stage, stats["count"]))
+        
+        lines.append("# HELP {} The numbers of items processed in the single stages of solver runs.".format(items))
+        lines.append("# TYPE {} counter".format(items))
+        for stage, stats in sorted(snapshot.items()):
+            for key, value in sorted(stats["counts"].items()):
+                lines.append('{}{{stage="{}",item="{}"}} {}'.format(items, stage, key, value))
+        
+        return "\n".join(lines) + "\n"
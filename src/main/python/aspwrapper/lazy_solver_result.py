@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+
+
+import array
+import collections.abc
+import typing
+
+from aspwrapper import answer_set
+from aspwrapper import dlv_parser
+from aspwrapper import literal
+from aspwrapper import solver_result
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2018 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2018.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class LazySolverResult(collections.abc.Sequence):
+    """The answer sets computed by a single run of a solver, which are parsed only if they are accessed.
+    
+    A ``LazySolverResult`` keeps the raw output of the solver together with the positions of the lines that describe
+    answer sets. Therefore, counting the answer sets does not require parsing any of them, and the memory used by the
+    result is about the size of the output rather than the size of all answer sets as Python objects. Every access by
+    index parses the according answer set anew, which means that the created :class:`literal.Literal`s are not kept
+    alive by the result. Iterating over the result parses every atom only once, though, such that occurrences of the
+    same atom in different answer sets share the same ``Literal``, just like for results that are parsed eagerly.
+    """
+    
+    _MODEL_PREFIXES = (b"{", b"Best model: {")
+    """tuple[bytes]: The prefixes of lines that describe answer sets."""
+    
+    #  CONSTRUCTOR  ####################################################################################################
+    
+    def __init__(
+            self,
+            output: bytes,
+            facts: typing.FrozenSet[literal.Literal],
+            usage: solver_result.ResourceUsage = None
+    ):
+        """Creates a new instance of ``LazySolverResult``.
+        
+        Args:
+            output (bytes): The output produced by DLV.
+            facts (frozenset[:class:`literal.Literal`]): The facts that appear in the output.
+            usage (:class:`solver_result.ResourceUsage`, optional): The resources used by the run.
+        """
+        starts = array.array("q")
+        ends = array.array("q")
+        
+        # locate all lines that describe answer sets, without creating any objects for them
+        pos = 0
+        length = len(output)
+        while pos < length:
+            end = output.find(b"\n", pos)
+            if end < 0:
+                end = length
+            if output.startswith(self._MODEL_PREFIXES, pos):
+                line_end = end
+                while line_end > pos and output[line_end - 1] in b" \t\r":
+                    line_end -= 1
+                if output[line_end - 1:line_end] == b"}":
+                    starts.append(pos)
+                    ends.append(line_end)
+            pos = end + 1
+        
+        self._ends = ends
+        self._facts = facts
+        self._output = output
+        self._starts = starts
+        self._usage = usage
+    
+    #  MAGIC FUNCTIONS  ################################################################################################
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._starts)))]
+        if index < 0:
+            index += len(self._starts)
+        if not 0 <= index < len(self._starts):
+            raise IndexError("The provided index is out of range: {}".format(index))
+        
+        return self._create(dlv_parser.parse_model(self._line(index)))
+    
+    def __iter__(self) -> typing.Iterator[answer_set.AnswerSet]:
+        for model in dlv_parser.parse_models(self._line(i) for i in range(len(self._starts))):
+            yield self._create(model)
+    
+    def __len__(self) -> int:
+        return len(self._starts)
+    
+    def __str__(self) -> str:
+        return "LazySolverResult(answer sets = {}, bytes = {})".format(len(self._starts), len(self._output))
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def usage(self) -> typing.Optional[solver_result.ResourceUsage]:
+        """:class:`solver_result.ResourceUsage`: The resources used by the run."""
+        return self._usage
+    
+    #  METHODS  ########################################################################################################
+    
+    def _create(self, model: typing.List[literal.Literal]) -> answer_set.AnswerSet:
+        """Creates an answer set from the provided literals of a parsed model."""
+        facts = self._facts
+        return answer_set.AnswerSet._create(facts, frozenset([lit for lit in model if lit not in facts]))
+    
+    def _line(self, index: int) -> str:
+        """Provides the line of output that describes the answer set at the provided index."""
+        return self._output[self._starts[index]:self._ends[index]].decode()
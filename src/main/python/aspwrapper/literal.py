@@ -1,7 +1,8 @@
 # -*- coding: utf-8 -*-
 
 
-import collections
+import collections.abc
+import sys
 import typing
 
 
@@ -36,7 +37,14 @@ __status__ = "Development"
 
 
 class Literal(object):
-    """Instances of this class represent single literals."""
+    """Instances of this class represent single literals.
+    
+    Literals are immutable, and compare equal if and only if they agree on their signs, predicate symbols, and terms.
+    To keep large numbers of literals cheap, the class uses ``__slots__``, all symbols are interned, and the hash of
+    each literal is computed once on creation.
+    """
+    
+    __slots__ = ("_hash", "_positive", "_predicate", "_terms", "_validated")
     
     #  CONSTRUCTORS  ###################################################################################################
     
@@ -59,13 +67,13 @@ class Literal(object):
             ValueError: If ``predicate`` or any element in ``terms`` is the empty string.
         """
         # sanitize args
-        predicate = str(predicate)
+        predicate = sys.intern(str(predicate))
         if len(predicate) == 0:
             raise ValueError("The parameter <predicate> must not be the empty string!")
         if terms is not None:
-            if not isinstance(terms, collections.Iterable):
+            if not isinstance(terms, collections.abc.Iterable):
                 raise TypeError("The parameter <terms> has to be iterable!")
-            terms = tuple(str(t) for t in terms)
+            terms = tuple(sys.intern(str(t)) for t in terms)
             for t in terms:
                 if len(t) == 0:
                     raise ValueError("None of the terms can be the empty string!")
@@ -74,17 +82,59 @@ class Literal(object):
         positive = bool(positive)
         
         # define attributes
-        self._positive = positive
-        self._predicate = predicate
-        self._terms = terms
+        _set_hash(self, hash((positive, predicate, terms)))
+        _set_positive(self, positive)
+        _set_predicate(self, predicate)
+        _set_terms(self, terms)
+        _set_validated(self, None)  # set by solvers once the literal has been checked, and not pickled
+    
+    @classmethod
+    def _create(cls, predicate: str, terms: typing.Tuple[str, ...], positive: bool) -> "Literal":
+        """Creates a new instance of ``Literal`` from arguments that are known to be legal.
+        
+        In contrast to the constructor, this method neither checks nor converts the provided args, which is used for
+        creating literals from trusted sources, e.g., decoded data. Therefore, all symbols should be interned already.
+        
+        Args:
+            predicate (str): The predicate symbol that appears in the literal.
+            terms (tuple[str]): The terms that appear in the literal.
+            positive (bool): Indicates whether the literal is positive.
+        
+        Returns:
+            :class:`Literal`: The created literal.
+        """
+        lit = cls.__new__(cls)
+        _set_hash(lit, hash((positive, predicate, terms)))
+        _set_positive(lit, positive)
+        _set_predicate(lit, predicate)
+        _set_terms(lit, terms)
+        _set_validated(lit, None)
+        return lit
     
     #  MAGIC FUNCTIONS  ################################################################################################
     
     def __eq__(self, other) -> bool:
-        return isinstance(other, Literal) and str(other) == str(self)
+        return self is other or (
+                isinstance(other, Literal) and
+                self._hash == other._hash and
+                self._predicate == other._predicate and
+                self._terms == other._terms and
+                self._positive == other._positive
+        )
+    
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("Literals are immutable!")
     
     def __hash__(self) -> int:
-        return hash(str(self))
+        return self._hash
+    
+    def __reduce__(self):
+        # the cached hash must not be pickled, as the hashes of strings differ between processes
+        return Literal, (self._predicate, self._terms, self._positive)
+    
+    def __setattr__(self, name: str, value) -> None:
+        # literals are shared between answer sets, and their hashes are cached, which is why they must not change
+        raise AttributeError("Literals are immutable!")
     
     def __str__(self) -> str:
         return "{}{}({})".format(
@@ -109,3 +159,47 @@ class Literal(object):
     def terms(self) -> typing.Tuple[str]:
         """tuple: The terms that appear in the literal."""
         return self._terms
+    
+    #  METHODS  ########################################################################################################
+    
+    def _mark_validated(self, key: object) -> None:
+        """Records that the literal has been checked by a solver that is identified by the provided key.
+        
+        This marker is the only attribute of a literal that may change after its creation, as it does not affect its
+        value. It is not pickled.
+        
+        Args:
+            key (object): The key that identifies the check.
+        """
+        _set_validated(self, key)
+
+
+# the setters of the slots of literals, which bypass Literal.__setattr__, and are faster than object.__setattr__
+_set_hash = Literal._hash.__set__
+_set_positive = Literal._positive.__set__
+_set_predicate = Literal._predicate.__set__
+_set_terms = Literal._terms.__set__
+_set_validated = Literal._validated.__set__
+
+
+def sanitize_literals(arg_name: str, arg_value: typing.Iterable) -> None:
+    """Ensures that all elements of the provided ``Iterable`` are instances of :class:`Literal`.
+    
+    This is equivalent to ``insanity.sanitize_iterable(arg_name, arg_value, elements_type=Literal)``, but considerably
+    faster for large collections of literals.
+    
+    Args:
+        arg_name (str): The name of the parameter being sanitized.
+        arg_value (iterable): The ``Iterable`` to check.
+    
+    Raises:
+        TypeError: If any element of ``arg_value`` is not a :class:`Literal`.
+    """
+    for v in arg_value:
+        if type(v) is not Literal and not isinstance(v, Literal):
+            raise TypeError(
+                    "The type of the elements of <{}> has to be Literal, but {} was encountered!".format(
+                            arg_name,
+                            type(v).__name__
+                    )
+            )
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+
+
+import hashlib
+import os
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2018 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2018.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class Program(object):
+    """Instances of this class represent ASP programs that have been loaded from disk.
+    
+    A ``Program`` keeps the contents of the according file in memory, already encoded as ``bytes``. It can be passed
+    to a solver instead of the path of an ASP program, which avoids reading the file on every invocation of the
+    solver.
+    """
+    
+    #  CONSTRUCTOR  ####################################################################################################
+    
+    def __init__(self, path: str):
+        """Creates a new instance of ``Program`` by loading the ASP program at the provided path.
+        
+        Args:
+            path (str): The path of the ASP program to load.
+        
+        Raises:
+            ValueError: If ``path`` does not refer to an existing file.
+        """
+        path = str(path)
+        if not os.path.isfile(path):
+            raise ValueError("The provided <path> does not refer to an existing file: '{}'!".format(path))
+        
+        with open(path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            data = f.read()
+        
+        # define attributes
+        self._data = data
+        self._fingerprint = None
+        self._mtime = stat.st_mtime_ns
+        self._path = path
+        self._size = stat.st_size
+    
+    @classmethod
+    def _create(cls, path: str, data: bytes, fingerprint: str) -> "Program":
+        """Creates a new instance of ``Program`` from contents that have been loaded before, e.g., by another process.
+        
+        The file at ``path`` is not accessed at all, which is why a program created this way is always considered as
+        stale.
+        
+        Args:
+            path (str): The path that the program has been loaded from.
+            data (bytes): The contents of the program file.
+            fingerprint (str): The fingerprint of ``data``.
+        
+        Returns:
+            :class:`Program`: The created program.
+        """
+        prog = cls.__new__(cls)
+        prog._data = data
+        prog._fingerprint = fingerprint
+        prog._mtime = None
+        prog._path = path
+        prog._size = len(data)
+        return prog
+    
+    #  MAGIC FUNCTIONS  ################################################################################################
+    
+    def __str__(self) -> str:
+        return "Program(path = '{}', size = {})".format(self._path, self._size)
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def data(self) -> bytes:
+        """bytes: The contents of the program file."""
+        return self._data
+    
+    @property
+    def fingerprint(self) -> str:
+        """str: A hex digest that identifies the contents of the program."""
+        if self._fingerprint is None:
+            self._fingerprint = hashlib.sha256(self._data).hexdigest()
+        return self._fingerprint
+    
+    @property
+    def path(self) -> str:
+        """str: The path that the program has been loaded from."""
+        return self._path
+    
+    #  METHODS  ########################################################################################################
+    
+    def is_stale(self) -> bool:
+        """Checks whether the program file has been changed (or removed) since the program has been loaded.
+        
+        Changes are detected based on the modification time and size of the file.
+        
+        Returns:
+            bool: ``True``, if the file has been changed, and ``False`` otherwise.
+        """
+        try:
+            stat = os.stat(self._path)
+        except OSError:
+            return True
+        return stat.st_mtime_ns != self._mtime or stat.st_size != self._size
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+
+
+import collections
+import numbers
+import threading
+import time
+import typing
+
+import insanity
+
+from aspwrapper import answer_set
+from aspwrapper import base_result_cache
+from aspwrapper import literal
+from aspwrapper import program
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2018 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2018.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class ResultCache(base_result_cache.BaseResultCache):
+    """An in-memory cache for the answer sets that are computed by a solver.
+    
+    The cache is bounded, and evicts entries in least-recently-used order. Furthermore, entries may optionally expire
+    after a fixed time to live.
+    
+    Every lookup provides a new list, but the answer sets contained in it are shared between all lookups of the same
+    result. Therefore, they must not be modified. Instances of this class are thread-safe.
+    """
+    
+    #  CONSTRUCTOR  ####################################################################################################
+    
+    def __init__(self, max_size: int = 1024, ttl: numbers.Real = None):
+        """Creates a new instance of ``ResultCache``.
+        
+        Args:
+            max_size (int, optional): The maximum number of results that are kept in the cache. By default, this is
+                ``1024``.
+            ttl (numbers.Real, optional): The number of seconds after which cached results expire. By default, cached
+                results do not expire.
+        
+        Raises:
+            TypeError: If any of the args has an illegal type.
+            ValueError: If ``max_size`` or ``ttl`` is not positive.
+        """
+        # sanitize args
+        insanity.sanitize_type("max_size", max_size, int)
+        insanity.sanitize_range("max_size", max_size, minimum=1)
+        if ttl is not None:
+            insanity.sanitize_type("ttl", ttl, numbers.Real)
+            insanity.sanitize_range("ttl", ttl, minimum=0, min_inclusive=False)
+        
+        super().__init__()
+        
+        # define attributes
+        self._entries = collections.OrderedDict()  # maps keys to pairs of results and expiry times
+        self._lock = threading.Lock()
+        self._max_size = max_size
+        self._ttl = ttl
+    
+    #  MAGIC FUNCTIONS  ################################################################################################
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def max_size(self) -> int:
+        """int: The maximum number of results that are kept in the cache."""
+        return self._max_size
+    
+    @property
+    def ttl(self) -> typing.Optional[numbers.Real]:
+        """numbers.Real: The number of seconds after which cached results expire, or ``None``."""
+        return self._ttl
+    
+    #  METHODS  ########################################################################################################
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+    
+    def get(
+            self,
+            prog: program.Program,
+            facts: typing.FrozenSet[literal.Literal],
+            options: typing.Tuple[str, ...] = ()
+    ) -> typing.Optional[typing.List[answer_set.AnswerSet]]:
+        key = (prog.fingerprint, facts, options)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] is not None and entry[1] <= time.monotonic():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+        
+        return list(entry[0])
+    
+    def invalidate(self, prog: program.Program = None) -> None:
+        with self._lock:
+            if prog is None:
+                self._entries.clear()
+            else:
+                fingerprint = prog.fingerprint
+                for key in [k for k in self._entries if k[0] == fingerprint]:
+                    del self._entries[key]
+    
+    def put(
+            self,
+            prog: program.Program,
+            facts: typing.FrozenSet[literal.Literal],
+            answer_sets: typing.Iterable[answer_set.AnswerSet],
+            options: typing.Tuple[str, ...] = ()
+    ) -> None:
+        key = (prog.fingerprint, facts, options)
+        expiry = None if self._ttl is None else time.monotonic() + self._ttl
+        with self._lock:
+            self._entries[key] = (tuple(answer_sets), expiry)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
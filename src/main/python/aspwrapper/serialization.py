@@ -0,0 +1,294 @@
+# -*- coding: utf-8 -*-
+
+"""This module implements a compact binary encoding of answer sets.
+
+The encoding consists of a table of all predicate and term symbols that appear in the encoded answer sets, a table of
+all literals, which refer to symbols by their indices, and the answer sets themselves, which refer to literals by their
+indices. As all of the answer sets computed for the same facts share these facts, every distinct set of facts is
+encoded only once. All of the tables and lists of indices are encoded as packed little-endian arrays of integers,
+whose width is the smallest one out of 1, 2, and 4 bytes that fits all of their elements, and all other integers are
+encoded as unsigned LEB128 varints. Arrays are aligned to their width, and decoded without copying them by casting
+slices of a ``memoryview`` of the encoded data. Therefore, the data may be provided as any bytes-like object,
+including an ``mmap``.
+
+Version 1 of the encoding, which encoded all integers as varints, is not supported anymore, and data in this format
+is rejected by :func:`loads`.
+"""
+
+
+import array
+import itertools
+import operator
+import sys
+import typing
+
+from aspwrapper import answer_set  # answer_set imports this module as well, hence the quoted annotations
+from aspwrapper import literal
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2018 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2018.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+FORMAT_VERSION = 2
+"""int: The version of the encoding that is created by :func:`dumps`."""
+
+_ARRAY_TYPES = {1: "B", 2: "H", 4: "I"}
+"""dict[int, str]: Maps the possible widths of the elements of arrays in bytes to the according type codes."""
+
+_get_positive = operator.attrgetter("_positive")
+"""callable: Provides the sign of a literal."""
+
+_get_predicate = operator.attrgetter("_predicate")
+"""callable: Provides the predicate of a literal."""
+
+_get_terms = operator.attrgetter("_terms")
+"""callable: Provides the terms of a literal."""
+
+
+def _read_array(data: memoryview, pos: int) -> typing.Tuple[typing.Sequence[int], int]:
+    """Reads a packed array of integers from the provided data.
+    
+    On little-endian machines, the array is provided as a view of ``data`` rather than a copy.
+    
+    Args:
+        data (memoryview): The data to read from.
+        pos (int): The position of the array in ``data``.
+    
+    Returns:
+        tuple[sequence[int], int]: The elements of the array, and the position right after it.
+    
+    Raises:
+        ValueError: If ``data`` ends before the array is complete or the array has an illegal width.
+    """
+    width, pos = _read_varint(data, pos)
+    type_code = _ARRAY_TYPES.get(width)
+    if type_code is None:
+        raise ValueError("The provided data contains an array of illegal width: {}".format(width))
+    size, pos = _read_varint(data, pos)
+    pos += -pos % width  # skip the padding that aligns the array
+    end = pos + size * width
+    if end > len(data):
+        raise ValueError("The provided data is truncated!")
+    
+    values = data[pos:end].cast(type_code)
+    if sys.byteorder != "little":
+        values = array.array(type_code, values)
+        values.byteswap()
+    
+    return values, end
+
+
+def _read_varint(data: memoryview, pos: int) -> typing.Tuple[int, int]:
+    """Reads a varint from the provided data.
+    
+    Args:
+        data (memoryview): The data to read from.
+        pos (int): The position of the varint in ``data``.
+    
+    Returns:
+        tuple[int, int]: The value of the varint, and the position right after it.
+    
+    Raises:
+        ValueError: If ``data`` ends before the varint is complete.
+    """
+    value = 0
+    shift = 0
+    while True:
+        if pos >= len(data):
+            raise ValueError("The provided data is truncated!")
+        b = data[pos]
+        pos += 1
+        value |= (b & 0x7f) << shift
+        if b < 0x80:
+            return value, pos
+        shift += 7
+
+
+def _write_array(out: bytearray, values: typing.Sequence[int]) -> None:
+    """Appends the provided non-negative integers as packed array to the given buffer."""
+    max_value = max(values, default=0)
+    width = 1 if max_value < 1 << 8 else 2 if max_value < 1 << 16 else 4
+    _write_varint(out, width)
+    _write_varint(out, len(values))
+    out += bytes(-len(out) % width)  # align the array, such that it can be cast without copying it
+    values = array.array(_ARRAY_TYPES[width], values)
+    if sys.byteorder != "little":
+        values.byteswap()
+    out += values.tobytes()
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    """Appends the provided non-negative integer as varint to the given buffer."""
+    while value >= 0x80:
+        out.append((value & 0x7f) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def dumps(answer_sets: typing.Iterable["answer_set.AnswerSet"]) -> bytes:
+    """Encodes the provided answer sets.
+    
+    Args:
+        answer_sets (iterable[:class:`answer_set.AnswerSet`]): The answer sets to encode.
+    
+    Returns:
+        bytes: The encoded answer sets.
+    """
+    answer_sets = list(answer_sets)
+    
+    # collect all distinct sets of facts, which are shared between answer sets
+    fact_sets = {}  # maps (frozen) sets of facts to their indices
+    for a in answer_sets:
+        fact_sets.setdefault(a.facts, len(fact_sets))
+    
+    # assign indices to all distinct literals
+    literal_indices = dict.fromkeys(itertools.chain(
+            itertools.chain.from_iterable(fact_sets),
+            itertools.chain.from_iterable(a.inferences for a in answer_sets)
+    ))
+    for idx, lit in enumerate(literal_indices):
+        literal_indices[lit] = idx
+    
+    # assign indices to all symbols
+    predicates = list(map(_get_predicate, literal_indices))
+    terms = list(map(_get_terms, literal_indices))
+    symbols = dict.fromkeys(itertools.chain(predicates, itertools.chain.from_iterable(terms)))
+    for idx, sym in enumerate(symbols):
+        symbols[sym] = idx
+    get_symbol_index = symbols.__getitem__
+    
+    out = bytearray()
+    _write_varint(out, FORMAT_VERSION)
+    
+    # encode symbol table as the lengths of all symbols followed by their concatenation
+    encoded = [s.encode() for s in symbols]
+    _write_array(out, [len(s) for s in encoded])
+    out += b"".join(encoded)
+    
+    # encode literal table as separate arrays of (predicate and sign), arity, and terms
+    signs = map(_get_positive, literal_indices)
+    _write_array(out, [p << 1 | (not pos) for p, pos in zip(map(get_symbol_index, predicates), signs)])
+    _write_array(out, list(map(len, terms)))
+    _write_array(out, list(map(get_symbol_index, itertools.chain.from_iterable(terms))))
+    
+    # encode fact sets
+    get_index = literal_indices.__getitem__
+    _write_varint(out, len(fact_sets))
+    for facts in fact_sets:
+        _write_array(out, list(map(get_index, facts)))
+    
+    # encode answer sets
+    _write_varint(out, len(answer_sets))
+    for a in answer_sets:
+        _write_varint(out, fact_sets[a.facts])
+        _write_array(out, list(map(get_index, a.inferences)))
+    
+    return bytes(out)
+
+
+def _decode(data: memoryview, pos: int) -> typing.Tuple[typing.List["answer_set.AnswerSet"], int]:
+    """Decodes the answer sets that are encoded in the provided data, starting right after the version."""
+    
+    # decode symbol table
+    lengths, pos = _read_array(data, pos)
+    symbols = []
+    for length in lengths:
+        if pos + length > len(data):
+            raise ValueError("The provided data is truncated!")
+        symbols.append(sys.intern(str(data[pos:pos + length], "utf-8")))
+        pos += length
+    
+    # decode literal table
+    heads, pos = _read_array(data, pos)
+    arities, pos = _read_array(data, pos)
+    term_indices, pos = _read_array(data, pos)
+    if len(heads) != len(arities):
+        raise ValueError("The provided data contains an inconsistent literal table!")
+    terms = list(map(symbols.__getitem__, term_indices))
+    create_literal = literal.Literal._create
+    literals = []
+    start = 0
+    for head, arity in zip(heads, arities):
+        end = start + arity
+        literals.append(create_literal(symbols[head >> 1], tuple(terms[start:end]), not head & 1))
+        start = end
+    if start != len(terms):
+        raise ValueError("The provided data contains an inconsistent literal table!")
+    
+    # decode fact sets
+    get_literal = literals.__getitem__
+    num_fact_sets, pos = _read_varint(data, pos)
+    fact_sets = []
+    for _ in range(num_fact_sets):
+        indices, pos = _read_array(data, pos)
+        fact_sets.append(frozenset(map(get_literal, indices)))
+    
+    # decode answer sets
+    create_answer_set = answer_set.AnswerSet._create
+    num_models, pos = _read_varint(data, pos)
+    answer_sets = []
+    for _ in range(num_models):
+        facts_idx, pos = _read_varint(data, pos)
+        indices, pos = _read_array(data, pos)
+        answer_sets.append(create_answer_set(fact_sets[facts_idx], frozenset(map(get_literal, indices))))
+    
+    return answer_sets, pos
+
+
+def loads(data: typing.Union[bytes, bytearray, memoryview]) -> typing.List["answer_set.AnswerSet"]:
+    """Decodes answer sets that have been encoded by means of :func:`dumps`.
+    
+    Args:
+        data (bytes-like): The encoded answer sets, e.g., ``bytes``, a ``memoryview``, or an ``mmap``.
+    
+    Returns:
+        list[:class:`answer_set.AnswerSet`]: The decoded answer sets.
+    
+    Raises:
+        ValueError: If ``data`` is not a valid encoding of answer sets.
+    """
+    data = memoryview(data).cast("B")
+    
+    # check the version of the encoding
+    version, pos = _read_varint(data, 0)
+    if version == 1:
+        raise ValueError("Version 1 of the encoding is not supported anymore!")
+    if version != FORMAT_VERSION:
+        raise ValueError("Unsupported version of the encoding: {}!".format(version))
+    
+    try:
+        answer_sets, pos = _decode(data, pos)
+    except IndexError:
+        raise ValueError("The provided data contains an illegal reference!") from None
+    
+    if pos != len(data):
+        raise ValueError("The provided data contains trailing bytes!")
+    
+    return answer_sets
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+
+
+import typing
+
+from aspwrapper import answer_set
+from aspwrapper import serialization
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2018 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2018.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class ResourceUsage(object):
+    """Describes the resources that were used by a single run of a solver."""
+    
+    __slots__ = ("_cpu_time", "_max_rss", "_wall_time")
+    
+    def __init__(self, wall_time: float, cpu_time: float, max_rss: int):
+        """Creates a new instance of ``ResourceUsage``.
+        
+        Args:
+            wall_time (float): The elapsed real time in seconds.
+            cpu_time (float): The consumed CPU time, i.e., user plus system time, in seconds.
+            max_rss (int): The peak resident set size in bytes.
+        """
+        self._cpu_time = float(cpu_time)
+        self._max_rss = int(max_rss)
+        self._wall_time = float(wall_time)
+    
+    #  MAGIC FUNCTIONS  ################################################################################################
+    
+    def __reduce__(self):
+        return ResourceUsage, (self._wall_time, self._cpu_time, self._max_rss)
+    
+    def __str__(self) -> str:
+        return "ResourceUsage(wall_time = {:.3f}s, cpu_time = {:.3f}s, max_rss = {} bytes)".format(
+                self._wall_time,
+                self._cpu_time,
+                self._max_rss
+        )
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def cpu_time(self) -> float:
+        """float: The consumed CPU time, i.e., user plus system time, in seconds."""
+        return self._cpu_time
+    
+    @property
+    def max_rss(self) -> int:
+        """int: The peak resident set size in bytes."""
+        return self._max_rss
+    
+    @property
+    def wall_time(self) -> float:
+        """float: The elapsed real time in seconds."""
+        return self._wall_time
+
+
+class SolverResult(list):
+    """The list of answer sets computed by a single run of a solver, together with the resources used by the run.
+    
+    Since this is a ``list``, it can be used wherever the answer sets computed by a solver used to be expected.
+    """
+    
+    def __init__(self, answer_sets: typing.Iterable[answer_set.AnswerSet] = (), usage: ResourceUsage = None):
+        """Creates a new instance of ``SolverResult``.
+        
+        Args:
+            answer_sets (iterable[:class:`answer_set.AnswerSet`], optional): The computed answer sets.
+            usage (:class:`ResourceUsage`, optional): The resources used by the run.
+        """
+        super().__init__(answer_sets)
+        self._usage = usage
+    
+    #  MAGIC FUNCTIONS  ################################################################################################
+    
+    def __reduce__(self):
+        # results are pickled by means of the compact encoding, which is both smaller and faster to decode than the
+        # default pickle of the answer sets, e.g., when results are sent from worker processes to the calling process
+        return SolverResult._from_encoded, (self.to_bytes(), self._usage)
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def usage(self) -> typing.Optional[ResourceUsage]:
+        """:class:`ResourceUsage`: The resources used by the run, or ``None`` if the result was not computed just now,
+        e.g., because it was retrieved from a cache.
+        """
+        return self._usage
+    
+    #  METHODS  ########################################################################################################
+    
+    @classmethod
+    def _from_encoded(cls, data: bytes, usage: typing.Optional[ResourceUsage]) -> "SolverResult":
+        """Restores a pickled result from its encoded answer sets and resource usage."""
+        return cls(serialization.loads(data), usage)
+    
+    @classmethod
+    def from_bytes(cls, data: typing.Union[bytes, bytearray, memoryview]) -> "SolverResult":
+        """Decodes answer sets that have been encoded by means of :meth:`to_bytes` or :func:`serialization.dumps`.
+        
+        Notice that the resource usage is not part of the encoding, which is why the decoded result does not have one.
+        
+        Args:
+            data (bytes-like): The encoded answer sets, e.g., ``bytes``, a ``memoryview``, or an ``mmap``.
+        
+        Returns:
+            :class:`SolverResult`: The decoded answer sets.
+        
+        Raises:
+            ValueError: If ``data`` is not a valid encoding of answer sets.
+        """
+        return cls(serialization.loads(data))
+    
+    def to_bytes(self) -> bytes:
+        """Encodes the answer sets by means of the compact binary encoding implemented by :mod:`serialization`.
+        
+        Returns:
+            bytes: The encoded answer sets.
+        """
+        return serialization.dumps(self)
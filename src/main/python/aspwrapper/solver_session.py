@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+
+
+import collections.abc
+import typing
+
+import insanity
+
+from aspwrapper import answer_set
+from aspwrapper import literal
+from aspwrapper import program
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2018 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2018.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class SolverSession(object):
+    """A session for solving the same program for a sequence of sets of facts that differ by small deltas.
+    
+    A session maintains the current set of facts, which is updated by means of :meth:`add_facts` and
+    :meth:`retract_facts` in time proportional to the size of the update, and :meth:`solve` computes the answer sets for
+    the current facts. Sessions are created by means of :meth:`base_solver.BaseSolver.session`.
+    
+    This implementation invokes the solver from scratch for every call of :meth:`solve`, which is the best that can be
+    done for solvers that are run as separate processes, like DLV. However, if the solver has a result cache, then
+    returning to any previous set of facts is served from the cache. Solvers that support incremental solving natively
+    can provide subclasses that override :meth:`_add`, :meth:`_retract`, and :meth:`solve`, like
+    :class:`clingo_session.ClingoSession` does.
+    """
+    
+    #  CONSTRUCTOR  ####################################################################################################
+    
+    def __init__(self, solver, prog: program.Program, facts: typing.Iterable[literal.Literal] = ()):
+        """Creates a new instance of ``SolverSession``.
+        
+        Args:
+            solver (:class:`base_solver.BaseSolver`): The solver to use.
+            prog (:class:`program.Program`): The program to solve.
+            facts (iterable[:class:`literal.Literal`], optional): The initial facts.
+        
+        Raises:
+            TypeError: If ``facts`` is not an ``Iterable`` of instances of :class:`literal.Literal`.
+        """
+        self._facts = set()
+        self._program = prog
+        self._snapshot = frozenset()
+        self._solver = solver
+        self.add_facts(facts)
+    
+    #  MAGIC FUNCTIONS  ################################################################################################
+    
+    def __enter__(self) -> "SolverSession":
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+    
+    def __str__(self) -> str:
+        return "SolverSession(program = {}, facts = {})".format(self._program.path, len(self._facts))
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def facts(self) -> typing.FrozenSet[literal.Literal]:
+        """frozenset[:class:`literal.Literal`]: The current facts."""
+        if self._snapshot is None:
+            self._snapshot = frozenset(self._facts)
+        return self._snapshot
+    
+    @property
+    def program(self) -> program.Program:
+        """:class:`program.Program`: The program that is solved in this session."""
+        return self._program
+    
+    @property
+    def solver(self):
+        """:class:`base_solver.BaseSolver`: The solver that is used in this session."""
+        return self._solver
+    
+    #  METHODS  ########################################################################################################
+    
+    @staticmethod
+    def _sanitize_facts(facts: typing.Iterable[literal.Literal]) -> typing.List[literal.Literal]:
+        """Sanitizes the facts provided to :meth:`add_facts` or :meth:`retract_facts`."""
+        insanity.sanitize_type("facts", facts, collections.abc.Iterable)
+        facts = list(facts)
+        literal.sanitize_literals("facts", facts)
+        return facts
+    
+    def _add(self, facts: typing.List[literal.Literal]) -> None:
+        """Adds the provided (sanitized) facts to the current ones."""
+        self._facts.update(facts)
+    
+    def _retract(self, facts: typing.List[literal.Literal]) -> None:
+        """Removes the provided (sanitized) facts from the current ones."""
+        self._facts.difference_update(facts)
+    
+    def add_facts(self, facts: typing.Iterable[literal.Literal]) -> None:
+        """Adds the provided facts to the current ones.
+        
+        Args:
+            facts (iterable[:class:`literal.Literal`]): The facts to add. Facts that are present already are ignored.
+        
+        Raises:
+            TypeError: If ``facts`` is not an ``Iterable`` of instances of :class:`literal.Literal`.
+        """
+        facts = self._sanitize_facts(facts)
+        if facts:
+            self._add(facts)
+            self._snapshot = None
+    
+    def close(self) -> None:
+        """Releases all resources held by the session, which does not do anything for this implementation."""
+    
+    def retract_facts(self, facts: typing.Iterable[literal.Literal]) -> None:
+        """Removes the provided facts from the current ones.
+        
+        Args:
+            facts (iterable[:class:`literal.Literal`]): The facts to remove. Facts that are not present are ignored.
+        
+        Raises:
+            TypeError: If ``facts`` is not an ``Iterable`` of instances of :class:`literal.Literal`.
+        """
+        facts = self._sanitize_facts(facts)
+        if facts:
+            self._retract(facts)
+            self._snapshot = None
+    
+    def solve(self, max_models: int = None, **kwargs) -> typing.List[answer_set.AnswerSet]:
+        """Computes the answer sets of the program for the current facts.
+        
+        Args:
+            max_models (int, optional): The maximum number of answer sets to compute. By default, all answer sets are
+                computed.
+            **kwargs: Any further solver-specific keyword args of :meth:`base_solver.BaseSolver.run`.
+        
+        Returns:
+            list[:class:`answer_set.AnswerSet`]: The computed answer sets.
+        """
+        return self._solver.run(self._program, self.facts, max_models=max_models, **kwargs)
@@ -0,0 +1,324 @@
+# -*- coding: utf-8 -*-
+
+
+import os
+import sqlite3
+import threading
+import time
+import typing
+
+import insanity
+
+from aspwrapper import answer_set
+from aspwrapper import base_result_cache
+from aspwrapper import literal
+from aspwrapper import program
+from aspwrapper import serialization
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2018 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2018.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class SqliteResultCache(base_result_cache.BaseResultCache):
+    """A persistent cache for the answer sets that are computed by solvers, which is backed by an SQLite database.
+    
+    The same database may be used by any number of threads and processes at the same time, which allows for sharing
+    results between, e.g., short-lived worker processes. Results are stored in the compact binary encoding that is
+    implemented by :mod:`serialization`. If the total size of all stored results exceeds the specified maximum, then
+    the results that have been accessed least recently are evicted.
+    
+    To keep cache hits free of writes, which would serialize concurrent readers, the time of the last access of a
+    result is recorded with a coarse resolution only, and skipped if the database is locked by another writer at that
+    moment. Furthermore, the total size of all results is maintained in a separate table rather than computed anew.
+    """
+    
+    _SCHEMA = (
+            "CREATE TABLE IF NOT EXISTS results ("
+            "    program  TEXT    NOT NULL,"
+            "    facts    TEXT    NOT NULL,"
+            "    data     BLOB    NOT NULL,"
+            "    size     INTEGER NOT NULL,"
+            "    accessed REAL    NOT NULL,"
+            "    PRIMARY KEY (program, facts)"
+            ")",
+            "CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed)",
+            "CREATE TABLE IF NOT EXISTS metadata ("
+            "    name     TEXT    NOT NULL PRIMARY KEY,"
+            "    value    INTEGER NOT NULL"
+            ")",
+            "INSERT OR IGNORE INTO metadata (name, value) SELECT 'size', COALESCE(SUM(size), 0) FROM results"
+    )
+    """tuple[str]: The statements that create the database schema."""
+    
+    #  CONSTRUCTOR  ####################################################################################################
+    
+    def __init__(self, path: str, max_size: int = None, timeout: float = 30.0, access_resolution: float = 60.0):
+        """Creates a new instance of ``SqliteResultCache``.
+        
+        Args:
+            path (str): The path of the database file, which is created if it does not exist.
+            max_size (int, optional): The maximum total number of bytes of all stored results. By default, this is not
+                limited.
+            timeout (float, optional): The number of seconds to wait for locks held by other connections to the
+                database. By default, this is ``30``.
+            access_resolution (float, optional): The number of seconds that the recorded time of the last access of a
+                result may lag behind. Accesses within this time after the recorded one are not written to the
+                database. By default, this is ``60``.
+        
+        Raises:
+            TypeError: If any of the args has an illegal type.
+            ValueError: If ``max_size`` or ``timeout`` is not positive, or ``access_resolution`` is negative.
+        """
+        # sanitize args
+        path = str(path)
+        if max_size is not None:
+            insanity.sanitize_type("max_size", max_size, int)
+            insanity.sanitize_range("max_size", max_size, minimum=1)
+        insanity.sanitize_type("timeout", timeout, (int, float))
+        insanity.sanitize_range("timeout", timeout, minimum=0, min_inclusive=False)
+        insanity.sanitize_type("access_resolution", access_resolution, (int, float))
+        insanity.sanitize_range("access_resolution", access_resolution, minimum=0)
+        
+        super().__init__()
+        
+        # define attributes
+        self._access_resolution = access_resolution
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._max_size = max_size
+        self._path = path
+        self._timeout = timeout
+        
+        # create the database schema
+        conn = self._connection()
+        with conn:
+            for stmt in self._SCHEMA:
+                conn.execute(stmt)
+    
+    #  MAGIC FUNCTIONS  ################################################################################################
+    
+    def __len__(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM results").fetchone()[0]
+    
+    #  PROPERTIES  #####################################################################################################
+    
+    @property
+    def access_resolution(self) -> float:
+        """float: The number of seconds that the recorded time of the last access of a result may lag behind."""
+        return self._access_resolution
+    
+    @property
+    def max_size(self) -> typing.Optional[int]:
+        """int: The maximum total number of bytes of all stored results, or ``None``."""
+        return self._max_size
+    
+    @property
+    def path(self) -> str:
+        """str: The path of the database file."""
+        return self._path
+    
+    @property
+    def size(self) -> int:
+        """int: The total number of bytes of all stored results."""
+        return self._connection().execute("SELECT value FROM metadata WHERE name = 'size'").fetchone()[0]
+    
+    #  METHODS  ########################################################################################################
+    
+    def _connection(self) -> sqlite3.Connection:
+        """Provides the connection to the database that is used by the current thread.
+        
+        SQLite connections must not be shared across threads or processes. Therefore, every thread uses a connection
+        of its own, and connections are recreated in processes that have been forked.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self._path, timeout=self._timeout)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+    
+    @staticmethod
+    def _add_size(conn: sqlite3.Connection, delta: int) -> None:
+        """Adds the provided number of bytes to the recorded total size of all results.
+        
+        Args:
+            conn (sqlite3.Connection): The connection to use, which has to be in a write transaction.
+            delta (int): The number of bytes to add, which may be negative.
+        """
+        conn.execute("UPDATE metadata SET value = value + ? WHERE name = 'size'", (delta,))
+    
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Removes least recently accessed results until the total size of all results does not exceed the maximum.
+        
+        Args:
+            conn (sqlite3.Connection): The connection to use, which has to be in a write transaction.
+        """
+        excess = conn.execute("SELECT value FROM metadata WHERE name = 'size'").fetchone()[0] - self._max_size
+        if excess <= 0:
+            return
+        
+        victims = []
+        freed = 0
+        for rowid, size in conn.execute("SELECT rowid, size FROM results ORDER BY accessed"):
+            victims.append((rowid,))
+            freed += size
+            if freed >= excess:
+                break
+        conn.executemany("DELETE FROM results WHERE rowid = ?", victims)
+        self._add_size(conn, -freed)
+    
+    def _record_access(self, conn: sqlite3.Connection, key: typing.Tuple[str, str], accessed: float) -> None:
+        """Records an access of a result on a best-effort basis.
+        
+        The access is not recorded if another connection holds the write lock, since waiting for it would defeat the
+        purpose of a cache hit. Eviction is still approximately least recently used, as later hits record the access.
+        
+        Args:
+            conn (sqlite3.Connection): The connection to use.
+            key (tuple[str, str]): The program fingerprint and facts digest of the accessed result.
+            accessed (float): The time of the access.
+        """
+        conn.execute("PRAGMA busy_timeout = 0")
+        try:
+            with conn:
+                conn.execute("UPDATE results SET accessed = ? WHERE program = ? AND facts = ?", (accessed,) + key)
+        except sqlite3.OperationalError:
+            pass  # the database is locked
+        finally:
+            conn.execute("PRAGMA busy_timeout = {}".format(int(self._timeout * 1000)))
+    
+    def _remove(self, conn: sqlite3.Connection, key: typing.Tuple[str, str], data: bytes) -> None:
+        """Removes a single result, unless it has been replaced already.
+        
+        Args:
+            conn (sqlite3.Connection): The connection to use.
+            key (tuple[str, str]): The program fingerprint and facts digest of the result to remove.
+            data (bytes): The encoded answer sets of the result to remove.
+        """
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")  # the size of the result must not change before it is removed
+            row = conn.execute(
+                    "SELECT rowid, size FROM results WHERE program = ? AND facts = ? AND data = ?",
+                    key + (data,)
+            ).fetchone()
+            if row is not None:
+                conn.execute("DELETE FROM results WHERE rowid = ?", (row[0],))
+                self._add_size(conn, -row[1])
+    
+    def clear(self) -> None:
+        self.invalidate()
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+    
+    def close(self) -> None:
+        """Closes the connection to the database that is used by the current thread.
+        
+        The cache may still be used after it has been closed, in which case a new connection is opened.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            if self._local.pid == os.getpid():
+                conn.close()
+            self._local.conn = None
+    
+    def get(
+            self,
+            prog: program.Program,
+            facts: typing.FrozenSet[literal.Literal],
+            options: typing.Tuple[str, ...] = ()
+    ) -> typing.Optional[typing.List[answer_set.AnswerSet]]:
+        key = (prog.fingerprint, self.facts_digest(facts, options))
+        conn = self._connection()
+        row = conn.execute("SELECT data, accessed FROM results WHERE program = ? AND facts = ?", key).fetchone()
+        
+        # results that cannot be decoded (e.g., because they are corrupt) are removed, and treated as misses
+        answer_sets = None
+        if row is not None:
+            try:
+                answer_sets = serialization.loads(row[0])
+            except ValueError:
+                self._remove(conn, key, row[0])
+        
+        with self._lock:
+            if answer_sets is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        if answer_sets is None:
+            return None
+        
+        # record the access for the sake of eviction, unless the recorded one is recent enough
+        now = time.time()
+        if now - row[1] >= self._access_resolution:
+            self._record_access(conn, key, now)
+        
+        return answer_sets
+    
+    def invalidate(self, prog: program.Program = None) -> None:
+        conn = self._connection()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")  # the sizes of the deleted results must not change before they are deleted
+            if prog is None:
+                conn.execute("DELETE FROM results")
+                conn.execute("UPDATE metadata SET value = 0 WHERE name = 'size'")
+            else:
+                key = (prog.fingerprint,)
+                freed = conn.execute("SELECT COALESCE(SUM(size), 0) FROM results WHERE program = ?", key).fetchone()[0]
+                conn.execute("DELETE FROM results WHERE program = ?", key)
+                self._add_size(conn, -freed)
+    
+    def put(
+            self,
+            prog: program.Program,
+            facts: typing.FrozenSet[literal.Literal],
+            answer_sets: typing.Iterable[answer_set.AnswerSet],
+            options: typing.Tuple[str, ...] = ()
+    ) -> None:
+        data = serialization.dumps(answer_sets)
+        
+        # results that exceed the maximum size on their own are not stored at all
+        if self._max_size is not None and len(data) > self._max_size:
+            return
+        
+        key = (prog.fingerprint, self.facts_digest(facts, options))
+        conn = self._connection()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")  # the size of a replaced result must not change before it is replaced
+            row = conn.execute("SELECT size FROM results WHERE program = ? AND facts = ?", key).fetchone()
+            conn.execute(
+                    "INSERT OR REPLACE INTO results (program, facts, data, size, accessed) VALUES (?, ?, ?, ?, ?)",
+                    key + (data, len(data), time.time())
+            )
+            self._add_size(conn, len(data) - (0 if row is None else row[0]))
+            if self._max_size is not None:
+                self._evict(conn)
@@ -38,3 +38,6 @@ DLV_PATH = "src/test/resources/test-dlv.bin"
 
 ONTOLOGY = "src/test/resources/ontology.asp"
 """str: The (relative) path to the ontology to be used for testing."""
+
+CLINGO_ONTOLOGY = "src/test/resources/ontology.lp"
+"""str: The (relative) path to the ontology to be used for testing clingo, which is written in clingo's syntax."""
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+
+
+import unittest
+
+from aspwrapper import answer_set
+from aspwrapper import answer_set_collection
+from aspwrapper import literal
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2018 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2018.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+@unittest.skipIf(answer_set_collection.np is None, "NumPy is not installed")
+class AnswerSetCollectionTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.facts = frozenset([literal.Literal("node", ["a"]), literal.Literal("node", ["b"])])
+        self.red_a = literal.Literal("red", ["a"])
+        self.red_b = literal.Literal("red", ["b"])
+        self.green_a = literal.Literal("green", ["a"])
+        self.green_b = literal.Literal("green", ["b"])
+        self.answer_sets = [
+                answer_set.AnswerSet(self.facts, [self.red_a, self.green_b]),
+                answer_set.AnswerSet(self.facts, [self.green_a, self.red_b]),
+                answer_set.AnswerSet(self.facts, [self.red_a, self.red_b])
+        ]
+        self.coll = answer_set_collection.AnswerSetCollection(self.answer_sets)
+    
+    def test_sequence(self):
+        # CHECK: the collection provides the same answer sets in the same order
+        self.assertEqual(3, len(self.coll))
+        self.assertEqual(self.answer_sets, list(self.coll))
+        self.assertEqual(self.answer_sets[-1], self.coll[-1])
+        self.assertEqual(self.answer_sets[1:], list(self.coll[1:]))
+        with self.assertRaises(IndexError):
+            self.coll[3]
+        
+        # CHECK: all answer sets share the same set of facts
+        self.assertIs(self.coll[0].facts, self.coll[2].facts)
+        
+        # CHECK: the matrix has one row per answer set and one column per distinct inference
+        self.assertEqual((3, 4), self.coll.matrix.shape)
+        self.assertEqual(4, len(self.coll.atoms))
+        with self.assertRaises(ValueError):
+            self.coll.matrix[0, 0] = False
+    
+    def test_consequences(self):
+        # CHECK: brave and cautious consequences are computed correctly
+        self.assertEqual(
+                self.facts | {self.red_a, self.red_b, self.green_a, self.green_b},
+                self.coll.brave_consequences()
+        )
+        self.assertEqual(self.facts, self.coll.cautious_consequences())
+        self.assertEqual(self.facts | {self.red_a}, self.coll[[0, 2]].cautious_consequences())
+        
+        # CHECK: literals that are facts in some and inferences in other answer sets are considered as well
+        coll = answer_set_collection.AnswerSetCollection(
+                [answer_set.AnswerSet([self.red_a], []), answer_set.AnswerSet([], [self.red_a])]
+        )
+        self.assertEqual(frozenset([self.red_a]), coll.cautious_consequences())
+        
+        # CHECK: an empty collection does not have any consequences
+        empty = answer_set_collection.AnswerSetCollection([])
+        self.assertEqual(frozenset(), empty.brave_consequences())
+        self.assertEqual(frozenset(), empty.cautious_consequences())
+    
+    def test_filter(self):
+        # CHECK: filtering selects the correct answer sets
+        self.assertEqual(self.answer_sets[::2], list(self.coll.filter(required=[self.red_a])))
+        self.assertEqual([self.answer_sets[0]], list(self.coll.filter(required=[self.red_a], forbidden=[self.red_b])))
+        self.assertEqual(self.answer_sets, list(self.coll.filter(required=self.facts)))
+        self.assertEqual([], list(self.coll.filter(forbidden=[literal.Literal("node", ["a"])])))
+        self.assertEqual([], list(self.coll.filter(required=[literal.Literal("unknown")])))
+    
+    def test_frequencies(self):
+        # CHECK: literals are counted correctly
+        freq = self.coll.frequencies()
+        self.assertEqual(3, freq[literal.Literal("node", ["a"])])
+        self.assertEqual(2, freq[self.red_a])
+        self.assertEqual(1, freq[self.green_b])
+        self.assertEqual(6, len(freq))
+        
+        # CHECK: literals are counted per predicate and answer set
+        counts = self.coll.predicate_counts()
+        self.assertEqual([2, 2, 2], counts["node"].tolist())
+        self.assertEqual([1, 1, 2], counts["red"].tolist())
+        self.assertEqual([1, 1, 0], counts["green"].tolist())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+
+
+import itertools
+import unittest
+
+from aspwrapper import answer_set
+from aspwrapper import answer_set_product
+from aspwrapper import literal
+from aspwrapper import solver_result
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2018 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2018.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class AnswerSetProductTest(unittest.TestCase):
+    
+    def setUp(self):
+        facts_1 = frozenset([literal.Literal("person", ["a"])])
+        facts_2 = frozenset([literal.Literal("person", ["b"])])
+        self.factors = [
+                solver_result.SolverResult(
+                        [
+                                answer_set.AnswerSet(facts_1, [literal.Literal("hero", ["a"])]),
+                                answer_set.AnswerSet(facts_1, [literal.Literal("villain", ["a"])])
+                        ],
+                        solver_result.ResourceUsage(1.0, 0.5, 100)
+                ),
+                solver_result.SolverResult(
+                        [
+                                answer_set.AnswerSet(facts_2, [literal.Literal("hero", ["b"])]),
+                                answer_set.AnswerSet(facts_2, [literal.Literal("villain", ["b"])]),
+                                answer_set.AnswerSet(facts_2, [])
+                        ],
+                        solver_result.ResourceUsage(2.0, 1.5, 50)
+                )
+        ]
+        self.target = [
+                answer_set.AnswerSet(a.facts | b.facts, a.inferences | b.inferences)
+                for a, b in itertools.product(*self.factors)
+        ]
+    
+    def test_getitem(self):
+        product = answer_set_product.AnswerSetProduct(self.factors)
+        
+        # CHECK: the combinations are created correctly, with the last component varying fastest
+        self.assertEqual(6, len(product))
+        self.assertEqual(self.target, [product[i] for i in range(len(product))])
+        self.assertEqual(self.target[-1], product[-1])
+        self.assertEqual(self.target[1:5:2], product[1:5:2])
+        self.assertIs(product[0].facts, product[5].facts)
+        
+        # CHECK: indices out of range cause an IndexError
+        with self.assertRaises(IndexError):
+            product[6]
+        with self.assertRaises(IndexError):
+            product[-7]
+    
+    def test_iter(self):
+        # CHECK: iterating provides the same answer sets as indexing
+        self.assertEqual(self.target, list(answer_set_product.AnswerSetProduct(self.factors)))
+        
+        # CHECK: the number of combinations can be limited
+        product = answer_set_product.AnswerSetProduct(self.factors, max_len=4)
+        self.assertEqual(4, len(product))
+        self.assertEqual(self.target[:4], list(product))
+        
+        # CHECK: a component without any answer sets yields an empty product
+        self.assertEqual([], list(answer_set_product.AnswerSetProduct([self.factors[0], []])))
+        self.assertEqual(0, len(answer_set_product.AnswerSetProduct([self.factors[0], []])))
+    
+    def test_usage(self):
+        # CHECK: the resource usage of the components is aggregated
+        usage = answer_set_product.AnswerSetProduct(self.factors).usage
+        self.assertEqual(2.0, usage.wall_time)
+        self.assertEqual(2.0, usage.cpu_time)
+        self.assertEqual(100, usage.max_rss)
+        self.assertIsNone(answer_set_product.AnswerSetProduct([list(f) for f in self.factors]).usage)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,10 +1,12 @@
 # -*- coding: utf-8 -*-
 
 
+import pickle
 import unittest
 
 from aspwrapper import answer_set
 from aspwrapper import literal
+from aspwrapper import serialization
 
 
 __author__ = "Patrick Hohenecker"
@@ -50,6 +52,79 @@ class AnswerSetTest(unittest.TestCase):
                 answer_set.AnswerSet([literal.Literal("fact-2")], [literal.Literal("fact-1")])
         )
     
+    def test_create(self):
+        facts = frozenset([literal.Literal("fact-1")])
+        inferences = frozenset([literal.Literal("fact-2")])
+        
+        # CHECK: answer sets created via the trusted path equal those created via the constructor, and use the
+        # provided sets as they are
+        ans = answer_set.AnswerSet._create(facts, inferences)
+        self.assertEqual(answer_set.AnswerSet(facts, inferences), ans)
+        self.assertIs(facts, ans.facts)
+        self.assertIs(inferences, ans.inferences)
+    
+    def test_by_predicate(self):
+        person_a = literal.Literal("person", ["a"])
+        person_b = literal.Literal("person", ["b"])
+        not_person_c = literal.Literal("person", ["c"], positive=False)
+        knows = literal.Literal("person", ["a", "b"])
+        ans = answer_set.AnswerSet([person_a, knows], [person_b, not_person_c, literal.Literal("hero", ["a"])])
+        
+        # CHECK: literals are retrieved by predicate, arity, sign, and first term
+        self.assertCountEqual([person_a, person_b, not_person_c, knows], ans.by_predicate("person"))
+        self.assertCountEqual([person_a, person_b, not_person_c], ans.by_predicate("person", arity=1))
+        self.assertCountEqual([person_a, person_b], ans.by_predicate("person", arity=1, positive=True))
+        self.assertCountEqual([not_person_c], ans.by_predicate("person", positive=False))
+        self.assertCountEqual([person_a, knows], ans.by_predicate("person", first_term="a"))
+        self.assertCountEqual([knows], ans.by_predicate("person", arity=2, first_term="a"))
+        self.assertEqual((), ans.by_predicate("villain"))
+        self.assertEqual((), ans.by_predicate("person", arity=3, positive=True))
+        self.assertEqual((), ans.by_predicate("person", first_term="d"))
+    
+    def test_from_bytes_and_to_bytes(self):
+        ans = answer_set.AnswerSet(
+                [literal.Literal("fact-1", ["a"])],
+                [literal.Literal("fact-2", ["a", "b"], positive=False)]
+        )
+        
+        # CHECK: encoding and decoding an answer set reproduces the original one
+        self.assertEqual(ans, answer_set.AnswerSet.from_bytes(ans.to_bytes()))
+        self.assertEqual(ans, answer_set.AnswerSet.from_bytes(memoryview(ans.to_bytes())))
+        
+        # CHECK: data that does not encode exactly one answer set causes a ValueError
+        with self.assertRaises(ValueError):
+            answer_set.AnswerSet.from_bytes(ans.to_bytes()[:-1])
+        with self.assertRaises(ValueError):
+            answer_set.AnswerSet.from_bytes(serialization.dumps([ans, ans]))
+        with self.assertRaises(ValueError):
+            answer_set.AnswerSet.from_bytes(serialization.dumps([]))
+    
+    def test_holds(self):
+        ans = answer_set.AnswerSet([literal.Literal("fact-1")], [literal.Literal("fact-2")])
+        
+        # CHECK: both facts and inferences hold, and nothing else does
+        self.assertTrue(ans.holds(literal.Literal("fact-1")))
+        self.assertTrue(ans.holds(literal.Literal("fact-2")))
+        self.assertFalse(ans.holds(literal.Literal("fact-2", positive=False)))
+        self.assertFalse(ans.holds(literal.Literal("fact-3")))
+    
+    def test_immutable(self):
+        ans = answer_set.AnswerSet([literal.Literal("fact-1")], [literal.Literal("fact-2")])
+        
+        # CHECK: neither the answer set nor its facts and inferences can be modified
+        self.assertIsInstance(ans.facts, frozenset)
+        self.assertIsInstance(ans.inferences, frozenset)
+        with self.assertRaises(AttributeError):
+            ans.facts = set()
+        with self.assertRaises(AttributeError):
+            ans.some_attribute = "value"
+        
+        # CHECK: equal answer sets have equal hashes
+        self.assertEqual(
+                hash(ans),
+                hash(answer_set.AnswerSet((literal.Literal("fact-1"),), {literal.Literal("fact-2")}))
+        )
+    
     def test_init(self):
         # CHECK: facts has to be an iterable of literals -> otherwise a TypeError is raised
         with self.assertRaises(TypeError):
@@ -101,3 +176,40 @@ class AnswerSetTest(unittest.TestCase):
                 {literal.Literal("fact-1"), literal.Literal("fact-2"), literal.Literal("fact-3")},
                 set(ans)
         )
+    
+    def test_pickle(self):
+        facts = frozenset([literal.Literal("fact-1")])
+        answer_sets = [
+                answer_set.AnswerSet(facts, [literal.Literal("fact-2")]),
+                answer_set.AnswerSet(facts, [literal.Literal("fact-3")])
+        ]
+        
+        # CHECK: pickled answer sets are restored correctly, and still share their facts
+        restored = pickle.loads(pickle.dumps(answer_sets))
+        self.assertEqual(answer_sets, restored)
+        self.assertIs(restored[0].facts, restored[1].facts)
+    
+    def test_project(self):
+        person = literal.Literal("person", ["a"])
+        hero = literal.Literal("hero", ["a"])
+        ans = answer_set.AnswerSet([person], [hero, literal.Literal("villain", ["b"])])
+        
+        # CHECK: projections retain only the selected predicates, and distinguish facts from inferences
+        self.assertEqual(answer_set.AnswerSet([person], [hero]), ans.project(["person", "hero"]))
+        self.assertEqual(answer_set.AnswerSet([], [hero]), ans.project(["hero"]))
+        self.assertEqual(answer_set.AnswerSet([], []), ans.project(["unknown"]))
+        
+        # CHECK: a literal that is both a fact and an inference is retained as both of them
+        ans = answer_set.AnswerSet([person], [person, hero])
+        projected = ans.project(["person"])
+        self.assertEqual(frozenset([person]), projected.facts)
+        self.assertEqual(frozenset([person]), projected.inferences)
+        self.assertEqual(ans.inferences, ans.project(["person", "hero"]).inferences)
+    
+    def test_shared_facts(self):
+        facts = frozenset([literal.Literal("fact-1"), literal.Literal("fact-2")])
+        
+        # CHECK: a frozenset of facts is shared between answer sets rather than copied
+        ans_1 = answer_set.AnswerSet(facts, [literal.Literal("fact-3")])
+        ans_2 = answer_set.AnswerSet(facts, [literal.Literal("fact-4")])
+        self.assertIs(ans_1.facts, ans_2.facts)
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+
+
+import subprocess
+import tempfile
+import unittest
+
+import aspwrapper_test
+
+from aspwrapper import answer_set
+from aspwrapper import clingo_session
+from aspwrapper import clingo_solver
+from aspwrapper import literal
+from aspwrapper import result_cache
+from aspwrapper import solver_result
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2018 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2018.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+@unittest.skipIf(clingo_solver.clingo is None, "clingo is not installed")
+class ClingoSessionTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.ontology = aspwrapper_test.CLINGO_ONTOLOGY
+        self.solver = clingo_solver.ClingoSolver(result_cache=result_cache.ResultCache())
+        self.session = self.solver.session(self.ontology)
+    
+    def tearDown(self):
+        self.session.close()
+    
+    def test_add_and_retract_facts(self):
+        person = literal.Literal("person", ["patrick"])
+        
+        # CHECK: clingo solvers create sessions that solve incrementally
+        self.assertIsInstance(self.session, clingo_session.ClingoSession)
+        self.assertEqual(frozenset([person]), self.solver.session(self.ontology, [person]).facts)
+        
+        # CHECK: facts with illegal symbols cause a ValueError, and do not change the current facts
+        self.session.add_facts([person])
+        with self.assertRaises(ValueError):
+            self.session.add_facts([literal.Literal("hero", ["patrick"]), literal.Literal("Person", ["patrick"])])
+        with self.assertRaises(ValueError):
+            self.solver.session(self.ontology, [literal.Literal("person", ["Patrick"])])
+        self.assertEqual(frozenset([person]), self.session.facts)
+        self.assertEqual(2, len(self.session.solve()))
+    
+    def test_solve(self):
+        person = literal.Literal("person", ["patrick"])
+        hero = literal.Literal("hero", ["patrick"])
+        other = literal.Literal("person", ["jane"])
+        solver = clingo_solver.ClingoSolver()
+        session = solver.session(self.ontology, [person])
+        
+        # CHECK: the answer sets are the same as if the solver was run for the current facts
+        for add, retract in [
+                ([], []),
+                ([hero], []),
+                ([], [person]),
+                ([person], [hero]),
+                ([other], []),
+                ([], [person, other]),
+                ([hero, other], [])
+        ]:
+            session.add_facts(add)
+            session.retract_facts(retract)
+            result = session.solve()
+            self.assertIsInstance(result, solver_result.SolverResult)
+            self.assertCountEqual(solver.run(self.ontology, session.facts), result)
+            self.assertEqual(1, len(session.solve(max_models=1)))
+        
+        # CHECK: retracting and adding facts that have been grounded before do not ground the program anew
+        control = session._control
+        session.retract_facts([hero, other])
+        session.add_facts([hero])
+        self.assertEqual([answer_set.AnswerSet([hero], [person])], session.solve())
+        self.assertIs(control, session._control)
+        
+        # CHECK: adding a fact that is new to the session grounds the program anew
+        session.add_facts([literal.Literal("person", ["john"])])
+        self.assertEqual(2, len(session.solve()))
+        self.assertIsNot(control, session._control)
+        session.close()
+    
+    def test_solve_cached(self):
+        person = literal.Literal("person", ["patrick"])
+        
+        # CHECK: results are looked up in and added to the solver's result cache
+        self.session.add_facts([person])
+        result = self.session.solve()
+        self.assertEqual(0, self.solver.result_cache.hits)
+        self.assertEqual(result, self.solver.run(self.ontology, [person]))
+        self.assertEqual(1, self.solver.result_cache.hits)
+        self.session.retract_facts([person])
+        self.session.solve()
+        self.session.add_facts([person])
+        self.assertEqual(result, self.session.solve())
+        self.assertEqual(2, self.solver.result_cache.hits)
+    
+    def test_solve_timeout(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".lp") as f:
+            f.write("{ a(1..60) } .\n:- #count { X : a(X) } = 31 .\n")
+            f.flush()
+            
+            # CHECK: the search is stopped if the timeout expires, and the session can still be used afterwards
+            with self.solver.session(f.name) as session:
+                with self.assertRaises(subprocess.TimeoutExpired):
+                    session.solve(timeout=0.2)
+                self.assertEqual(5, len(session.solve(max_models=5, timeout=60)))
+
+
+if __name__ == "__main__":
+    unittest.main()
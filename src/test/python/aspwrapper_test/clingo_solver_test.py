@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+
+
+import asyncio
+import subprocess
+import tempfile
+import unittest
+
+import aspwrapper_test
+
+from aspwrapper import answer_set
+from aspwrapper import clingo_solver
+from aspwrapper import histogram_collector
+from aspwrapper import literal
+from aspwrapper import result_cache
+from aspwrapper import solver_result
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2018 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2018.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+@unittest.skipIf(clingo_solver.clingo is None, "clingo is not installed")
+class ClingoSolverTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.ontology = aspwrapper_test.CLINGO_ONTOLOGY
+        self.solver = clingo_solver.ClingoSolver()
+    
+    def test_arun(self):
+        facts = [literal.Literal("person", ["patrick"])]
+        
+        # CHECK: arun provides the same answer sets as run
+        self.assertCountEqual(self.solver.run(self.ontology, facts), asyncio.run(self.solver.arun(self.ontology, facts)))
+        
+        # CHECK: an illegal timeout causes a ValueError
+        with self.assertRaises(ValueError):
+            asyncio.run(self.solver.arun(self.ontology, facts, timeout=0))
+    
+    def test_init(self):
+        # CHECK: the parallel mode has to be a positive int
+        with self.assertRaises(ValueError):
+            clingo_solver.ClingoSolver(parallel_mode=0)
+        with self.assertRaises(TypeError):
+            clingo_solver.ClingoSolver(parallel_mode=1.5)
+        
+        # CHECK: options have to be a list of strs that are options
+        with self.assertRaises(TypeError):
+            clingo_solver.ClingoSolver(options="--opt-mode=optN")
+        with self.assertRaises(TypeError):
+            clingo_solver.ClingoSolver(options=[1])
+        with self.assertRaises(ValueError):
+            clingo_solver.ClingoSolver(options=["optN"])
+        
+        # CHECK: providing legal args causes no problems whatsoever
+        clingo_solver.ClingoSolver(parallel_mode=2)
+        clingo_solver.ClingoSolver(options=["--opt-mode=optN"])
+        self.assertEqual(2, clingo_solver.ClingoSolver(parallel_mode=2).parallel_mode)
+        self.assertIsNone(self.solver.parallel_mode)
+    
+    def test_instrumentation(self):
+        collector = histogram_collector.HistogramCollector()
+        solver = clingo_solver.ClingoSolver(instrumentation=collector)
+        
+        # CHECK: all stages of a run are measured
+        solver.run(self.ontology, [literal.Literal("person", ["patrick"])])
+        snapshot = collector.snapshot()
+        self.assertEqual({"create_input", "ground", "solve", "parse"}, set(snapshot))
+        self.assertEqual(1, snapshot["create_input"]["counts"]["facts"])
+        self.assertEqual(2, snapshot["solve"]["counts"]["models"])
+        self.assertEqual(4, snapshot["parse"]["counts"]["atoms"])
+    
+    def test_iter_answer_sets(self):
+        # CHECK: the iterator provides the same answer sets as run
+        for facts in [
+                [literal.Literal("person", ["patrick"])],
+                [literal.Literal("hero", ["patrick"])],
+                [literal.Literal("person", ["patrick"]), literal.Literal("person", ["patrick"], positive=False)]
+        ]:
+            self.assertCountEqual(
+                    self.solver.run(self.ontology, facts),
+                    list(self.solver.iter_answer_sets(self.ontology, facts))
+            )
+        
+        # CHECK: the iterator can be closed before it is exhausted
+        facts = [literal.Literal("person", [name]) for name in ["a", "b", "c", "d", "e", "f", "g", "h"]]
+        it = self.solver.iter_answer_sets(self.ontology, facts)
+        self.assertEqual(set(facts), next(it).facts)
+        it.close()
+        with self.assertRaises(StopIteration):
+            next(it)
+    
+    def test_run(self):
+        person = literal.Literal("person", ["patrick"])
+        hero = literal.Literal("hero", ["patrick"])
+        
+        # CHECK: providing illegal args causes a ValueError or TypeError, respectively
+        with self.assertRaises(ValueError):
+            self.solver.run("/not/a/valid/path", [])
+        with self.assertRaises(TypeError):
+            self.solver.run(self.ontology, None)
+        with self.assertRaises(TypeError):
+            self.solver.run(self.ontology, [person, 0])
+        with self.assertRaises(ValueError):
+            self.solver.run(self.ontology, [literal.Literal("Person", ["patrick"])])
+        with self.assertRaises(ValueError):
+            self.solver.run(self.ontology, [literal.Literal("person", ["Patrick"])])
+        with self.assertRaises(ValueError):
+            self.solver.run(self.ontology, [person], max_models=0)
+        
+        # CHECK: the answer sets are computed correctly, and the facts in them are the provided literals
+        result = self.solver.run(self.ontology, [person])
+        self.assertIsInstance(result, solver_result.SolverResult)
+        self.assertIsNotNone(result.usage)
+        self.assertCountEqual(
+                [
+                        answer_set.AnswerSet([person], [hero]),
+                        answer_set.AnswerSet([person], [literal.Literal("hero", ["patrick"], positive=False)])
+                ],
+                result
+        )
+        self.assertIs(person, next(iter(result[0].facts)))
+        self.assertEqual([answer_set.AnswerSet([hero], [person])], self.solver.run(self.ontology, [hero]))
+        self.assertEqual([], self.solver.run(self.ontology, [person, literal.Literal("person", ["patrick"], False)]))
+        self.assertEqual(1, len(self.solver.run(self.ontology, [person], max_models=1)))
+        
+        # CHECK: integer terms are supported
+        facts = [literal.Literal("hero", ["patrick", "42"])]
+        self.assertEqual([answer_set.AnswerSet(facts, [])], self.solver.run(self.ontology, facts))
+    
+    def test_run_cached(self):
+        solver = clingo_solver.ClingoSolver(result_cache=result_cache.ResultCache())
+        facts = [literal.Literal("person", ["patrick"])]
+        
+        # CHECK: repeated runs with the same facts are served from the cache
+        result = solver.run(self.ontology, facts)
+        self.assertEqual(result, solver.run(self.ontology, facts))
+        self.assertEqual(1, solver.result_cache.hits)
+        solver.run(self.ontology, facts, max_models=1)
+        self.assertEqual(1, solver.result_cache.hits)
+    
+    def test_run_many(self):
+        fact_sets = [[literal.Literal("person", [str(i)])] for i in range(10)]
+        solver = clingo_solver.ClingoSolver(parallel_mode=2)
+        
+        # CHECK: the results are provided in the same order as the sets of facts
+        results = solver.run_many(self.ontology, fact_sets, max_workers=3)
+        self.assertEqual([self.solver.run(self.ontology, facts) for facts in fact_sets], results)
+        self.assertEqual(
+                list(range(len(fact_sets))),
+                sorted(idx for idx, _ in solver.run_many_unordered(self.ontology, fact_sets, max_workers=3))
+        )
+    
+    def test_run_timeout(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".lp") as f:
+            f.write("{ a(1..60) } .\n:- #count { X : a(X) } = 31 .\n")
+            f.flush()
+            
+            # CHECK: the search is stopped if the timeout expires
+            with self.assertRaises(subprocess.TimeoutExpired):
+                self.solver.run(f.name, [], timeout=0.2)
+            self.assertEqual(5, len(self.solver.run(f.name, [], max_models=5, timeout=60)))
+
+
+if __name__ == "__main__":
+    unittest.main()
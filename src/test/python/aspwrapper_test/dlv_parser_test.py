@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+
+import io
+import unittest
+
+from aspwrapper import dlv_parser
+from aspwrapper import literal
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2018 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2018.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class DlvParserTest(unittest.TestCase):
+    
+    def test_parse_atom(self):
+        # CHECK: positive and negative atoms with and without terms are parsed correctly
+        self.assertEqual(literal.Literal("raining"), dlv_parser.parse_atom("raining"))
+        self.assertEqual(literal.Literal("person", ["patrick"]), dlv_parser.parse_atom("person(patrick)"))
+        self.assertEqual(
+                literal.Literal("hero", ["patrick"], positive=False),
+                dlv_parser.parse_atom("-hero(patrick)")
+        )
+        self.assertEqual(
+                literal.Literal("hero", ["patrick"], positive=False),
+                dlv_parser.parse_atom("~hero(patrick)")
+        )
+        self.assertEqual(literal.Literal("age", ["patrick", "42"]), dlv_parser.parse_atom("age(patrick,42)"))
+        
+        # CHECK: quoted strings and nested terms are kept as they are
+        self.assertEqual(
+                literal.Literal("name", ["p1", '"Doe, John (Jr.)"']),
+                dlv_parser.parse_atom('name(p1,"Doe, John (Jr.)")')
+        )
+        self.assertEqual(
+                literal.Literal("edge", ["f(a,g(b,c))", "d"]),
+                dlv_parser.parse_atom("edge(f(a,g(b,c)),d)")
+        )
+        self.assertEqual(
+                literal.Literal("quote", ['"say \\"hi\\", ok"']),
+                dlv_parser.parse_atom('quote("say \\"hi\\", ok")')
+        )
+        
+        # CHECK: illegal atoms cause a ValueError
+        with self.assertRaises(ValueError):
+            dlv_parser.parse_atom("person(")
+        with self.assertRaises(ValueError):
+            dlv_parser.parse_atom("person()")
+        with self.assertRaises(ValueError):
+            dlv_parser.parse_atom("")
+    
+    def test_parse_model(self):
+        # CHECK: lines that describe answer sets are parsed correctly
+        self.assertEqual([], dlv_parser.parse_model("{}"))
+        self.assertEqual(
+                [literal.Literal("person", ["patrick"]), literal.Literal("hero", ["patrick"], positive=False)],
+                dlv_parser.parse_model("{person(patrick), -hero(patrick)}\n")
+        )
+        self.assertEqual(
+                [literal.Literal("name", ['"a, b"']), literal.Literal("p", ["f(x,y)"]), literal.Literal("q")],
+                dlv_parser.parse_model('{name("a, b"), p(f(x,y)), q}')
+        )
+        self.assertEqual([literal.Literal("q")], dlv_parser.parse_model("Best model: {q}"))
+        
+        # CHECK: other lines are skipped
+        self.assertIsNone(dlv_parser.parse_model(""))
+        self.assertIsNone(dlv_parser.parse_model("Cost ([Weight:Level]): <[1:1]>"))
+        
+        # CHECK: occurrences of the same atom share the same literal if a memo is used
+        memo = {}
+        first = dlv_parser.parse_model("{person(patrick), hero(patrick)}", memo=memo)
+        second = dlv_parser.parse_model("{person(patrick)}", memo=memo)
+        self.assertIs(first[0], second[0])
+    
+    def test_parse_models(self):
+        output = io.StringIO("{person(patrick), hero(patrick)}\n{person(patrick), -hero(patrick)}\n")
+        
+        # CHECK: all answer sets are parsed from a stream of lines
+        models = list(dlv_parser.parse_models(output))
+        self.assertEqual(2, len(models))
+        self.assertEqual({literal.Literal("person", ["patrick"]), literal.Literal("hero", ["patrick"])}, set(models[0]))
+        self.assertIs(models[0][0], models[1][0])
+        
+        # CHECK: empty output contains no answer sets
+        self.assertEqual([], list(dlv_parser.parse_models([])))
@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+
+
+import os
+import signal
+import tempfile
+import time
+import unittest
+
+import aspwrapper_test
+
+from aspwrapper import answer_set
+from aspwrapper import dlv_solver
+from aspwrapper import dlv_solver_pool
+from aspwrapper import histogram_collector
+from aspwrapper import literal
+from aspwrapper import program
+from aspwrapper import result_cache
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2018 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2018.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class DlvSolverPoolTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.ontology = aspwrapper_test.ONTOLOGY
+        self.solver = dlv_solver.DlvSolver(aspwrapper_test.DLV_PATH)
+        self.pool = dlv_solver_pool.DlvSolverPool(aspwrapper_test.DLV_PATH, size=2)
+    
+    def tearDown(self):
+        self.pool.close()
+    
+    def test_check_health(self):
+        facts = [literal.Literal("person", ["patrick"])]
+        
+        # CHECK: a pool with responsive workers is healthy
+        self.assertTrue(self.pool.check_health())
+        
+        # CHECK: a pool with a crashed worker is restarted, and works afterwards
+        pid = self.pool._executor.submit(dlv_solver_pool._ping_worker).result()
+        os.kill(pid, signal.SIGKILL)
+        self.pool.check_health()
+        self.assertTrue(self.pool.check_health())
+        self.assertEqual(2, len(self.pool.run(self.ontology, facts)))
+        
+        # CHECK: a pool whose workers are busy is unhealthy, but is neither restarted nor affected otherwise
+        executor = self.pool._executor
+        pids = set(executor._processes)
+        jobs = [executor.submit(time.sleep, 2) for _ in range(2)]
+        self.assertFalse(self.pool.check_health(timeout=0.5))
+        self.assertIs(executor, self.pool._executor)
+        self.assertEqual(pids, set(executor._processes))
+        for j in jobs:
+            self.assertIsNone(j.result())
+        self.assertTrue(self.pool.check_health())
+        self.assertIs(executor, self.pool._executor)
+    
+    def test_close(self):
+        # CHECK: a closed pool cannot be used anymore
+        self.pool.close()
+        with self.assertRaises(RuntimeError):
+            self.pool.run(self.ontology, [])
+        
+        # CHECK: pools can be used as context managers
+        with dlv_solver_pool.DlvSolverPool(aspwrapper_test.DLV_PATH, size=1) as pool:
+            self.assertEqual(1, len(pool.run(self.ontology, [])))
+        with self.assertRaises(RuntimeError):
+            pool.run(self.ontology, [])
+    
+    def test_init(self):
+        # CHECK: providing illegal args causes a ValueError or TypeError, respectively
+        with self.assertRaises(ValueError):
+            dlv_solver_pool.DlvSolverPool("/not/a/valid/path")
+        with self.assertRaises(ValueError):
+            dlv_solver_pool.DlvSolverPool(aspwrapper_test.DLV_PATH, size=0)
+        with self.assertRaises(TypeError):
+            dlv_solver_pool.DlvSolverPool(aspwrapper_test.DLV_PATH, size=1.5)
+        with self.assertRaises(ValueError):
+            dlv_solver_pool.DlvSolverPool(aspwrapper_test.DLV_PATH, max_jobs_per_worker=0)
+        with self.assertRaises(ValueError):
+            dlv_solver_pool.DlvSolverPool(aspwrapper_test.DLV_PATH, start_method="invalid")
+        
+        # CHECK: the properties are set correctly
+        self.assertEqual(2, self.pool.size)
+        self.assertIsNone(self.pool.max_jobs_per_worker)
+    
+    def test_instrumentation(self):
+        collector = histogram_collector.HistogramCollector()
+        
+        # CHECK: the stages measured by the workers are reported by the pool
+        with dlv_solver_pool.DlvSolverPool(aspwrapper_test.DLV_PATH, size=1, instrumentation=collector) as pool:
+            pool.run(self.ontology, [literal.Literal("person", ["patrick"])])
+        snapshot = collector.snapshot()
+        self.assertEqual({"create_input", "solve", "parse"}, set(snapshot))
+        self.assertEqual(2, snapshot["parse"]["counts"]["models"])
+    
+    def test_program_transfer(self):
+        facts = [literal.Literal("person", ["patrick"])]
+        target = self.solver.run(self.ontology, facts)
+        
+        with dlv_solver_pool.DlvSolverPool(aspwrapper_test.DLV_PATH, size=1) as pool:
+            programs = []  # the programs that are sent to the worker as (path, fingerprint, data)
+            submit = pool._executor.submit
+            
+            def record(fn, *args):
+                programs.append(args[0])
+                return submit(fn, *args)
+            
+            pool._executor.submit = record
+            
+            # CHECK: the program is sent only if the worker has not cached it yet, and is referred to otherwise
+            self.assertCountEqual(target, pool.run(self.ontology, facts))
+            self.assertEqual(2, len(programs))
+            self.assertIsNone(programs[0][2])
+            self.assertIsNotNone(programs[1][2])
+            self.assertCountEqual(target, pool.run(self.ontology, [literal.Literal("person", ["patrick"])]))
+            self.assertEqual(3, len(programs))
+            self.assertIsNone(programs[2][2])
+            self.assertEqual(programs[1][1], programs[2][1])
+    
+    def test_recycle(self):
+        facts = [literal.Literal("person", ["patrick"])]
+        target = self.solver.run(self.ontology, facts)
+        
+        # CHECK: workers are replaced after the specified number of jobs
+        with dlv_solver_pool.DlvSolverPool(aspwrapper_test.DLV_PATH, size=1, max_jobs_per_worker=2) as pool:
+            executor = pool._executor
+            for _ in range(2):
+                self.assertCountEqual(target, pool.run(self.ontology, facts))
+            self.assertIs(executor, pool._executor)
+            self.assertCountEqual(target, pool.run(self.ontology, facts))
+            self.assertIsNot(executor, pool._executor)
+    
+    def test_run(self):
+        facts = [literal.Literal("person", ["patrick"])]
+        
+        # CHECK: the pool provides the same answer sets as the solver
+        self.assertCountEqual(self.solver.run(self.ontology, facts), self.pool.run(self.ontology, facts))
+        self.assertEqual(1, len(self.pool.run(self.ontology, facts, max_models=1)))
+        self.assertEqual([], self.pool.run(self.ontology, facts + [literal.Literal("person", ["patrick"], False)]))
+        
+        # CHECK: illegal args are detected before any job is submitted
+        with self.assertRaises(ValueError):
+            self.pool.run("/not/a/valid/path", facts)
+        with self.assertRaises(TypeError):
+            self.pool.run(self.ontology, None)
+        
+        # CHECK: results are cached, if a cache is provided
+        with dlv_solver_pool.DlvSolverPool(
+                aspwrapper_test.DLV_PATH,
+                size=1,
+                result_cache=result_cache.ResultCache()
+        ) as pool:
+            pool.run(self.ontology, facts)
+            pool.run(self.ontology, facts)
+            self.assertEqual(1, pool.result_cache.hits)
+        
+        # CHECK: lazy results are computed by the workers as well
+        result = self.pool.run(self.ontology, facts, lazy=True)
+        self.assertEqual(2, len(result))
+        self.assertCountEqual(self.solver.run(self.ontology, facts), list(result))
+    
+    def test_run_loaded_program(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "program.asp")
+            with open(path, "w") as f:
+                f.write("marker(old) .\n")
+            prog = self.pool.load_program(path)
+            with open(path, "w") as f:
+                f.write("marker(new) .\n")
+            
+            # CHECK: the pool solves the program that it is provided with, even if the file has been changed since
+            for p in [self.pool, self.solver]:
+                self.assertEqual(
+                        [answer_set.AnswerSet([], [literal.Literal("marker", ["old"])])],
+                        p.run(prog, [])
+                )
+            
+            # CHECK: the changed program is solved if it is loaded anew
+            self.assertEqual(
+                    [answer_set.AnswerSet([], [literal.Literal("marker", ["new"])])],
+                    self.pool.run(program.Program(path), [])
+            )
+    
+    def test_run_many(self):
+        fact_sets = [[literal.Literal("person", ["p{}".format(i)])] for i in range(10)]
+        
+        # CHECK: the pool provides the same results as the solver, in the same order
+        target = self.solver.run_many(self.ontology, fact_sets)
+        result = self.pool.run_many(self.ontology, fact_sets, max_workers=4)
+        self.assertEqual(len(target), len(result))
+        for t, r in zip(target, result):
+            self.assertCountEqual(t, r)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,13 +1,26 @@
 # -*- coding: utf-8 -*-
 
 
+import asyncio
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
 import unittest
 
 import aspwrapper_test
 
 from aspwrapper import answer_set
+from aspwrapper import answer_set_collection
+from aspwrapper import answer_set_product
 from aspwrapper import dlv_solver
+from aspwrapper import histogram_collector
+from aspwrapper import lazy_solver_result
 from aspwrapper import literal
+from aspwrapper import result_cache
+from aspwrapper import solver_result
 
 
 __author__ = "Patrick Hohenecker"
@@ -40,12 +53,105 @@ __email__ = "mail@paho.at"
 __status__ = "Development"
 
 
+def _wait_until_terminated(pids: list, timeout: float = 10) -> bool:
+    """Waits until none of the processes with the provided IDs is running anymore, and indicates whether this happened
+    within the given timeout. Zombies, i.e., processes that terminated but have not been reaped yet, are considered as
+    terminated.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        running = []
+        for pid in pids:
+            try:
+                os.kill(pid, 0)
+            except ProcessLookupError:
+                continue
+            try:
+                with open("/proc/{}/stat".format(pid)) as f:
+                    if f.read().rsplit(")", 1)[1].split()[0] == "Z":
+                        continue
+            except OSError:
+                pass
+            running.append(pid)
+        if not running:
+            return True
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.05)
+
+
 class DlvSolverTest(unittest.TestCase):
     
     def setUp(self):
         self.ontology = aspwrapper_test.ONTOLOGY
         self.solver = dlv_solver.DlvSolver(aspwrapper_test.DLV_PATH)
     
+    def test_arun(self):
+        facts = [literal.Literal("person", ["patrick"])]
+        
+        # CHECK: providing illegal args causes a ValueError or TypeError, respectively
+        with self.assertRaises(ValueError):
+            asyncio.run(self.solver.arun("/not/a/valid/path", []))
+        with self.assertRaises(TypeError):
+            asyncio.run(self.solver.arun(self.ontology, None))
+        with self.assertRaises(ValueError):
+            asyncio.run(self.solver.arun(self.ontology, facts, timeout=0))
+        
+        # CHECK: arun provides the same answer sets as run
+        target = self.solver.run(self.ontology, facts)
+        result = asyncio.run(self.solver.arun(self.ontology, facts, timeout=60))
+        self.assertEqual(len(target), len(result))
+        for a in result:
+            self.assertIn(a, target)
+        
+        # CHECK: concurrent invocations work with a limited concurrency, also across multiple event loops
+        solver = dlv_solver.DlvSolver(aspwrapper_test.DLV_PATH, max_concurrency=2)
+        
+        async def run_concurrently():
+            return await asyncio.gather(*(solver.arun(self.ontology, facts) for _ in range(5)))
+        
+        for _ in range(2):
+            for r in asyncio.run(run_concurrently()):
+                self.assertEqual(len(target), len(r))
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            
+            # a stand-in for DLV that is a wrapper script, whose child keeps stdout open, and records both of their IDs
+            pid_path = os.path.join(tmp_dir, "pids")
+            dlv_path = os.path.join(tmp_dir, "sleeping-dlv")
+            with open(dlv_path, "w") as f:
+                f.write("#!/bin/sh\nsleep 30 &\necho $$ $! > '{}.tmp'\nmv '{}.tmp' '{}'\nwait\n".format(
+                        pid_path, pid_path, pid_path
+                ))
+            os.chmod(dlv_path, 0o755)
+            solver = dlv_solver.DlvSolver(dlv_path)
+            
+            def read_pids():
+                with open(pid_path) as f:
+                    return [int(pid) for pid in f.read().split()]
+            
+            # CHECK: DLV, including its children, is killed and reaped if the timeout expires
+            start = time.monotonic()
+            with self.assertRaises(subprocess.TimeoutExpired):
+                asyncio.run(solver.arun(self.ontology, facts, timeout=0.5))
+            self.assertLess(time.monotonic() - start, 10)
+            self.assertTrue(_wait_until_terminated(read_pids()))
+            os.remove(pid_path)
+            
+            # CHECK: DLV, including its children, is killed and reaped if the task is cancelled
+            async def run_and_cancel():
+                task = asyncio.ensure_future(solver.arun(self.ontology, facts))
+                while not os.path.exists(pid_path):
+                    await asyncio.sleep(0.05)
+                task.cancel()
+                await task
+            
+            start = time.monotonic()
+            with self.assertRaises(asyncio.CancelledError):
+                asyncio.run(run_and_cancel())
+            self.assertLess(time.monotonic() - start, 10)
+            self.assertTrue(_wait_until_terminated(read_pids()))
+    
     def test_init(self):
         # CHECK: providing an illegal path causes a ValueError
         with self.assertRaises(ValueError):
@@ -53,8 +159,26 @@ class DlvSolverTest(unittest.TestCase):
         with self.assertRaises(ValueError):
             dlv_solver.DlvSolver(None)
 
+        # CHECK: the concurrency limit has to be a positive int
+        with self.assertRaises(ValueError):
+            dlv_solver.DlvSolver(aspwrapper_test.DLV_PATH, max_concurrency=0)
+        with self.assertRaises(TypeError):
+            dlv_solver.DlvSolver(aspwrapper_test.DLV_PATH, max_concurrency=1.5)
+        
+        # CHECK: options have to be a list of strs that are options
+        with self.assertRaises(TypeError):
+            dlv_solver.DlvSolver(aspwrapper_test.DLV_PATH, options="-n=1")
+        with self.assertRaises(TypeError):
+            dlv_solver.DlvSolver(aspwrapper_test.DLV_PATH, options=[1])
+        with self.assertRaises(ValueError):
+            dlv_solver.DlvSolver(aspwrapper_test.DLV_PATH, options=["rm -rf /"])
+        with self.assertRaises(ValueError):
+            dlv_solver.DlvSolver(aspwrapper_test.DLV_PATH, options=["--"])
+
         # CHECK: providing legal args causes no problems whatsoever
         dlv_solver.DlvSolver(aspwrapper_test.DLV_PATH)
+        dlv_solver.DlvSolver(aspwrapper_test.DLV_PATH, max_concurrency=4)
+        dlv_solver.DlvSolver(aspwrapper_test.DLV_PATH, options=["-n=1"])
 
     def test_run(self):
         # CHECK: providing a non-existing ontology path causes a ValueError
@@ -81,12 +205,384 @@ class DlvSolverTest(unittest.TestCase):
         self.solver.run(self.ontology, [])
         self.solver.run(self.ontology, (literal.Literal("person", ["patrick"]), literal.Literal("hero", ["patrick"])))
     
+    def test_instrumentation(self):
+        facts = [literal.Literal("person", ["patrick"])]
+        collector = histogram_collector.HistogramCollector()
+        solver = dlv_solver.DlvSolver(aspwrapper_test.DLV_PATH, instrumentation=collector)
+        
+        # CHECK: an illegal instrumentation causes a TypeError
+        with self.assertRaises(TypeError):
+            dlv_solver.DlvSolver(aspwrapper_test.DLV_PATH, instrumentation="collector")
+        
+        # CHECK: all stages of a run are measured
+        self.assertIs(collector, solver.instrumentation)
+        solver.run(self.ontology, facts)
+        solver.run(self.ontology, facts)
+        snapshot = collector.snapshot()
+        self.assertEqual({"create_input", "solve", "parse"}, set(snapshot))
+        for stats in snapshot.values():
+            self.assertEqual(2, stats["count"])
+        self.assertEqual(2, snapshot["create_input"]["counts"]["facts"])
+        self.assertEqual(4, snapshot["parse"]["counts"]["models"])
+        self.assertEqual(8, snapshot["parse"]["counts"]["atoms"])
+        self.assertGreater(snapshot["solve"]["counts"]["bytes"], 0)
+    
+    def test_is_satisfiable(self):
+        # CHECK: satisfiability is determined correctly
+        self.assertTrue(self.solver.is_satisfiable(self.ontology, []))
+        self.assertTrue(self.solver.is_satisfiable(self.ontology, [literal.Literal("person", ["patrick"])]))
+        self.assertFalse(
+                self.solver.is_satisfiable(
+                        self.ontology,
+                        [literal.Literal("person", ["patrick"]), literal.Literal("person", ["patrick"], positive=False)]
+                )
+        )
+    
+    def test_iter_answer_sets(self):
+        # CHECK: providing illegal args causes a ValueError or TypeError, respectively
+        with self.assertRaises(ValueError):
+            self.solver.iter_answer_sets("/not/a/valid/path", [])
+        with self.assertRaises(TypeError):
+            self.solver.iter_answer_sets(self.ontology, None)
+        
+        # CHECK: the iterator provides the same answer sets as run
+        for facts in [
+                [literal.Literal("person", ["patrick"])],
+                [literal.Literal("hero", ["patrick"])],
+                [literal.Literal("person", ["patrick"]), literal.Literal("person", ["patrick"], positive=False)]
+        ]:
+            target = self.solver.run(self.ontology, facts)
+            result = list(self.solver.iter_answer_sets(self.ontology, facts))
+            self.assertEqual(len(target), len(result))
+            for a in result:
+                self.assertIn(a, target)
+        
+        # CHECK: the iterator can be closed before it is exhausted
+        facts = [literal.Literal("person", [name]) for name in ["a", "b", "c", "d", "e", "f", "g", "h"]]
+        it = self.solver.iter_answer_sets(self.ontology, facts)
+        first = next(it)
+        it.close()
+        self.assertEqual(set(facts), first.facts)
+        with self.assertRaises(StopIteration):
+            next(it)
+    
+    def test_load_program(self):
+        # CHECK: providing a non-existing path causes a ValueError
+        with self.assertRaises(ValueError):
+            self.solver.load_program("/not/a/valid/path")
+        
+        # CHECK: loaded programs are cached
+        prog = self.solver.load_program(self.ontology)
+        self.assertIs(prog, self.solver.load_program(self.ontology))
+        
+        # CHECK: loaded programs can be used in place of paths
+        facts = [literal.Literal("hero", ["patrick"])]
+        self.assertEqual(self.solver.run(self.ontology, facts), self.solver.run(prog, facts))
+        self.assertEqual(self.solver.run_many(self.ontology, [facts]), self.solver.run_many(prog, [facts]))
+    
+    @unittest.skipIf(answer_set_collection.np is None, "NumPy is not installed")
+    def test_run_as_collection(self):
+        facts = [literal.Literal("person", ["patrick"])]
+        hero = literal.Literal("hero", ["patrick"])
+        
+        # CHECK: the answer sets are provided as a collection that contains the same answer sets as the list
+        coll = self.solver.run(self.ontology, facts, as_collection=True)
+        self.assertIsInstance(coll, answer_set_collection.AnswerSetCollection)
+        self.assertCountEqual(self.solver.run(self.ontology, facts), list(coll))
+        self.assertEqual(frozenset(facts), coll.cautious_consequences())
+        self.assertEqual(
+                frozenset(facts) | {hero, literal.Literal("hero", ["patrick"], positive=False)},
+                coll.brave_consequences()
+        )
+    
+    def test_run_cached(self):
+        solver = dlv_solver.DlvSolver(aspwrapper_test.DLV_PATH, result_cache=result_cache.ResultCache())
+        facts = [literal.Literal("person", ["patrick"])]
+        
+        # CHECK: repeated runs with the same facts are served from the cache, and provide the same answer sets
+        result = solver.run(self.ontology, facts)
+        self.assertEqual(0, solver.result_cache.hits)
+        self.assertEqual(result, solver.run(self.ontology, list(reversed(facts))))
+        self.assertEqual(result, asyncio.run(solver.arun(self.ontology, facts)))
+        self.assertEqual(2, solver.result_cache.hits)
+        
+        # CHECK: different facts are not served from the cache
+        solver.run(self.ontology, [literal.Literal("hero", ["patrick"])])
+        self.assertEqual(2, solver.result_cache.hits)
+    
+    def test_run_concurrently(self):
+        facts = [[literal.Literal("hero", [name])] for name in ["patrick", "bruce", "clark", "diana"]]
+        results = [None] * len(facts)
+        
+        def run(idx):
+            results[idx] = self.solver.run(self.ontology, facts[idx])
+        
+        # CHECK: concurrent invocations of the same solver do not interfere with each other
+        threads = [threading.Thread(target=run, args=(idx,)) for idx in range(len(facts))]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        for f, r in zip(facts, results):
+            self.assertEqual([answer_set.AnswerSet(f, [literal.Literal("person", f[0].terms)])], r)
+    
+    def test_run_many(self):
+        fact_sets = [
+                [literal.Literal("hero", ["patrick"])],
+                [literal.Literal("person", ["patrick"]), literal.Literal("person", ["patrick"], positive=False)],
+                [literal.Literal("person", ["patrick"])],
+                [literal.Literal("hero", ["bruce"])]
+        ]
+        
+        # CHECK: providing illegal args causes a ValueError or TypeError, respectively
+        with self.assertRaises(ValueError):
+            self.solver.run_many("/not/a/valid/path", fact_sets)
+        with self.assertRaises(TypeError):
+            self.solver.run_many(self.ontology, None)
+        with self.assertRaises(ValueError):
+            self.solver.run_many(self.ontology, fact_sets, max_workers=0)
+        
+        # CHECK: the results are provided in the same order as the fact sets, and agree with individual runs
+        for max_workers in [None, 1, 3]:
+            result = self.solver.run_many(self.ontology, fact_sets, max_workers=max_workers)
+            self.assertEqual(len(fact_sets), len(result))
+            for facts, answer_sets in zip(fact_sets, result):
+                target = self.solver.run(self.ontology, facts)
+                self.assertEqual(len(target), len(answer_sets))
+                for a in answer_sets:
+                    self.assertIn(a, target)
+        
+        # CHECK: run_many_unordered provides every result exactly once
+        result = dict(self.solver.run_many_unordered(self.ontology, iter(fact_sets), max_workers=2))
+        self.assertEqual(set(range(len(fact_sets))), set(result.keys()))
+        self.assertEqual([], result[1])
+        
+        # CHECK: running without any fact sets yields an empty result
+        self.assertEqual([], self.solver.run_many(self.ontology, []))
+    
+    def test_run_decompose(self):
+        facts = [
+                literal.Literal("person", ["a"]),
+                literal.Literal("person", ["b"]),
+                literal.Literal("hero", ["c"]),
+                literal.Literal("knows", ["b", "d"]),
+                literal.Literal("person", ["d"])
+        ]
+        
+        # CHECK: independent components are solved separately, and yield the same answer sets as a single run
+        result = self.solver.run(self.ontology, facts, decompose=True)
+        self.assertIsInstance(result, answer_set_product.AnswerSetProduct)
+        self.assertEqual(3, len(result.factors))
+        self.assertCountEqual(self.solver.run(self.ontology, facts), list(result))
+        self.assertIsNotNone(result.usage)
+        
+        # CHECK: facts without linking terms are added to every component
+        result = self.solver.run(self.ontology, facts, decompose=True, link_positions={"knows": []})
+        self.assertEqual(4, len(result.factors))
+        self.assertCountEqual(self.solver.run(self.ontology, facts), list(result))
+        
+        # CHECK: the number of answer sets can be limited, and filters are applied to every component
+        result = self.solver.run(self.ontology, facts, decompose=True, max_models=3)
+        self.assertEqual(3, len(result))
+        self.assertEqual(3, len(set(result)))
+        result = self.solver.run(self.ontology, facts, decompose=True, output_predicates=["hero"])
+        self.assertCountEqual(self.solver.run(self.ontology, facts, output_predicates=["hero"]), list(result))
+        
+        # CHECK: a single component is solved as usual
+        result = self.solver.run(self.ontology, facts[1:2], decompose=True)
+        self.assertIsInstance(result, solver_result.SolverResult)
+        self.assertEqual(2, len(result))
+        
+        # CHECK: illegal link positions cause a TypeError or ValueError, respectively
+        with self.assertRaises(TypeError):
+            self.solver.run(self.ontology, facts, decompose=True, link_positions=[0])
+        with self.assertRaises(TypeError):
+            self.solver.run(self.ontology, facts, decompose=True, link_positions={"knows": ["0"]})
+        with self.assertRaises(ValueError):
+            self.solver.run(self.ontology, facts, decompose=True, link_positions={"knows": [-1]})
+    
+    def test_run_lazy(self):
+        facts = [literal.Literal("person", [name]) for name in ["a", "b", "c"]]
+        target = self.solver.run(self.ontology, facts)
+        
+        # CHECK: a lazy result provides the same answer sets as an eager one
+        result = self.solver.run(self.ontology, facts, lazy=True)
+        self.assertIsInstance(result, lazy_solver_result.LazySolverResult)
+        self.assertEqual(8, len(result))
+        self.assertIsNotNone(result.usage)
+        self.assertCountEqual(target, list(result))
+        self.assertCountEqual(target, [result[i] for i in range(len(result))])
+        self.assertCountEqual(
+                self.solver.run(self.ontology, facts, output_predicates=["hero"]),
+                list(self.solver.run(self.ontology, facts, lazy=True, output_predicates=["hero"]))
+        )
+
+        # CHECK: lazy results work together with run_many and decompose
+        self.assertCountEqual(target, list(self.solver.run_many(self.ontology, [facts], lazy=True)[0]))
+        self.assertCountEqual(target, list(self.solver.run(self.ontology, facts, lazy=True, decompose=True)))
+        
+        # CHECK: lazy results are not added to the cache
+        solver = dlv_solver.DlvSolver(aspwrapper_test.DLV_PATH, result_cache=result_cache.ResultCache())
+        solver.run(self.ontology, facts, lazy=True)
+        solver.run(self.ontology, facts)
+        self.assertEqual(0, solver.result_cache.hits)
+    
+    def test_run_limits(self):
+        facts = [literal.Literal("person", ["patrick"])]
+        
+        # CHECK: limits have to be positive numbers
+        with self.assertRaises(ValueError):
+            self.solver.run(self.ontology, facts, timeout=0)
+        with self.assertRaises(TypeError):
+            self.solver.run(self.ontology, facts, max_memory=1.5)
+        with self.assertRaises(ValueError):
+            self.solver.run(self.ontology, facts, max_cpu_seconds=-1)
+        
+        # CHECK: the result reports the resources used by DLV
+        result = self.solver.run(self.ontology, facts, timeout=60, max_memory=1 << 32, max_cpu_seconds=60)
+        self.assertIsInstance(result, solver_result.SolverResult)
+        self.assertEqual(2, len(result))
+        self.assertGreater(result.usage.wall_time, 0)
+        self.assertGreaterEqual(result.usage.wall_time, result.usage.cpu_time / os.cpu_count())
+        self.assertGreater(result.usage.max_rss, 0)
+        
+        # CHECK: DLV fails if it exceeds the memory limit
+        with self.assertRaises(subprocess.CalledProcessError):
+            self.solver.run(self.ontology, facts, max_memory=1 << 20)
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            
+            # CHECK: DLV, including its children, is killed if the timeout expires
+            dlv_path = os.path.join(tmp_dir, "sleeping-dlv")
+            with open(dlv_path, "w") as f:
+                f.write("#!/bin/sh\nsleep 30\n")
+            os.chmod(dlv_path, 0o755)
+            start = time.monotonic()
+            with self.assertRaises(subprocess.TimeoutExpired):
+                dlv_solver.DlvSolver(dlv_path).run(self.ontology, facts, timeout=0.5)
+            self.assertLess(time.monotonic() - start, 10)
+            
+            # CHECK: on platforms without resource accounting, memory and CPU time limits are rejected, whereas timeouts
+            # are still enforced, and results do not report any resource usage
+            dlv_solver._RESOURCE_ACCOUNTING = False
+            try:
+                with self.assertRaises(ValueError):
+                    self.solver.run(self.ontology, facts, max_memory=1 << 32)
+                with self.assertRaises(ValueError):
+                    self.solver.run(self.ontology, facts, max_cpu_seconds=60)
+                result = self.solver.run(self.ontology, facts, timeout=60)
+                self.assertEqual(2, len(result))
+                self.assertIsNone(result.usage)
+                start = time.monotonic()
+                with self.assertRaises(subprocess.TimeoutExpired):
+                    dlv_solver.DlvSolver(dlv_path).run(self.ontology, facts, timeout=0.5)
+                self.assertLess(time.monotonic() - start, 10)
+            finally:
+                dlv_solver._RESOURCE_ACCOUNTING = True
+            
+            # CHECK: DLV is terminated if it exceeds the CPU time limit
+            dlv_path = os.path.join(tmp_dir, "busy-dlv")
+            with open(dlv_path, "w") as f:
+                f.write("#!/bin/sh\nwhile :; do :; done\n")
+            os.chmod(dlv_path, 0o755)
+            with self.assertRaises(subprocess.CalledProcessError):
+                dlv_solver.DlvSolver(dlv_path).run(self.ontology, facts, timeout=30, max_cpu_seconds=1)
+    
+    def test_run_max_models(self):
+        facts = [literal.Literal("person", [name]) for name in ["a", "b", "c"]]
+        
+        # CHECK: the maximum number of models has to be a positive int
+        with self.assertRaises(ValueError):
+            self.solver.run(self.ontology, facts, max_models=0)
+        with self.assertRaises(TypeError):
+            self.solver.run(self.ontology, facts, max_models=1.5)
+        
+        # CHECK: no more than the requested number of answer sets is computed
+        all_answer_sets = self.solver.run(self.ontology, facts)
+        self.assertEqual(8, len(all_answer_sets))
+        for max_models in [1, 3, 8, 100]:
+            result = self.solver.run(self.ontology, facts, max_models=max_models)
+            self.assertEqual(min(8, max_models), len(result))
+            for a in result:
+                self.assertIn(a, all_answer_sets)
+        self.assertEqual(3, len(list(self.solver.iter_answer_sets(self.ontology, facts, max_models=3))))
+        self.assertEqual(3, len(asyncio.run(self.solver.arun(self.ontology, facts, max_models=3))))
+        self.assertEqual([2], [len(r) for r in self.solver.run_many(self.ontology, [facts], max_models=2)])
+        
+        # CHECK: results for different numbers of models are cached separately
+        solver = dlv_solver.DlvSolver(aspwrapper_test.DLV_PATH, result_cache=result_cache.ResultCache())
+        self.assertEqual(1, len(solver.run(self.ontology, facts, max_models=1)))
+        self.assertEqual(8, len(solver.run(self.ontology, facts)))
+        self.assertEqual(1, len(solver.run(self.ontology, facts, max_models=1)))
+        self.assertEqual(1, solver.result_cache.hits)
+    
+    def test_run_output_filters(self):
+        facts = [literal.Literal("person", ["a"]), literal.Literal("hero", ["b"])]
+        all_answer_sets = self.solver.run(self.ontology, facts)
+        
+        # CHECK: the output predicates have to be a non-empty list of legal predicate symbols
+        with self.assertRaises(TypeError):
+            self.solver.run(self.ontology, facts, output_predicates="hero")
+        with self.assertRaises(ValueError):
+            self.solver.run(self.ontology, facts, output_predicates=[])
+        with self.assertRaises(ValueError):
+            self.solver.run(self.ontology, facts, output_predicates=["Hero"])
+        
+        # CHECK: answer sets, including their facts, are restricted to the output predicates
+        result = self.solver.run(self.ontology, facts, output_predicates=["hero"])
+        self.assertCountEqual([a.project(["hero"]) for a in all_answer_sets], result)
+        for a in result:
+            self.assertEqual(frozenset([literal.Literal("hero", ["b"])]), a.facts)
+        
+        # CHECK: output predicates are combined with a -filter option of the solver, and all according facts are
+        # reported as facts rather than inferences
+        solver = dlv_solver.DlvSolver(aspwrapper_test.DLV_PATH, options=["-filter=person"])
+        for result in [
+                solver.run(self.ontology, facts, output_predicates=["hero"]),
+                solver.run(self.ontology, facts, output_predicates=["hero"], lazy=True)
+        ]:
+            self.assertCountEqual([a.project(["hero", "person"]) for a in all_answer_sets], list(result))
+            for a in result:
+                self.assertEqual(frozenset(facts), a.facts)
+                self.assertFalse(a.inferences & a.facts)
+        
+        # CHECK: without facts, the answer sets contain (a subset of the) inferences only
+        # depending on the solver, atoms that are derived from facts deterministically may be omitted as well
+        hero_a = literal.Literal("hero", ["a"])
+        not_hero_a = literal.Literal("hero", ["a"], positive=False)
+        for result in [
+                self.solver.run(self.ontology, facts, include_facts=False),
+                list(self.solver.iter_answer_sets(self.ontology, facts, include_facts=False)),
+                asyncio.run(self.solver.arun(self.ontology, facts, include_facts=False)),
+                self.solver.run_many(self.ontology, [facts], output_predicates=["hero"], include_facts=False)[0]
+        ]:
+            self.assertEqual(2, len(result))
+            for a in result:
+                self.assertEqual(frozenset(), a.facts)
+                self.assertTrue(any(a.inferences <= b.inferences for b in all_answer_sets))
+            self.assertCountEqual([{hero_a}, {not_hero_a}], [a.inferences & {hero_a, not_hero_a} for a in result])
+    
+    def test_run_options(self):
+        facts = [literal.Literal("person", ["patrick"])]
+        
+        # CHECK: additional options are passed to DLV
+        solver = dlv_solver.DlvSolver(aspwrapper_test.DLV_PATH, options=["-n=1"])
+        self.assertEqual(1, len(solver.run(self.ontology, facts)))
+        
+        # CHECK: DLV is invoked without a shell, and thus paths may contain spaces
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            dlv_path = os.path.join(tmp_dir, "dlv with spaces")
+            shutil.copy(aspwrapper_test.DLV_PATH, dlv_path)
+            solver = dlv_solver.DlvSolver(dlv_path)
+            self.assertEqual(2, len(solver.run(self.ontology, facts)))
+    
     def test_run_multiple_answer_sets(self):
         facts = [literal.Literal("person", ["patrick"])]
         target_1 = answer_set.AnswerSet(facts, [literal.Literal("hero", ["patrick"])])
         target_2 = answer_set.AnswerSet(facts, [literal.Literal("hero", ["patrick"], positive=False)])
         result = self.solver.run(self.ontology, facts)
         self.assertEqual(2, len(result))
+        self.assertIs(result[0].facts, result[1].facts)
         self.assertTrue(
                 (target_1 == result[0] and target_2 == result[1]) or
                 (target_1 == result[1] and target_2 == result[0])
@@ -133,3 +629,35 @@ class DlvSolverTest(unittest.TestCase):
         self.solver._sanitize_literals([literal.Literal("person1", ["patrick1"])])
         self.solver._sanitize_literals([literal.Literal("per_son", ["pat_rick"])])
         self.solver._sanitize_literals([literal.Literal("personPerson", ["patrickPatrick"])])
+        
+        # CHECK: anything but literals causes a TypeError
+        with self.assertRaises(TypeError):
+            self.solver._sanitize_literals(["person(patrick)"])
+        
+        # CHECK: checked literals and symbols are remembered, and a literal that was found to be illegal is not
+        lit = literal.Literal("person", ["patrick"])
+        self.solver._sanitize_literals([lit])
+        self.assertIs(self.solver._validation_key, lit._validated)
+        self.assertIn("person", self.solver._valid_predicates)
+        self.assertIn("patrick", self.solver._valid_terms)
+        lit = literal.Literal("person", ["patrick", "Patrick"])
+        with self.assertRaises(ValueError):
+            self.solver._sanitize_literals([lit])
+        self.assertIsNone(lit._validated)
+        with self.assertRaises(ValueError):
+            self.solver._sanitize_literals([lit])
+        
+        # CHECK: the marker is shared by all solvers that use the same patterns
+        self.assertIs(self.solver._validation_key, dlv_solver.DlvSolver(aspwrapper_test.DLV_PATH)._validation_key)
+    
+    def test_trusted(self):
+        facts = [literal.Literal("person", ["patrick"])]
+        
+        # CHECK: trusted facts are not checked, and lead to the same result
+        self.assertCountEqual(
+                self.solver.run(self.ontology, [literal.Literal("person", ["patrick"])]),
+                self.solver.run(self.ontology, facts, trusted=True)
+        )
+        self.assertIsNone(facts[0]._validated)
+        self.assertEqual(2, len(self.solver.run_many(self.ontology, [facts], trusted=True)[0]))
+        self.assertIsNone(facts[0]._validated)
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+
+
+import json
+import threading
+import unittest
+
+from aspwrapper import histogram_collector
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2018 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2018.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class HistogramCollectorTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.collector = histogram_collector.HistogramCollector(buckets=[0.1, 1.0])
+    
+    def test_init(self):
+        # CHECK: providing illegal buckets causes a TypeError or ValueError, respectively
+        with self.assertRaises(TypeError):
+            histogram_collector.HistogramCollector(buckets=["a"])
+        with self.assertRaises(ValueError):
+            histogram_collector.HistogramCollector(buckets=[])
+        
+        # CHECK: buckets are sorted, and the default buckets are used if none are provided
+        self.assertEqual((0.1, 1.0), histogram_collector.HistogramCollector(buckets=[1, 0.1]).buckets)
+        self.assertEqual(
+                histogram_collector.HistogramCollector.DEFAULT_BUCKETS,
+                histogram_collector.HistogramCollector().buckets
+        )
+    
+    def test_observe(self):
+        self.collector.observe("parse", 0.05, {"models": 2})
+        self.collector.observe("parse", 0.1, {"models": 3})
+        self.collector.observe("parse", 2.0, {"models": 1, "atoms": 10})
+        self.collector.observe("solve", 0.5, {})
+        
+        # CHECK: measurements are aggregated per stage with cumulative buckets
+        snapshot = self.collector.snapshot()
+        self.assertEqual({"parse", "solve"}, set(snapshot))
+        self.assertEqual(3, snapshot["parse"]["count"])
+        self.assertAlmostEqual(2.15, snapshot["parse"]["sum"])
+        self.assertEqual([(0.1, 2), (1.0, 2), (float("inf"), 3)], snapshot["parse"]["buckets"])
+        self.assertEqual({"models": 6, "atoms": 10}, snapshot["parse"]["counts"])
+        self.assertEqual([(0.1, 0), (1.0, 1), (float("inf"), 1)], snapshot["solve"]["buckets"])
+        
+        # CHECK: resetting discards all measurements
+        self.collector.reset()
+        self.assertEqual({}, self.collector.snapshot())
+    
+    def test_observe_concurrently(self):
+        def observe():
+            for _ in range(1000):
+                self.collector.observe("parse", 0.01, {"models": 1})
+        
+        # CHECK: no observations get lost if they are made from multiple threads
+        threads = [threading.Thread(target=observe) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(4000, self.collector.snapshot()["parse"]["count"])
+        self.assertEqual({"models": 4000}, self.collector.snapshot()["parse"]["counts"])
+    
+    def test_to_json(self):
+        self.collector.observe("parse", 0.05, {"models": 2})
+        
+        # CHECK: the JSON export contains the snapshot
+        data = json.loads(self.collector.to_json())
+        self.assertEqual(1, data["parse"]["count"])
+        self.assertEqual([[0.1, 1], [1.0, 1], ["+Inf", 1]], data["parse"]["buckets"])
+        self.assertEqual({"models": 2}, data["parse"]["counts"])
+    
+    def test_to_prometheus(self):
+        self.collector.observe("parse", 0.05, {"models": 2})
+        
+        # CHECK: the Prometheus export contains histograms and counters
+        lines = self.collector.to_prometheus().splitlines()
+        self.assertIn("# TYPE aspwrapper_stage_seconds histogram", lines)
+        self.assertIn('aspwrapper_stage_seconds_bucket{stage="parse",le="0.1"} 1', lines)
+        self.assertIn('aspwrapper_stage_seconds_bucket{stage="parse",le="+Inf"} 1', lines)
+        self.assertIn('aspwrapper_stage_seconds_sum{stage="parse"} 0.05', lines)
+        self.assertIn('aspwrapper_stage_seconds_count{stage="parse"} 1', lines)
+        self.assertIn("# TYPE aspwrapper_stage_items_total counter", lines)
+        self.assertIn('aspwrapper_stage_items_total{stage="parse",item="models"} 2', lines)
+
+
+if __name__ == "__main__":
+    unittest.main()
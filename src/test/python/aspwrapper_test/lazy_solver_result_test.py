@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+
+import pickle
+import unittest
+
+from aspwrapper import answer_set
+from aspwrapper import lazy_solver_result
+from aspwrapper import literal
+from aspwrapper import solver_result
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2018 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2018.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class LazySolverResultTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.facts = frozenset([literal.Literal("person", ["a"])])
+        self.output = (
+                b"{person(a), hero(a)}\n"
+                b"some other output\n"
+                b"{person(a), -hero(a)}\r\n"
+                b"{incomplete\n"
+                b"Best model: {person(a), villain(a)}\n"
+                b"{}"
+        )
+        self.target = [
+                answer_set.AnswerSet(self.facts, [literal.Literal("hero", ["a"])]),
+                answer_set.AnswerSet(self.facts, [literal.Literal("hero", ["a"], positive=False)]),
+                answer_set.AnswerSet(self.facts, [literal.Literal("villain", ["a"])]),
+                answer_set.AnswerSet(self.facts, [])
+        ]
+    
+    def test_getitem(self):
+        result = lazy_solver_result.LazySolverResult(self.output, self.facts)
+        
+        # CHECK: only lines that describe answer sets are counted, and answer sets are parsed on access
+        self.assertEqual(4, len(result))
+        self.assertEqual(self.target[:3], [result[i] for i in range(3)])
+        self.assertEqual(self.target[-1], result[-1])
+        self.assertEqual(self.target[1:3], result[1:3])
+        self.assertIs(self.facts, result[0].facts)
+        
+        # CHECK: indices out of range cause an IndexError
+        with self.assertRaises(IndexError):
+            result[4]
+        with self.assertRaises(IndexError):
+            result[-5]
+    
+    def test_iter(self):
+        result = lazy_solver_result.LazySolverResult(self.output, self.facts, solver_result.ResourceUsage(1, 1, 1))
+        
+        # CHECK: iterating provides all answer sets
+        answer_sets = list(result)
+        self.assertEqual(self.target, answer_sets)
+        self.assertIs(answer_sets[0].facts, answer_sets[3].facts)
+        self.assertEqual(1.0, result.usage.wall_time)
+        self.assertEqual([], list(lazy_solver_result.LazySolverResult(b"", self.facts)))
+    
+    def test_pickle(self):
+        # CHECK: lazy results can be pickled without parsing them
+        result = pickle.loads(pickle.dumps(lazy_solver_result.LazySolverResult(self.output, self.facts)))
+        self.assertEqual(4, len(result))
+        self.assertEqual(self.target[0], result[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 
+import pickle
 import unittest
 
 from aspwrapper import literal
@@ -38,6 +39,13 @@ __status__ = "Development"
 
 class LiteralTest(unittest.TestCase):
     
+    def test_create(self):
+        # CHECK: literals created from trusted args are equal to those created by the constructor
+        lit = literal.Literal._create("pred", ("a", "b"), False)
+        self.assertEqual(literal.Literal("pred", ["a", "b"], positive=False), lit)
+        self.assertEqual(hash(literal.Literal("pred", ["a", "b"], positive=False)), hash(lit))
+        self.assertIsNone(lit._validated)
+    
     def test_eq(self):
         # CHECK: equality checks work as expected
         self.assertTrue(literal.Literal("person", ["patrick"]) == literal.Literal("person", ["patrick"]))
@@ -45,6 +53,67 @@ class LiteralTest(unittest.TestCase):
         self.assertFalse(literal.Literal("person", ["patrick"]) == literal.Literal("person"))
         self.assertFalse(literal.Literal("person", positive=False) == literal.Literal("person", positive=True))
     
+    def test_hash(self):
+        # CHECK: equal literals have equal hashes
+        self.assertEqual(hash(literal.Literal("person", ["patrick"])), hash(literal.Literal("person", ("patrick",))))
+        self.assertEqual(
+                {literal.Literal("person", ["patrick"]), literal.Literal("person", ["patrick"], positive=False)},
+                {literal.Literal("person", ["patrick"], positive=False), literal.Literal("person", ["patrick"])}
+        )
+        
+        # CHECK: equality is structural, and does not depend on the string representation
+        self.assertFalse(literal.Literal("pred", ["a,b"]) == literal.Literal("pred", ["a", "b"]))
+    
+    def test_immutable(self):
+        lit = literal.Literal("person", ["patrick"])
+        
+        # CHECK: literals have no instance dictionaries and read-only properties
+        self.assertFalse(hasattr(lit, "__dict__"))
+        with self.assertRaises(AttributeError):
+            lit.predicate = "hero"
+        with self.assertRaises(AttributeError):
+            lit.some_attribute = "value"
+        
+        # CHECK: the attributes behind the properties cannot be changed or deleted either
+        with self.assertRaises(AttributeError):
+            lit._predicate = "hero"
+        with self.assertRaises(AttributeError):
+            lit._hash = 0
+        with self.assertRaises(AttributeError):
+            del lit._terms
+        self.assertEqual(literal.Literal("person", ["patrick"]), lit)
+        self.assertEqual(hash(literal.Literal("person", ["patrick"])), hash(lit))
+    
+    def test_interning(self):
+        # CHECK: symbols are interned
+        lit_1 = literal.Literal("".join(["per", "son"]), ["".join(["pat", "rick"])])
+        lit_2 = literal.Literal("".join(["pers", "on"]), ["".join(["patr", "ick"])])
+        self.assertIs(lit_1.predicate, lit_2.predicate)
+        self.assertIs(lit_1.terms[0], lit_2.terms[0])
+    
+    def test_pickle(self):
+        # CHECK: pickled literals are restored correctly
+        lit = literal.Literal("pred", ["a", "b"], positive=False)
+        restored = pickle.loads(pickle.dumps(lit))
+        self.assertEqual(lit, restored)
+        self.assertEqual(hash(lit), hash(restored))
+        self.assertFalse(restored.positive)
+        
+        # CHECK: the marker that a literal has been checked by a solver is not pickled
+        lit._mark_validated(object())
+        self.assertIsNone(pickle.loads(pickle.dumps(lit))._validated)
+    
+    def test_sanitize_literals(self):
+        # CHECK: any element that is not a literal causes a TypeError
+        with self.assertRaises(TypeError):
+            literal.sanitize_literals("facts", [literal.Literal("pred"), "pred"])
+        with self.assertRaises(TypeError):
+            literal.sanitize_literals("facts", [None])
+        
+        # CHECK: collections of literals pass
+        literal.sanitize_literals("facts", [])
+        literal.sanitize_literals("facts", {literal.Literal("pred"), literal.Literal("pred", ["a"])})
+    
     def test_init(self):
         # CHECK: the predicate symbol must not be the empty string
         with self.assertRaises(ValueError):
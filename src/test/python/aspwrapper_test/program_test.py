@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+
+
+import os
+import tempfile
+import unittest
+
+from aspwrapper import base_solver
+from aspwrapper import program
+
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2018 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2018.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class ProgramTest(unittest.TestCase):
+    
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix=".asp")
+        with os.fdopen(fd, "w") as f:
+            f.write("person(X) :- hero(X) .\n")
+    
+    def tearDown(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+    
+    def _modify(self, content: str):
+        """Overwrites the program file, and makes sure that its modification time changes."""
+        stat = os.stat(self.path)
+        with open(self.path, "w") as f:
+            f.write(content)
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+    
+    def test_init(self):
+        # CHECK: providing a non-existing path causes a ValueError
+        with self.assertRaises(ValueError):
+            program.Program("/not/a/valid/path")
+        with self.assertRaises(ValueError):
+            program.Program(None)
+        
+        # CHECK: attributes are defined correctly
+        prog = program.Program(self.path)
+        self.assertEqual(self.path, prog.path)
+        self.assertEqual(b"person(X) :- hero(X) .\n", prog.data)
+    
+    def test_create(self):
+        prog = program.Program(self.path)
+        
+        # CHECK: a program created from loaded contents is equivalent to the original one, without accessing the file
+        self._modify("hero(X) :- person(X) .\n")
+        created = program.Program._create(prog.path, prog.data, prog.fingerprint)
+        self.assertEqual(prog.path, created.path)
+        self.assertEqual(prog.data, created.data)
+        self.assertEqual(prog.fingerprint, created.fingerprint)
+        self.assertTrue(created.is_stale())
+    
+    def test_fingerprint(self):
+        # CHECK: the fingerprint depends on the contents of the program only
+        prog = program.Program(self.path)
+        self.assertEqual(prog.fingerprint, program.Program(self.path).fingerprint)
+        self._modify("hero(X) :- person(X) .\n")
+        self.assertNotEqual(prog.fingerprint, program.Program(self.path).fingerprint)
+    
+    def test_is_stale(self):
+        prog = program.Program(self.path)
+        
+        # CHECK: a program is not stale as long as the file is not changed
+        self.assertFalse(prog.is_stale())
+        
+        # CHECK: changing the file makes a program stale
+        self._modify("hero(X) :- person(X) .\n")
+        self.assertTrue(prog.is_stale())
+        
+        # CHECK: removing the file makes a program stale
+        prog = program.Program(self.path)
+        os.remove(self.path)
+        self.assertTrue(prog.is_stale())
+    
+    def test_load_program(self):
+        solver = _DummySolver()
+        
+        # CHECK: programs are reloaded if and only if the according file has been changed
+        prog = solver.load_program(self.path)
+        self.assertIs(prog, solver.load_program(self.path))
+        self._modify("hero(X) :- person(X) .\n")
+        new_prog = solver.load_program(self.path)
+        self.assertIsNot(prog, new_prog)
+        self.assertEqual(b"hero(X) :- person(X) .\n", new_prog.data)
+
+
+class _DummySolver(base_solver.BaseSolver):
+    """A solver that does not run any programs, which is used to test the program cache of ``BaseSolver``."""
+    
+    def run(self, path, facts):
+        raise NotImplementedError()
+    
+    def run_many(self, path, fact_sets, max_workers=None):
+        raise NotImplementedError()
+    
+    def run_many_unordered(self, path, fact_sets, max_workers=None):
+        raise NotImplementedError()
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+
+
+import os
+import tempfile
+import time
+import unittest
+
+from aspwrapper import answer_set
+from aspwrapper import literal
+from aspwrapper import program
+from aspwrapper import result_cache
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2018 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2018.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class ResultCacheTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.programs = []
+        for content in ["person(X) :- hero(X) .\n", "hero(X) :- person(X) .\n"]:
+            fd, path = tempfile.mkstemp(suffix=".asp")
+            with os.fdopen(fd, "w") as f:
+                f.write(content)
+            self.programs.append(program.Program(path))
+        self.facts = frozenset([literal.Literal("hero", ["patrick"])])
+        self.answer_sets = [answer_set.AnswerSet(self.facts, [literal.Literal("person", ["patrick"])])]
+    
+    def tearDown(self):
+        for p in self.programs:
+            os.remove(p.path)
+    
+    def test_get_and_put(self):
+        cache = result_cache.ResultCache()
+        
+        # CHECK: looking up results that have not been added is a miss
+        self.assertIsNone(cache.get(self.programs[0], self.facts))
+        self.assertEqual(0, cache.hits)
+        self.assertEqual(1, cache.misses)
+        
+        # CHECK: added results are found for the same program and facts only
+        cache.put(self.programs[0], self.facts, self.answer_sets)
+        self.assertEqual(self.answer_sets, cache.get(self.programs[0], self.facts))
+        self.assertEqual(self.answer_sets, cache.get(self.programs[0], frozenset(self.facts)))
+        self.assertIsNone(cache.get(self.programs[1], self.facts))
+        self.assertIsNone(cache.get(self.programs[0], frozenset()))
+        self.assertIsNone(cache.get(self.programs[0], self.facts, options=("-n=1",)))
+        self.assertEqual(2, cache.hits)
+        self.assertEqual(4, cache.misses)
+        
+        # CHECK: every lookup provides a new list
+        result = cache.get(self.programs[0], self.facts)
+        result.clear()
+        self.assertEqual(self.answer_sets, cache.get(self.programs[0], self.facts))
+        
+        # CHECK: clearing the cache removes all results and resets the counters
+        cache.clear()
+        self.assertEqual(0, len(cache))
+        self.assertEqual(0, cache.hits)
+        self.assertEqual(0, cache.misses)
+    
+    def test_init(self):
+        # CHECK: illegal args cause a TypeError or ValueError, respectively
+        with self.assertRaises(TypeError):
+            result_cache.ResultCache(max_size=1.5)
+        with self.assertRaises(ValueError):
+            result_cache.ResultCache(max_size=0)
+        with self.assertRaises(TypeError):
+            result_cache.ResultCache(ttl="1")
+        with self.assertRaises(ValueError):
+            result_cache.ResultCache(ttl=0)
+        
+        # CHECK: attributes are defined correctly
+        cache = result_cache.ResultCache(max_size=10, ttl=2.5)
+        self.assertEqual(10, cache.max_size)
+        self.assertEqual(2.5, cache.ttl)
+    
+    def test_invalidate(self):
+        cache = result_cache.ResultCache()
+        for p in self.programs:
+            cache.put(p, self.facts, self.answer_sets)
+        
+        # CHECK: invalidating a program removes its results only
+        cache.invalidate(self.programs[0])
+        self.assertIsNone(cache.get(self.programs[0], self.facts))
+        self.assertIsNotNone(cache.get(self.programs[1], self.facts))
+        
+        # CHECK: invalidating without a program removes all results
+        cache.invalidate()
+        self.assertEqual(0, len(cache))
+    
+    def test_lru_eviction(self):
+        cache = result_cache.ResultCache(max_size=2)
+        facts = [frozenset([literal.Literal("hero", [name])]) for name in ["a", "b", "c"]]
+        
+        # CHECK: the least recently used result is evicted if the cache is full
+        cache.put(self.programs[0], facts[0], [])
+        cache.put(self.programs[0], facts[1], [])
+        cache.get(self.programs[0], facts[0])
+        cache.put(self.programs[0], facts[2], [])
+        self.assertEqual(2, len(cache))
+        self.assertIsNotNone(cache.get(self.programs[0], facts[0]))
+        self.assertIsNone(cache.get(self.programs[0], facts[1]))
+        self.assertIsNotNone(cache.get(self.programs[0], facts[2]))
+    
+    def test_ttl(self):
+        cache = result_cache.ResultCache(ttl=0.05)
+        
+        # CHECK: results expire after the time to live
+        cache.put(self.programs[0], self.facts, self.answer_sets)
+        self.assertIsNotNone(cache.get(self.programs[0], self.facts))
+        time.sleep(0.1)
+        self.assertIsNone(cache.get(self.programs[0], self.facts))
+        self.assertEqual(0, len(cache))
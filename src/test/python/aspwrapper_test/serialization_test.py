@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+
+
+import mmap
+import tempfile
+import unittest
+
+from aspwrapper import answer_set
+from aspwrapper import literal
+from aspwrapper import serialization
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2018 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2018.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class SerializationTest(unittest.TestCase):
+    
+    def setUp(self):
+        facts = [literal.Literal("person", ["patrick"]), literal.Literal("locatedIn", ["vienna", "austria"])]
+        self.answer_sets = [
+                answer_set.AnswerSet(facts, [literal.Literal("hero", ["patrick"])]),
+                answer_set.AnswerSet(facts, [literal.Literal("hero", ["patrick"], positive=False)]),
+                answer_set.AnswerSet([], [literal.Literal("raining")]),
+                answer_set.AnswerSet([], [])
+        ]
+    
+    def test_dumps_and_loads(self):
+        # CHECK: encoding and decoding answer sets reproduces the original ones
+        self.assertEqual(self.answer_sets, serialization.loads(serialization.dumps(self.answer_sets)))
+        self.assertEqual([], serialization.loads(serialization.dumps([])))
+        
+        # CHECK: decoding works for all kinds of bytes-like objects
+        data = serialization.dumps(self.answer_sets)
+        self.assertEqual(self.answer_sets, serialization.loads(bytearray(data)))
+        self.assertEqual(self.answer_sets, serialization.loads(memoryview(data)))
+        
+        # CHECK: non-ASCII symbols are supported
+        lit = literal.Literal("city", ["wien_österreich"])
+        answer_sets = [answer_set.AnswerSet([lit], [])]
+        self.assertEqual(answer_sets, serialization.loads(serialization.dumps(answer_sets)))
+    
+    def test_loads_from_mmap(self):
+        data = serialization.dumps(self.answer_sets)
+        
+        # CHECK: data can be decoded directly from a memory-mapped file
+        with tempfile.TemporaryFile() as f:
+            f.write(data)
+            f.flush()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                self.assertEqual(self.answer_sets, serialization.loads(m))
+                self.assertEqual(self.answer_sets, serialization.loads(memoryview(m)[:len(data)]))
+    
+    def test_dumps_deduplicates_literals(self):
+        def create_answer_sets():
+            return [
+                    answer_set.AnswerSet([], [literal.Literal("hero", ["patrick"]), literal.Literal("m", [str(i)])])
+                    for i in range(10)
+            ]
+        
+        # CHECK: literals that are equal but not identical are encoded only once
+        shared = create_answer_sets()
+        hero = literal.Literal("hero", ["patrick"])
+        for a in shared:
+            self.assertIsNot(hero, next(i for i in a.inferences if i.predicate == "hero"))
+        identical = [answer_set.AnswerSet([], [hero, literal.Literal("m", [str(i)])]) for i in range(10)]
+        self.assertEqual(len(serialization.dumps(identical)), len(serialization.dumps(shared)))
+        self.assertEqual(shared, serialization.loads(serialization.dumps(shared)))
+    
+    def test_dumps_shares_facts(self):
+        # CHECK: facts shared between answer sets are encoded only once
+        facts = [literal.Literal("person", ["p{}".format(i)]) for i in range(100)]
+        one = serialization.dumps([answer_set.AnswerSet(facts, [])])
+        many = serialization.dumps([answer_set.AnswerSet(facts, [literal.Literal("m", [str(i)])]) for i in range(10)])
+        self.assertLess(len(many), 2 * len(one))
+    
+    def test_loads_illegal_data(self):
+        data = serialization.dumps(self.answer_sets)
+        
+        # CHECK: truncated data, trailing bytes, and unknown versions cause a ValueError
+        with self.assertRaises(ValueError):
+            serialization.loads(data[:-1])
+        with self.assertRaises(ValueError):
+            serialization.loads(data + b"\x00")
+        with self.assertRaises(ValueError):
+            serialization.loads(b"\x7f" + data[1:])
+        with self.assertRaises(ValueError):
+            serialization.loads(b"")
+        
+        # CHECK: data encoded by means of the superseded version 1 of the encoding is rejected explicitly
+        with self.assertRaisesRegex(ValueError, "Version 1"):
+            serialization.loads(
+                    b"\x01\x04\x06person\x07patrick\x04hero\x07raining\x03\x00\x01\x01\x05\x01\x01\x06\x00\x02\x01"
+                    b"\x00\x00\x02\x00\x01\x01\x01\x01\x02"
+            )
+        
+        # CHECK: arrays of illegal widths and references to undefined symbols cause a ValueError
+        with self.assertRaises(ValueError):
+            serialization.loads(bytes([serialization.FORMAT_VERSION, 3, 0]))
+        with self.assertRaises(ValueError):
+            serialization.loads(bytes([serialization.FORMAT_VERSION, 1, 0, 1, 1, 4, 1, 1, 0, 1, 0, 0, 1, 0, 1, 0]))
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+
+import pickle
+import unittest
+
+from aspwrapper import answer_set
+from aspwrapper import literal
+from aspwrapper import solver_result
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2018 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2018.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class SolverResultTest(unittest.TestCase):
+    
+    def test_from_bytes_and_to_bytes(self):
+        facts = [literal.Literal("fact-1")]
+        answer_sets = [
+                answer_set.AnswerSet(facts, [literal.Literal("fact-2")]),
+                answer_set.AnswerSet(facts, [literal.Literal("fact-3", ["a"], positive=False)])
+        ]
+        result = solver_result.SolverResult(answer_sets, solver_result.ResourceUsage(1.5, 0.5, 1024))
+        
+        # CHECK: encoding and decoding a result reproduces its answer sets, but not its resource usage
+        restored = solver_result.SolverResult.from_bytes(result.to_bytes())
+        self.assertIsInstance(restored, solver_result.SolverResult)
+        self.assertEqual(answer_sets, restored)
+        self.assertIsNone(restored.usage)
+        self.assertIs(restored[0].facts, restored[1].facts)
+        self.assertEqual([], solver_result.SolverResult.from_bytes(solver_result.SolverResult().to_bytes()))
+    
+    def test_init(self):
+        answer_sets = [answer_set.AnswerSet([literal.Literal("fact-1")], [literal.Literal("fact-2")])]
+        usage = solver_result.ResourceUsage(1.5, 0.5, 1024)
+        
+        # CHECK: a result is a list of answer sets with an (optional) resource usage
+        result = solver_result.SolverResult(answer_sets, usage)
+        self.assertEqual(answer_sets, result)
+        self.assertIs(usage, result.usage)
+        self.assertIsNone(solver_result.SolverResult(answer_sets).usage)
+        self.assertEqual([], solver_result.SolverResult())
+        
+        # CHECK: the resource usage is stored correctly
+        self.assertEqual(1.5, usage.wall_time)
+        self.assertEqual(0.5, usage.cpu_time)
+        self.assertEqual(1024, usage.max_rss)
+    
+    def test_pickle(self):
+        answer_sets = [answer_set.AnswerSet([literal.Literal("fact-1")], [literal.Literal("fact-2")])]
+        result = solver_result.SolverResult(answer_sets, solver_result.ResourceUsage(1.5, 0.5, 1024))
+        
+        # CHECK: both the answer sets and the resource usage are restored correctly
+        restored = pickle.loads(pickle.dumps(result))
+        self.assertIsInstance(restored, solver_result.SolverResult)
+        self.assertEqual(answer_sets, restored)
+        self.assertEqual(1.5, restored.usage.wall_time)
+        self.assertEqual(0.5, restored.usage.cpu_time)
+        self.assertEqual(1024, restored.usage.max_rss)
+        
+        # CHECK: results without resource usage can be pickled as well
+        restored = pickle.loads(pickle.dumps(solver_result.SolverResult(answer_sets)))
+        self.assertEqual(answer_sets, restored)
+        self.assertIsNone(restored.usage)
+
+
+if __name__ == "__main__":
+    unittest.main()
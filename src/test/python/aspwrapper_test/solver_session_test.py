@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+
+
+import unittest
+
+import aspwrapper_test
+
+from aspwrapper import answer_set
+from aspwrapper import dlv_solver
+from aspwrapper import literal
+from aspwrapper import result_cache
+from aspwrapper import solver_session
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2018 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2018.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+class SolverSessionTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.solver = dlv_solver.DlvSolver(aspwrapper_test.DLV_PATH, result_cache=result_cache.ResultCache())
+        self.session = self.solver.session(aspwrapper_test.ONTOLOGY)
+    
+    def tearDown(self):
+        self.session.close()
+    
+    def test_add_and_retract_facts(self):
+        person = literal.Literal("person", ["patrick"])
+        hero = literal.Literal("hero", ["patrick"])
+        
+        # CHECK: a session starts with the provided facts
+        self.assertIsInstance(self.session, solver_session.SolverSession)
+        self.assertEqual(frozenset(), self.session.facts)
+        self.assertEqual(frozenset([person]), self.solver.session(aspwrapper_test.ONTOLOGY, [person]).facts)
+        
+        # CHECK: facts are added and retracted as expected, and unknown facts are ignored when retracted
+        self.session.add_facts([person])
+        self.session.add_facts([person, hero])
+        self.assertEqual(frozenset([person, hero]), self.session.facts)
+        self.session.retract_facts([hero, literal.Literal("person", ["jane"])])
+        self.assertEqual(frozenset([person]), self.session.facts)
+        
+        # CHECK: invalid facts cause a TypeError, and do not change the current facts
+        with self.assertRaises(TypeError):
+            self.session.add_facts(None)
+        with self.assertRaises(TypeError):
+            self.session.add_facts([hero, "person(jane)"])
+        with self.assertRaises(TypeError):
+            self.session.retract_facts([person, 0])
+        self.assertEqual(frozenset([person]), self.session.facts)
+    
+    def test_solve(self):
+        person = literal.Literal("person", ["patrick"])
+        hero = literal.Literal("hero", ["patrick"])
+        
+        # CHECK: the answer sets are computed for the current facts
+        self.session.add_facts([person])
+        self.assertEqual(2, len(self.session.solve()))
+        self.assertEqual(1, len(self.session.solve(max_models=1)))
+        self.session.add_facts([hero])
+        self.assertEqual([answer_set.AnswerSet([person, hero], [])], self.session.solve())
+        self.session.retract_facts([person])
+        self.assertEqual([answer_set.AnswerSet([hero], [person])], self.session.solve())
+        
+        # CHECK: returning to a previous set of facts is served from the solver's result cache
+        hits = self.solver.result_cache.hits
+        self.session.add_facts([person])
+        self.session.solve()
+        self.assertEqual(hits + 1, self.solver.result_cache.hits)
+        
+        # CHECK: solver-specific args are passed on to the solver
+        self.assertEqual(
+                [answer_set.AnswerSet([], [])],
+                self.session.solve(output_predicates=["other"], include_facts=False)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+
+
+import multiprocessing
+import os
+import shutil
+import sqlite3
+import tempfile
+import time
+import unittest
+
+from aspwrapper import answer_set
+from aspwrapper import literal
+from aspwrapper import program
+from aspwrapper import sqlite_result_cache
+
+
+__author__ = "Patrick Hohenecker"
+__copyright__ = (
+        "Copyright (c) 2018 Patrick Hohenecker\n"
+        "\n"
+        "Permission is hereby granted, free of charge, to any person obtaining a copy\n"
+        "of this software and associated documentation files (the \"Software\"), to deal\n"
+        "in the Software without restriction, including without limitation the rights\n"
+        "to use, copy, modify, merge, publish, distribute, sublicense, and/or sell\n"
+        "copies of the Software, and to permit persons to whom the Software is\n"
+        "furnished to do so, subject to the following conditions:\n"
+        "\n"
+        "The above copyright notice and this permission notice shall be included in all\n"
+        "copies or substantial portions of the Software.\n"
+        "\n"
+        "THE SOFTWARE IS PROVIDED \"AS IS\", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR\n"
+        "IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,\n"
+        "FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE\n"
+        "AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER\n"
+        "LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,\n"
+        "OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE\n"
+        "SOFTWARE."
+)
+__license__ = "MIT License"
+__version__ = "2018.1"
+__date__ = "Oct 18, 2026"
+__maintainer__ = "Patrick Hohenecker"
+__email__ = "mail@paho.at"
+__status__ = "Development"
+
+
+def _put_results(db_path: str, prog_path: str, offset: int) -> None:
+    """Adds a number of results to a cache, which is used for testing access by multiple processes."""
+    cache = sqlite_result_cache.SqliteResultCache(db_path)
+    prog = program.Program(prog_path)
+    for i in range(offset, offset + 20):
+        facts = frozenset([literal.Literal("hero", ["h{}".format(i)])])
+        cache.put(prog, facts, [answer_set.AnswerSet(facts, [literal.Literal("person", ["h{}".format(i)])])])
+    cache.close()
+
+
+class SqliteResultCacheTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.dir, "cache.db")
+        self.programs = []
+        for idx, content in enumerate(["person(X) :- hero(X) .\n", "hero(X) :- person(X) .\n"]):
+            path = os.path.join(self.dir, "program-{}.asp".format(idx))
+            with open(path, "w") as f:
+                f.write(content)
+            self.programs.append(program.Program(path))
+        self.facts = frozenset([literal.Literal("hero", ["patrick"])])
+        self.answer_sets = [answer_set.AnswerSet(self.facts, [literal.Literal("person", ["patrick"])])]
+    
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+    
+    def test_access_recording(self):
+        cache = sqlite_result_cache.SqliteResultCache(self.db_path)
+        cache.put(self.programs[0], self.facts, self.answer_sets)
+        
+        def get_accessed():
+            with sqlite3.connect(self.db_path) as conn:
+                return conn.execute("SELECT accessed FROM results").fetchone()[0]
+        
+        # CHECK: hits shortly after the recorded access are not written to the database
+        accessed = get_accessed()
+        self.assertEqual(self.answer_sets, cache.get(self.programs[0], self.facts))
+        self.assertEqual(accessed, get_accessed())
+        
+        # CHECK: hits are recorded if the recorded access is older than the resolution
+        cache = sqlite_result_cache.SqliteResultCache(self.db_path, access_resolution=0)
+        cache.get(self.programs[0], self.facts)
+        self.assertGreater(get_accessed(), accessed)
+        
+        # CHECK: hits do not wait for other writers, and skip recording the access instead
+        accessed = get_accessed()
+        conn = sqlite3.connect(self.db_path, isolation_level=None)
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            start = time.monotonic()
+            self.assertEqual(self.answer_sets, cache.get(self.programs[0], self.facts))
+            self.assertLess(time.monotonic() - start, 5)
+        finally:
+            conn.execute("ROLLBACK")
+            conn.close()
+        self.assertEqual(accessed, get_accessed())
+    
+    def test_concurrent_processes(self):
+        # CHECK: multiple processes can write to the same cache at the same time
+        procs = [
+                multiprocessing.Process(target=_put_results, args=(self.db_path, self.programs[0].path, 20 * i))
+                for i in range(4)
+        ]
+        for p in procs:
+            p.start()
+        for p in procs:
+            p.join()
+            self.assertEqual(0, p.exitcode)
+        
+        cache = sqlite_result_cache.SqliteResultCache(self.db_path)
+        self.assertEqual(80, len(cache))
+        with sqlite3.connect(self.db_path) as conn:
+            self.assertEqual(conn.execute("SELECT SUM(size) FROM results").fetchone()[0], cache.size)
+        facts = frozenset([literal.Literal("hero", ["h42"])])
+        self.assertEqual(
+                [answer_set.AnswerSet(facts, [literal.Literal("person", ["h42"])])],
+                cache.get(self.programs[0], facts)
+        )
+    
+    def test_get_and_put(self):
+        cache = sqlite_result_cache.SqliteResultCache(self.db_path)
+        
+        # CHECK: looking up results that have not been added is a miss
+        self.assertIsNone(cache.get(self.programs[0], self.facts))
+        self.assertEqual(1, cache.misses)
+        
+        # CHECK: added results are found for the same program and facts only
+        cache.put(self.programs[0], self.facts, self.answer_sets)
+        self.assertEqual(self.answer_sets, cache.get(self.programs[0], self.facts))
+        self.assertIsNone(cache.get(self.programs[1], self.facts))
+        self.assertIsNone(cache.get(self.programs[0], frozenset()))
+        self.assertIsNone(cache.get(self.programs[0], self.facts, options=("-n=1",)))
+        self.assertEqual(1, cache.hits)
+        self.assertEqual(4, cache.misses)
+        
+        # CHECK: results persist across instances
+        cache.close()
+        cache = sqlite_result_cache.SqliteResultCache(self.db_path)
+        self.assertEqual(self.answer_sets, cache.get(self.programs[0], self.facts))
+        
+        # CHECK: clearing the cache removes all results
+        cache.clear()
+        self.assertEqual(0, len(cache))
+        self.assertEqual(0, cache.size)
+    
+    def test_get_corrupt_result(self):
+        cache = sqlite_result_cache.SqliteResultCache(self.db_path)
+        cache.put(self.programs[0], self.facts, self.answer_sets)
+        cache.put(self.programs[1], self.facts, self.answer_sets)
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("UPDATE results SET data = ? WHERE program = ?", (b"\x7f", self.programs[0].fingerprint))
+        
+        # CHECK: results that cannot be decoded are misses, and are removed from the cache
+        self.assertIsNone(cache.get(self.programs[0], self.facts))
+        self.assertEqual(1, cache.misses)
+        self.assertEqual(1, len(cache))
+        with sqlite3.connect(self.db_path) as conn:
+            self.assertEqual(conn.execute("SELECT SUM(size) FROM results").fetchone()[0], cache.size)
+        
+        # CHECK: the result can be stored anew
+        cache.put(self.programs[0], self.facts, self.answer_sets)
+        self.assertEqual(self.answer_sets, cache.get(self.programs[0], self.facts))
+    
+    def test_init(self):
+        # CHECK: illegal args cause a TypeError or ValueError, respectively
+        with self.assertRaises(TypeError):
+            sqlite_result_cache.SqliteResultCache(self.db_path, max_size=1.5)
+        with self.assertRaises(ValueError):
+            sqlite_result_cache.SqliteResultCache(self.db_path, max_size=0)
+        with self.assertRaises(ValueError):
+            sqlite_result_cache.SqliteResultCache(self.db_path, timeout=0)
+        with self.assertRaises(ValueError):
+            sqlite_result_cache.SqliteResultCache(self.db_path, access_resolution=-1)
+        
+        # CHECK: attributes are defined correctly
+        cache = sqlite_result_cache.SqliteResultCache(self.db_path, max_size=1000)
+        self.assertEqual(self.db_path, cache.path)
+        self.assertEqual(1000, cache.max_size)
+        self.assertEqual(60, cache.access_resolution)
+    
+    def test_invalidate(self):
+        cache = sqlite_result_cache.SqliteResultCache(self.db_path)
+        for p in self.programs:
+            cache.put(p, self.facts, self.answer_sets)
+        
+        # CHECK: invalidating a program removes its results only
+        cache.invalidate(self.programs[0])
+        self.assertIsNone(cache.get(self.programs[0], self.facts))
+        self.assertIsNotNone(cache.get(self.programs[1], self.facts))
+        
+        # CHECK: invalidating without a program removes all results
+        cache.invalidate()
+        self.assertEqual(0, len(cache))
+        self.assertEqual(0, cache.size)
+    
+    def test_size(self):
+        cache = sqlite_result_cache.SqliteResultCache(self.db_path)
+        
+        # CHECK: the total size accounts for added, replaced, and invalidated results
+        self.assertEqual(0, cache.size)
+        cache.put(self.programs[0], self.facts, self.answer_sets)
+        entry_size = cache.size
+        self.assertGreater(entry_size, 0)
+        cache.put(self.programs[0], self.facts, [])
+        small_size = cache.size
+        self.assertLess(small_size, entry_size)
+        cache.put(self.programs[1], self.facts, self.answer_sets)
+        self.assertEqual(small_size + entry_size, cache.size)
+        cache.invalidate(self.programs[0])
+        self.assertEqual(entry_size, cache.size)
+        
+        # CHECK: the total size is initialized for databases that contain results already
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("DROP TABLE metadata")
+        self.assertEqual(entry_size, sqlite_result_cache.SqliteResultCache(self.db_path).size)
+    
+    def test_size_eviction(self):
+        facts = [frozenset([literal.Literal("hero", ["h{}".format(i)])]) for i in range(3)]
+        results = [[answer_set.AnswerSet(f, [])] for f in facts]
+        cache = sqlite_result_cache.SqliteResultCache(self.db_path)
+        cache.put(self.programs[0], facts[0], results[0])
+        entry_size = cache.size
+        cache.clear()
+        
+        # CHECK: the least recently accessed results are evicted if the maximum size is exceeded
+        cache = sqlite_result_cache.SqliteResultCache(self.db_path, max_size=2 * entry_size, access_resolution=0)
+        cache.put(self.programs[0], facts[0], results[0])
+        cache.put(self.programs[0], facts[1], results[1])
+        cache.get(self.programs[0], facts[0])
+        cache.put(self.programs[0], facts[2], results[2])
+        self.assertEqual(2, len(cache))
+        self.assertLessEqual(cache.size, cache.max_size)
+        self.assertIsNotNone(cache.get(self.programs[0], facts[0]))
+        self.assertIsNone(cache.get(self.programs[0], facts[1]))
+        self.assertIsNotNone(cache.get(self.programs[0], facts[2]))